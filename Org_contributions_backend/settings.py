@@ -179,11 +179,66 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Stateless authorization: take role, department and pod from the access token claims
+# instead of loading the employee on every request. Tokens of employees whose role,
+# department or pod changed are rejected through markers kept in CACHES[CACHE_ALIAS]
+# for one access token lifetime; use a cache shared by all processes (e.g. Redis).
+STATELESS_AUTHZ = {
+    'ENABLED': config('STATELESS_AUTHZ_ENABLED', default=False, cast=bool),
+    'CACHE_ALIAS': config('STATELESS_AUTHZ_CACHE_ALIAS', default='default'),
+}
+
 # CORS settings - Allow all requests for now (temporary for testing)
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
 
+# Dashboard metrics cache
+# BACKEND: 'locmem' (per-process LRU), 'django' (uses CACHES[CACHE_ALIAS]) or a dotted class path
+METRICS_CACHE = {
+    'ENABLED': config('METRICS_CACHE_ENABLED', default=True, cast=bool),
+    'BACKEND': config('METRICS_CACHE_BACKEND', default='locmem'),
+    'CACHE_ALIAS': config('METRICS_CACHE_ALIAS', default='default'),
+    'MAX_ENTRIES': config('METRICS_CACHE_MAX_ENTRIES', default=512, cast=int),
+    'TIMEOUT': config('METRICS_CACHE_TIMEOUT', default=3600, cast=int),
+}
+
+# Products, departments and pods are cached in each process and reloaded when the
+# dimension version kept in CACHES[DIMENSION_CACHE_ALIAS] changes; use a cache shared
+# by all processes (e.g. Redis) so a change made in one process reaches the others.
+# Cached tables are also reloaded once they are DIMENSION_CACHE_TIMEOUT seconds old,
+# which bounds how stale they get when the cache is not shared.
+DIMENSION_CACHE_ALIAS = config('DIMENSION_CACHE_ALIAS', default='default')
+DIMENSION_CACHE_TIMEOUT = config('DIMENSION_CACHE_TIMEOUT', default=60, cast=int)
+
+# Largest page of /api/contributions/ (the default page size is REST_FRAMEWORK['PAGE_SIZE'])
+CONTRIBUTION_LIST_MAX_LIMIT = config('CONTRIBUTION_LIST_MAX_LIMIT', default=1000, cast=int)
+
+# Background upload processing
+# Number of worker threads processing queued uploads (0 runs them inline after commit)
+UPLOAD_WORKERS = config('UPLOAD_WORKERS', default=2, cast=int)
+
+# Pods processed concurrently by an org-wide allocation run (always serial on SQLite)
+ALLOCATION_PROCESSING_WORKERS = config('ALLOCATION_PROCESSING_WORKERS', default=4, cast=int)
+
+# Parallel workbook parsing
+# Worker processes reading sheets of one workbook (0 = one per CPU up to 4, 1 = serial)
+SHEET_PARSE_WORKERS = config('SHEET_PARSE_WORKERS', default=0, cast=int)
+# Workbooks smaller than this are always parsed serially
+SHEET_PARSE_PARALLEL_MIN_BYTES = config('SHEET_PARSE_PARALLEL_MIN_BYTES', default=1024 * 1024, cast=int)
+
+# Streaming ingestion of large XLSX uploads
+# Uploads at least this large are read and written in chunks instead of all at once
+STREAMING_UPLOAD_MIN_BYTES = config('STREAMING_UPLOAD_MIN_BYTES', default=10 * 1024 * 1024, cast=int)
+# Rows validated and written per chunk
+STREAMING_UPLOAD_CHUNK_ROWS = config('STREAMING_UPLOAD_CHUNK_ROWS', default=5000, cast=int)
+
+# Cache validated parse results next to upload blobs (reused by reparses of the same content)
+PARSE_CACHE_ENABLED = config('PARSE_CACHE_ENABLED', default=True, cast=bool)
+
+# Writer for generated XLSX files: 'auto' (xlsxwriter if installed, else openpyxl write-only), 'openpyxl' or 'xlsxwriter'
+XLSX_EXPORT_BACKEND = config('XLSX_EXPORT_BACKEND', default='auto')
+
 # Logging configuration
 LOGGING = {
     'version': 1,
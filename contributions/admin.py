@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import RawFile, ContributionRecord, PodLeadAllocation
+from .models import RawFile, ContributionRecord, PodLeadAllocation, ContributionMonthlyRollup
 
 
 @admin.register(RawFile)
@@ -25,3 +25,12 @@ class PodLeadAllocationAdmin(admin.ModelAdmin):
     search_fields = ['employee__employee_code', 'employee__name', 'pod_lead__employee_code', 'pod_lead__name', 'product']
     date_hierarchy = 'contribution_month'
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(ContributionMonthlyRollup)
+class ContributionMonthlyRollupAdmin(admin.ModelAdmin):
+    list_display = ['employee', 'product', 'contribution_month', 'hours', 'record_count', 'department', 'pod']
+    list_filter = ['contribution_month', 'product', 'department', 'pod']
+    search_fields = ['employee__employee_code', 'employee__name', 'product__name']
+    date_hierarchy = 'contribution_month'
+    readonly_fields = ['updated_at']
@@ -15,16 +15,8 @@ class ProcessPodAllocationsInteractor:
     
     def execute(self) -> dict:
         """Execute the processing."""
-        # Validate month format
-        try:
-            month_date = datetime.strptime(self.month, '%Y-%m').date()
-            month_date = date(month_date.year, month_date.month, 1)
-        except ValueError:
-            raise ValidationException(f"Invalid month format: {self.month}. Expected YYYY-MM")
-        
-        # Validate output format
-        if self.output_format not in ['records', 'csv']:
-            raise ValidationException(f"Invalid output_format: {self.output_format}. Must be 'records' or 'csv'")
+        month_date = _parse_month(self.month)
+        _validate_output_format(self.output_format)
         
         # Process allocations
         result = allocation_processing_service.process_all_pod_allocations(
@@ -35,3 +27,38 @@ class ProcessPodAllocationsInteractor:
         
         return result
 
+
+
+class ProcessMonthAllocationsInteractor:
+    """Interactor for processing the allocations of every pod for a month."""
+    
+    def __init__(self, month: str, output_format: str = 'records', workers: int = None):
+        self.month = month
+        self.output_format = output_format
+        self.workers = workers
+    
+    def execute(self) -> dict:
+        """Execute the processing for all pods with submitted allocations."""
+        month_date = _parse_month(self.month)
+        _validate_output_format(self.output_format)
+        
+        return allocation_processing_service.process_month_allocations(
+            month_date,
+            self.output_format,
+            self.workers
+        )
+
+
+def _parse_month(month: str) -> date:
+    """Parse a YYYY-MM month to the first day of the month."""
+    try:
+        month_date = datetime.strptime(month, '%Y-%m').date()
+        return date(month_date.year, month_date.month, 1)
+    except ValueError:
+        raise ValidationException(f"Invalid month format: {month}. Expected YYYY-MM")
+
+
+def _validate_output_format(output_format: str) -> None:
+    """Validate the output format of a processing run."""
+    if output_format not in ['records', 'csv']:
+        raise ValidationException(f"Invalid output_format: {output_format}. Must be 'records' or 'csv'")
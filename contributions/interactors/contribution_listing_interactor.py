@@ -0,0 +1,157 @@
+"""Interactor for listing contribution records page by page or as a stream."""
+from datetime import datetime, date
+from typing import Iterator, Optional, Tuple
+from django.conf import settings
+from contributions.services import permission_service
+from contributions.services.permission_service import EmployeeRef
+from contributions.storages import contribution_storage
+from contributions.storages.storage_dto import ContributionRecordDTO
+from contributions.exceptions import ValidationException, PermissionDeniedException
+
+# Roles listing every record; other roles are limited to their department, pod or own records
+UNSCOPED_ROLES = ['CEO', 'ADMIN']
+SCOPE_FIELDS = {
+    'HOD': 'department_id',
+    'POD_LEAD': 'pod_id',
+}
+
+
+class ListContributionsInteractor:
+    """
+    Interactor listing contribution records with keyset pagination.
+    
+    Records are ordered by (contribution_month, id); a cursor is the
+    position of the last record returned ("YYYY-MM:<id>"), so every page
+    is one index range scan however deep the client has paged.
+    """
+    
+    def __init__(
+        self,
+        employee: EmployeeRef,
+        month: str = None,
+        department_id: str = None,
+        pod_id: str = None,
+        product_id: str = None,
+        employee_id: str = None,
+        cursor: str = None,
+        limit: str = None
+    ):
+        self.employee = employee
+        self.month = month
+        self.department_id = department_id
+        self.pod_id = pod_id
+        self.product_id = product_id
+        self.employee_id = employee_id
+        self.cursor = cursor
+        self.limit = limit
+    
+    def execute(self) -> dict:
+        """
+        Get one page of records.
+        
+        Returns:
+            Dict with the records ('results') and the cursor of the next
+            page ('next_cursor', None on the last page)
+        """
+        filters = self._get_filters()
+        limit = _parse_limit(
+            self.limit,
+            default=getattr(settings, 'REST_FRAMEWORK', {}).get('PAGE_SIZE', 100),
+            max_limit=getattr(settings, 'CONTRIBUTION_LIST_MAX_LIMIT', 1000)
+        )
+        
+        # One extra row tells whether another page follows
+        rows = list(contribution_storage.iter_contribution_rows(**filters, limit=limit + 1))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].contribution_month, rows[-1].id)
+        
+        return {
+            'results': rows,
+            'next_cursor': next_cursor,
+        }
+    
+    def stream(self) -> Iterator[ContributionRecordDTO]:
+        """
+        Get all records after the cursor (up to limit, if given) as they are read.
+        
+        Filters and permissions are checked before returning; the records
+        are only read while the iterator is consumed.
+        """
+        filters = self._get_filters()
+        limit = _parse_limit(self.limit)
+        return contribution_storage.iter_contribution_rows(**filters, limit=limit)
+    
+    def _get_filters(self) -> dict:
+        """Validate the filters and cursor and restrict them to what the employee may see."""
+        filters = {
+            'month': _parse_month(self.month) if self.month else None,
+            'department_id': _parse_id('department_id', self.department_id),
+            'pod_id': _parse_id('pod_id', self.pod_id),
+            'product_id': _parse_id('product_id', self.product_id),
+            'employee_id': _parse_id('employee_id', self.employee_id),
+        }
+        
+        employee = permission_service.get_employee(self.employee)
+        if employee.role not in UNSCOPED_ROLES:
+            field = SCOPE_FIELDS.get(employee.role, 'employee_id')
+            own_id = employee.id if field == 'employee_id' else getattr(employee, field)
+            if own_id is None or filters[field] not in (None, own_id):
+                raise PermissionDeniedException("Access denied to these contributions")
+            filters[field] = own_id
+        
+        filters['after'] = decode_cursor(self.cursor) if self.cursor else None
+        return filters
+
+
+def encode_cursor(contribution_month: date, record_id: int) -> str:
+    """Cursor pointing after a record ("YYYY-MM:<id>")."""
+    return f"{contribution_month.strftime('%Y-%m')}:{record_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """Parse a cursor to the (contribution_month, id) of the record it points after."""
+    month, _, record_id = cursor.partition(':')
+    try:
+        return _parse_month(month), int(record_id)
+    except (ValidationException, ValueError):
+        raise ValidationException(
+            f"Invalid cursor: {cursor}",
+            errors={'cursor': 'Expected the next_cursor of a previous page (YYYY-MM:<id>)'}
+        )
+
+
+def _parse_month(month: str) -> date:
+    """Parse a YYYY-MM month to the first day of the month."""
+    try:
+        month_date = datetime.strptime(month, '%Y-%m').date()
+        return date(month_date.year, month_date.month, 1)
+    except ValueError:
+        raise ValidationException(
+            f"Invalid month format: {month}. Expected YYYY-MM",
+            errors={'month': f"Invalid month format: {month}. Expected YYYY-MM"}
+        )
+
+
+def _parse_id(field: str, value: Optional[str]) -> Optional[int]:
+    """Parse an optional ID filter."""
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationException(f"Invalid {field}: {value}", errors={field: 'Must be an integer'})
+
+
+def _parse_limit(value: Optional[str], default: Optional[int] = None, max_limit: Optional[int] = None) -> Optional[int]:
+    """Parse an optional positive row limit, capped at max_limit if given."""
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        limit = 0
+    if limit < 1:
+        raise ValidationException(f"Invalid limit: {value}", errors={'limit': 'Must be a positive integer'})
+    return min(limit, max_limit) if max_limit else limit
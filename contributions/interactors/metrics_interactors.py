@@ -1,16 +1,17 @@
 """Metrics interactors for dashboard data."""
 from datetime import datetime, date
-from contributions.services import metrics_calculator_service, permission_service
+from contributions.services import metrics_calculator_service, metrics_cache_service, permission_service
 from contributions.storages.storage_dto import OrgMetricsDTO, DepartmentMetricsDTO, PodMetricsDTO, EmployeeMetricsDTO
+from contributions.services.permission_service import EmployeeRef
 from contributions.exceptions import ValidationException, PermissionDeniedException
 
 
 class GetOrgMetricsInteractor:
     """Interactor for getting organization-level metrics."""
     
-    def __init__(self, month: str, employee_id: int):
+    def __init__(self, month: str, employee: EmployeeRef):
         self.month = month
-        self.employee_id = employee_id
+        self.employee = employee
     
     def execute(self) -> OrgMetricsDTO:
         """Execute the metrics calculation."""
@@ -22,8 +23,7 @@ class GetOrgMetricsInteractor:
             raise ValidationException(f"Invalid month format: {self.month}. Expected YYYY-MM")
         
         # Check CEO permission with better error message
-        from contributions.storages import employee_storage
-        employee = employee_storage.get_employee_by_id(self.employee_id)
+        employee = permission_service.get_employee(self.employee)
         
         if employee.role != 'CEO':
             # Provide helpful guidance based on role
@@ -37,17 +37,20 @@ class GetOrgMetricsInteractor:
                 f"Organization dashboard requires CEO access. Current user: {employee.employee_code} (Role: {employee.role}).{guidance}"
             )
         
-        # Calculate metrics
-        return metrics_calculator_service.calculate_org_metrics(month_date)
+        # Calculate metrics (cached per month data version)
+        return metrics_cache_service.get_or_compute(
+            'org', None, month_date,
+            lambda: metrics_calculator_service.calculate_org_metrics(month_date)
+        )
 
 
 class GetDepartmentMetricsInteractor:
     """Interactor for getting department-level metrics."""
     
-    def __init__(self, department_id: int, month: str, employee_id: int):
+    def __init__(self, department_id: int, month: str, employee: EmployeeRef):
         self.department_id = department_id
         self.month = month
-        self.employee_id = employee_id
+        self.employee = employee
     
     def execute(self) -> DepartmentMetricsDTO:
         """Execute the metrics calculation."""
@@ -59,19 +62,22 @@ class GetDepartmentMetricsInteractor:
             raise ValidationException(f"Invalid month format: {self.month}. Expected YYYY-MM")
         
         # Check HOD permission
-        permission_service.check_hod_permission(self.employee_id, self.department_id)
+        permission_service.check_hod_permission(self.employee, self.department_id)
         
-        # Calculate metrics
-        return metrics_calculator_service.calculate_department_metrics(self.department_id, month_date)
+        # Calculate metrics (cached per month data version)
+        return metrics_cache_service.get_or_compute(
+            'department', self.department_id, month_date,
+            lambda: metrics_calculator_service.calculate_department_metrics(self.department_id, month_date)
+        )
 
 
 class GetPodMetricsInteractor:
     """Interactor for getting pod-level metrics."""
     
-    def __init__(self, pod_id: int, month: str, employee_id: int):
+    def __init__(self, pod_id: int, month: str, employee: EmployeeRef):
         self.pod_id = pod_id
         self.month = month
-        self.employee_id = employee_id
+        self.employee = employee
     
     def execute(self) -> PodMetricsDTO:
         """Execute the metrics calculation."""
@@ -83,19 +89,22 @@ class GetPodMetricsInteractor:
             raise ValidationException(f"Invalid month format: {self.month}. Expected YYYY-MM")
         
         # Check Pod Lead permission
-        permission_service.check_pod_lead_permission(self.employee_id, self.pod_id)
+        permission_service.check_pod_lead_permission(self.employee, self.pod_id)
         
-        # Calculate metrics
-        return metrics_calculator_service.calculate_pod_metrics(self.pod_id, month_date)
+        # Calculate metrics (cached per month data version)
+        return metrics_cache_service.get_or_compute(
+            'pod', self.pod_id, month_date,
+            lambda: metrics_calculator_service.calculate_pod_metrics(self.pod_id, month_date)
+        )
 
 
 class GetEmployeeMetricsInteractor:
     """Interactor for getting employee-level metrics."""
     
-    def __init__(self, employee_id: int, month: str, requesting_employee_id: int):
+    def __init__(self, employee_id: int, month: str, requesting_employee: EmployeeRef):
         self.employee_id = employee_id
         self.month = month
-        self.requesting_employee_id = requesting_employee_id
+        self.requesting_employee = requesting_employee
     
     def execute(self) -> EmployeeMetricsDTO:
         """Execute the metrics calculation."""
@@ -107,8 +116,11 @@ class GetEmployeeMetricsInteractor:
             raise ValidationException(f"Invalid month format: {self.month}. Expected YYYY-MM")
         
         # Check employee permission
-        permission_service.check_employee_permission(self.requesting_employee_id, self.employee_id)
+        permission_service.check_employee_permission(self.requesting_employee, self.employee_id)
         
-        # Calculate metrics
-        return metrics_calculator_service.calculate_employee_metrics(self.employee_id, month_date)
+        # Calculate metrics (cached per month data version)
+        return metrics_cache_service.get_or_compute(
+            'employee', self.employee_id, month_date,
+            lambda: metrics_calculator_service.calculate_employee_metrics(self.employee_id, month_date)
+        )
 
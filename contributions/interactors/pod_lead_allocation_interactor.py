@@ -1,15 +1,18 @@
 """Interactor for Pod Lead allocation submission."""
+from dataclasses import replace
 from datetime import datetime, date
 from decimal import Decimal
+from django.db import transaction
 from contributions.services import allocation_processing_service
 from contributions.storages import pod_lead_allocation_storage, employee_storage
+from contributions.storages.storage_dto import EmployeeDTO
 from contributions.exceptions import ValidationException, PermissionDeniedException
 
 
 class SubmitPodLeadAllocationInteractor:
     """Interactor for submitting Pod Lead allocations."""
     
-    def __init__(self, pod_id: int, month: str, allocations: list, pod_lead_id: int):
+    def __init__(self, pod_id: int, month: str, allocations: list, pod_lead_id: int, pod_lead: EmployeeDTO = None):
         self.pod_id = pod_id
         self.month = month
         # allocations format:
@@ -26,6 +29,8 @@ class SubmitPodLeadAllocationInteractor:
         # ]
         self.allocations = allocations
         self.pod_lead_id = pod_lead_id
+        # Requesting Pod Lead, if already loaded (e.g. by authentication)
+        self.pod_lead = pod_lead
     
     def execute(self) -> dict:
         """Execute the allocation submission."""
@@ -37,17 +42,17 @@ class SubmitPodLeadAllocationInteractor:
             raise ValidationException(f"Invalid month format: {self.month}. Expected YYYY-MM")
         
         # Verify Pod Lead has access to this pod
-        pod_lead = employee_storage.get_employee_by_id(self.pod_lead_id)
+        pod_lead = self.pod_lead or employee_storage.get_employee_by_id(self.pod_lead_id)
         if pod_lead.role != 'POD_LEAD' or pod_lead.pod_id != self.pod_id:
             raise PermissionDeniedException(
                 f"Pod Lead {pod_lead.employee_code} does not have access to pod {self.pod_id}"
             )
         
-        updated_allocations = []
+        lines = []
         errors = []
         
-        # Process each allocation
-        for alloc_data in self.allocations:
+        # Validate each line on its own first; errors keep their line index for ordering
+        for index, alloc_data in enumerate(self.allocations):
             employee_id = alloc_data.get('employee_id')
             product = alloc_data.get('product')
             academy_percent = Decimal(str(alloc_data.get('academy_percent', 0)))
@@ -56,10 +61,10 @@ class SubmitPodLeadAllocationInteractor:
             is_verified_description = alloc_data.get('is_verified_description', False)
             
             if not product:
-                errors.append({
+                errors.append((index, {
                     'employee_id': employee_id,
                     'message': 'product is required'
-                })
+                }))
                 continue
             
             # Validate percentages
@@ -68,52 +73,63 @@ class SubmitPodLeadAllocationInteractor:
                     academy_percent, intensive_percent, niat_percent
                 )
             except ValidationException as e:
-                errors.append({
+                errors.append((index, {
                     'employee_id': employee_id,
                     'product': product,
                     'message': str(e)
-                })
+                }))
                 continue
             
-            # Get existing allocation by employee-product-month
-            allocation = pod_lead_allocation_storage.get_allocation_by_employee_product_month(
-                employee_id,
-                product,
-                month_date
-            )
+            lines.append((index, employee_id, product, academy_percent, intensive_percent, niat_percent, is_verified_description))
+        
+        # Get all targeted allocations by employee-product-month at once
+        existing = pod_lead_allocation_storage.get_allocations_by_employee_products(
+            {(_to_int(line[1]), line[2]) for line in lines},
+            month_date
+        )
+        
+        changed_allocations = []
+        for index, employee_id, product, academy_percent, intensive_percent, niat_percent, is_verified_description in lines:
+            allocation = existing.get((_to_int(employee_id), product))
             
             if not allocation:
-                errors.append({
+                errors.append((index, {
                     'employee_id': employee_id,
                     'product': product,
                     'message': f'Allocation not found for employee {employee_id} and product {product}'
-                })
+                }))
                 continue
             
             # Verify this allocation belongs to this Pod Lead
             if allocation.pod_lead_id != self.pod_lead_id:
-                errors.append({
+                errors.append((index, {
                     'employee_id': employee_id,
                     'product': product,
                     'message': 'Allocation does not belong to this Pod Lead'
-                })
+                }))
                 continue
             
             # Determine status based on verification
             # Status is SUBMITTED only if description is verified, otherwise PENDING
             allocation_status = 'SUBMITTED' if is_verified_description else 'PENDING'
             
-            # Update allocation
-            updated = pod_lead_allocation_storage.update_allocation(
-                allocation.id,
+            changed_allocations.append(replace(
+                allocation,
                 academy_percent=academy_percent,
                 intensive_percent=intensive_percent,
                 niat_percent=niat_percent,
                 is_verified_description=is_verified_description,
                 status=allocation_status
-            )
-            
-            updated_allocations.append(updated)
+            ))
+        
+        # Save all valid lines together
+        updated_allocations = []
+        if changed_allocations:
+            with transaction.atomic():
+                updated_allocations = pod_lead_allocation_storage.bulk_update_allocations(changed_allocations)
+        
+        # Report errors in submission order
+        errors = [error for _, error in sorted(errors, key=lambda item: item[0])]
         
         return {
             'summary': {
@@ -125,3 +141,10 @@ class SubmitPodLeadAllocationInteractor:
             'has_errors': len(errors) > 0
         }
 
+
+def _to_int(value):
+    """Employee IDs may arrive as strings in the request body; compare them as ints."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
@@ -1,18 +1,16 @@
 """Upload interactor for handling file uploads."""
 from datetime import date
-from decimal import Decimal
 from django.db import transaction
 from django.conf import settings
 from pathlib import Path
 from contributions.services import file_parser_service
 from contributions.services import file_storage_service
-from contributions.services.file_parser_service import normalize_month
-from contributions.storages import (
-    department_storage, pod_storage, product_storage, feature_storage,
-    employee_storage, raw_file_storage, contribution_storage
-)
-from contributions.storages.storage_dto import ContributionRecordDTO
-from contributions.exceptions import ValidationException, PermissionDeniedException
+from contributions.services import metrics_cache_service
+from contributions.services import contribution_upsert_service
+from contributions.services import background_job_service
+from contributions.services import parse_cache_service
+from contributions.storages import raw_file_storage, contribution_storage
+from contributions.exceptions import ValidationException, PermissionDeniedException, DuplicateUploadException
 
 
 class UploadContributionFileInteractor:
@@ -23,67 +21,93 @@ class UploadContributionFileInteractor:
         self.uploaded_by_id = uploaded_by_id
     
     def execute(self) -> dict:
-        """Execute the upload and parsing process."""
+        """Execute the upload and parsing process synchronously."""
+        full_path, storage_path, file_name, file_size, checksum = self._store_file()
+        
+        # Parse file into validated columnar batches (reusing a cached parse of the same content)
+        batches, errors = parse_cache_service.parse_contribution_batches(str(full_path), checksum)
+        total_rows = sum(len(batch) for batch in batches)
+        
+        if not total_rows and errors:
+            # All rows had errors
+            raise ValidationException("All rows failed validation", errors={'rows': errors})
+        
+        # Create raw file record (duplicate check already done above)
+        raw_file = raw_file_storage.create_raw_file(
+            file_name=file_name,
+            storage_path=storage_path,
+            uploaded_by_id=self.uploaded_by_id,
+            file_size=file_size,
+            checksum=checksum,
+            check_duplicate=False,  # Already checked above
+        )
+        
+        parse_summary = write_contribution_batches(raw_file.id, batches, errors)
+        raw_file_storage.update_raw_file_summary(raw_file.id, parse_summary)
+        
+        return {
+            'raw_file_id': raw_file.id,
+            'summary': parse_summary,
+            'errors': errors,
+        }
+    
+    def enqueue(self) -> dict:
+        """
+        Store the file and queue it for background processing.
+        
+        Returns:
+            Dict with the job (raw file) ID and its QUEUED status
+        """
+        full_path, storage_path, file_name, file_size, checksum = self._store_file()
+        
+        with transaction.atomic():
+            raw_file = raw_file_storage.create_raw_file(
+                file_name=file_name,
+                storage_path=storage_path,
+                uploaded_by_id=self.uploaded_by_id,
+                file_size=file_size,
+                checksum=checksum,
+                parse_summary={'rows_parsed': 0, 'rows_written': 0, 'error_count': 0},
+                check_duplicate=False,  # Already checked in _store_file
+                status='QUEUED',
+            )
+            background_job_service.submit_after_commit(process_queued_upload, raw_file.id)
+        
+        return {
+            'raw_file_id': raw_file.id,
+            'status': raw_file.status,
+        }
+    
+    def _store_file(self) -> tuple:
+        """
+        Store the uploaded file, rejecting content that was already uploaded.
+        
+        Returns:
+            Tuple of (full_path, storage_path, file_name, file_size, checksum)
+        """
         # Check if file is a path string (for management commands)
         if isinstance(self.file, str):
             full_path = Path(self.file)
             if not full_path.is_absolute():
                 full_path = Path(settings.BASE_DIR) / full_path
             
-            # Calculate storage path relative to MEDIA_ROOT
-            try:
-                storage_path = str(full_path.relative_to(Path(settings.MEDIA_ROOT)))
-            except ValueError:
-                # File is outside MEDIA_ROOT, use filename in uploads directory
-                storage_path = f"uploads/{full_path.name}"
-            
             file_size = full_path.stat().st_size
-            import hashlib
-            with open(full_path, 'rb') as f:
-                checksum = hashlib.md5(f.read()).hexdigest()
+            checksum = file_storage_service.calculate_checksum(full_path)
             file_name = full_path.name
             
             # Check for duplicate file before processing
-            existing_file = raw_file_storage.get_raw_file_by_checksum(checksum)
-            if existing_file:
-                from contributions.exceptions import DuplicateUploadException
-                raise DuplicateUploadException(
-                    f"File with same content already exists: {existing_file.file_name} "
-                    f"(uploaded at {existing_file.uploaded_at}). Use existing file ID: {existing_file.id}"
-                )
-        else:
-            # Read file content first to calculate checksum before saving
-            file_content = b''
-            if hasattr(self.file, 'read'):
-                self.file.seek(0)
-                file_content = self.file.read()
-                self.file.seek(0)
-            elif hasattr(self.file, 'chunks'):
-                for chunk in self.file.chunks():
-                    file_content += chunk
-            
-            # Calculate checksum from content
-            import hashlib
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                tmp_file.write(file_content)
-                tmp_path = Path(tmp_file.name)
-                checksum = hashlib.md5(file_content).hexdigest()
-                tmp_path.unlink()
+            self._check_duplicate(checksum)
             
-            # Check for duplicate BEFORE saving
-            existing_file = raw_file_storage.get_raw_file_by_checksum(checksum)
-            if existing_file:
-                from contributions.exceptions import DuplicateUploadException
-                raise DuplicateUploadException(
-                    f"File with same content already exists: {existing_file.file_name} "
-                    f"(uploaded at {existing_file.uploaded_at}). Use existing file ID: {existing_file.id}"
-                )
-            
-            # Save uploaded file (duplicate check already done)
+            # Add the file to the blob store and parse it from there
+            storage_path = file_storage_service.store_local_file(full_path, checksum)
+            full_path = Path(settings.MEDIA_ROOT) / storage_path
+        else:
+            # Save uploaded file in one pass, computing size and checksum on the way;
+            # a duplicate is rejected before it reaches the blob store
             storage_path, file_size, checksum = file_storage_service.save_uploaded_file(
                 self.file, 
-                check_duplicate=False  # Already checked above
+                check_duplicate=False,  # Checked by _check_duplicate so the duplicate can be reported
+                validate_checksum=self._check_duplicate,
             )
             full_path = Path(settings.MEDIA_ROOT) / storage_path
             
@@ -92,104 +116,199 @@ class UploadContributionFileInteractor:
             if not file_name:
                 file_name = 'uploaded_file.xlsx'
         
-        # Parse file
-        parsed_rows, errors = file_parser_service.parse_excel_file(str(full_path))
+        return full_path, storage_path, file_name, file_size, checksum
+    
+    def _check_duplicate(self, checksum: str) -> None:
+        """Raise DuplicateUploadException if a file with the same checksum exists."""
+        existing_file = raw_file_storage.get_raw_file_by_checksum(checksum)
+        if existing_file:
+            raise DuplicateUploadException(
+                f"File with same content already exists: {existing_file.file_name} "
+                f"(uploaded at {existing_file.uploaded_at}). Use existing file ID: {existing_file.id}"
+            )
+
+
+def write_contribution_batches(raw_file_id: int, batches: list, errors: list) -> dict:
+    """
+    Upsert entities and write the contribution records of parsed batches.
+    
+    Returns:
+        Parse summary of the file
+    """
+    with transaction.atomic():
+        # Upsert entities in bulk and map rows to contribution records
+        created_records, entity_counts = contribution_upsert_service.build_contribution_records(
+            batches, raw_file_id
+        )
+        
+        # Bulk create contribution records
+        records_created = contribution_storage.bulk_create_contributions(created_records, raw_file_id)
         
-        if not parsed_rows and errors:
-            # All rows had errors
-            raise ValidationException("All rows failed validation", errors={'rows': errors})
+        # Invalidate cached dashboards of the touched months
+        metrics_cache_service.invalidate_months({record.contribution_month for record in created_records})
+    
+    total_rows = sum(len(batch) for batch in batches)
+    return {
+        'total_rows': total_rows,
+        'rows_parsed': total_rows,
+        'rows_written': records_created,
+        'created_records': records_created,
+        'created_employees': entity_counts['employees'],
+        'created_departments': entity_counts['departments'],
+        'created_pods': entity_counts['pods'],
+        'created_products': entity_counts['products'],
+        'created_features': entity_counts['features'],
+        'error_count': len(errors),
+        'errors': errors,  # Store errors for download
+    }
+
+
+def process_queued_upload(raw_file_id: int) -> None:
+    """
+    Process a QUEUED upload, recording progress and the outcome on its RawFile.
+    
+    Runs on the background worker pool (or from process_pending_uploads).
+    """
+    raw_file_storage.update_raw_file_status(raw_file_id, 'PROCESSING')
+    errors = []
+    try:
+        full_path = file_storage_service.get_file_path_by_id(raw_file_id)
+        if should_stream(full_path):
+            parse_summary = stream_contribution_file(raw_file_id, str(full_path), errors)
+            status = 'FAILED' if parse_summary.get('failure_reason') else 'COMPLETED'
+            raw_file_storage.update_raw_file_status(raw_file_id, status, parse_summary)
+            return
         
-        # Create raw file record (duplicate check already done above)
-        raw_file = raw_file_storage.create_raw_file(
-            file_name=file_name,
-            storage_path=storage_path,
-            uploaded_by_id=self.uploaded_by_id,
-            file_size=file_size,
-            checksum=checksum,
-            check_duplicate=False,  # Already checked above
-        )
+        raw_file = raw_file_storage.get_raw_file_by_id(raw_file_id)
+        batches, errors = parse_cache_service.parse_contribution_batches(str(full_path), raw_file.checksum)
+        total_rows = sum(len(batch) for batch in batches)
         
-        # Process rows and create contribution records
-        created_records = []
-        created_employees = set()
-        created_departments = set()
-        created_pods = set()
-        created_products = set()
-        created_features = set()
+        if not total_rows and errors:
+            # All rows had errors
+            raw_file_storage.update_raw_file_status(raw_file_id, 'FAILED', {
+                'rows_parsed': 0,
+                'rows_written': 0,
+                'error_count': len(errors),
+                'errors': errors,
+                'failure_reason': 'All rows failed validation',
+            })
+            return
         
-        with transaction.atomic():
-            for row in parsed_rows:
-                # Upsert entities
-                dept = department_storage.get_or_create_department(row['department'])
-                if dept.id not in created_departments:
-                    created_departments.add(dept.id)
-                
-                pod = pod_storage.get_or_create_pod(row['pod'], dept.id)
-                if pod.id not in created_pods:
-                    created_pods.add(pod.id)
-                
-                product = product_storage.get_or_create_product(row['product'])
-                if product.id not in created_products:
-                    created_products.add(product.id)
-                
-                feature = None
-                if row.get('feature_name') and row['feature_name'].strip():
-                    feature = feature_storage.get_or_create_feature(
-                        row['feature_name'],
-                        product.id,
-                        row.get('description', '')
-                    )
-                    if feature.id not in created_features:
-                        created_features.add(feature.id)
-                
-                employee = employee_storage.get_or_create_employee(
-                    employee_code=row['employee_code'],
-                    name=row['employee_name'],
-                    email=row['email'],
-                    department_id=dept.id,
-                    pod_id=pod.id,
-                )
-                if employee.id not in created_employees:
-                    created_employees.add(employee.id)
-                
-                # Create contribution record DTO
-                contribution_month = normalize_month(row['contribution_month'])
-                effort_hours = Decimal(str(row['effort_hours']))
-                
-                record = ContributionRecordDTO(
-                    employee_id=employee.id,
-                    department_id=dept.id,
-                    pod_id=pod.id,
-                    product_id=product.id,
-                    feature_id=feature.id if feature else None,
-                    contribution_month=contribution_month,
-                    effort_hours=effort_hours,
-                    description=row.get('description', ''),
-                    source_file_id=raw_file.id,
-                )
-                created_records.append(record)
-            
-            # Bulk create contribution records
-            records_created = contribution_storage.bulk_create_contributions(created_records, raw_file.id)
-        
-        # Update parse summary
-        parse_summary = {
-            'total_rows': len(parsed_rows),
-            'created_records': records_created,
-            'created_employees': len(created_employees),
-            'created_departments': len(created_departments),
-            'created_pods': len(created_pods),
-            'created_products': len(created_products),
-            'created_features': len(created_features),
+        raw_file_storage.update_raw_file_status(raw_file_id, 'PROCESSING', {
+            'rows_parsed': total_rows,
+            'rows_written': 0,
             'error_count': len(errors),
-            'errors': errors,  # Store errors for download
-        }
-        
-        raw_file_storage.update_raw_file_summary(raw_file.id, parse_summary)
+            'errors': errors,
+        })
         
-        return {
-            'raw_file_id': raw_file.id,
-            'summary': parse_summary,
+        parse_summary = write_contribution_batches(raw_file_id, batches, errors)
+        raw_file_storage.update_raw_file_status(raw_file_id, 'COMPLETED', parse_summary)
+    except Exception as e:
+        raw_file_storage.update_raw_file_status(raw_file_id, 'FAILED', {
+            'rows_parsed': 0,
+            'rows_written': 0,
+            'error_count': len(errors),
             'errors': errors,
-        }
+            'failure_reason': str(e),
+        })
+        raise
+
+
+def discard_partial_upload(raw_file_id: int) -> int:
+    """
+    Undo what an interrupted run of an upload wrote, so it can be processed again.
+    
+    Streamed uploads commit chunk by chunk, and a run can stop between
+    writing its records and recording COMPLETED; reprocessing such a file
+    as is would count its hours twice. Its records are deleted (with their
+    rollup hours subtracted) and the file is queued again in one
+    transaction.
+    
+    Returns:
+        Number of contribution records deleted
+    """
+    with transaction.atomic():
+        affected_months = contribution_storage.get_contribution_months_by_source_file(raw_file_id)
+        deleted_count = contribution_storage.delete_contributions_by_source_file(raw_file_id)
+        metrics_cache_service.invalidate_months(affected_months)
+        raw_file_storage.update_raw_file_status(raw_file_id, 'QUEUED')
+    return deleted_count
 
+
+def should_stream(file_path: Path) -> bool:
+    """Whether a stored upload is large enough to be parsed and written chunk by chunk."""
+    min_bytes = getattr(settings, 'STREAMING_UPLOAD_MIN_BYTES', 10 * 1024 * 1024)
+    return file_path.suffix.lower() == '.xlsx' and file_path.stat().st_size >= min_bytes
+
+
+def stream_contribution_file(raw_file_id: int, file_path: str, errors: list) -> dict:
+    """
+    Parse an upload in chunks, writing the valid rows of each chunk before reading the next.
+    
+    Memory stays bounded by the chunk size (STREAMING_UPLOAD_CHUNK_ROWS)
+    whatever the size of the file. Each chunk is written in its own
+    transaction and reported as progress; if a chunk fails, the records
+    already written for the file are deleted again.
+    
+    Args:
+        raw_file_id: RawFile ID the records are created from
+        file_path: Path of the stored upload
+        errors: List collecting the validation errors of the file
+    
+    Returns:
+        Parse summary of the file (with failure_reason if all rows failed validation)
+    """
+    chunk_rows = getattr(settings, 'STREAMING_UPLOAD_CHUNK_ROWS', 5000)
+    rows_parsed = 0
+    rows_written = 0
+    entity_ids = {'employees': set(), 'departments': set(), 'pods': set(), 'products': set(), 'features': set()}
+    
+    try:
+        for batch, chunk_errors in file_parser_service.iter_contribution_chunks(file_path, chunk_rows):
+            errors.extend(chunk_errors)
+            if batch is None or not len(batch):
+                continue
+            
+            with transaction.atomic():
+                records, _ = contribution_upsert_service.build_contribution_records([batch], raw_file_id)
+                rows_written += contribution_storage.bulk_create_contributions(records, raw_file_id)
+                metrics_cache_service.invalidate_months({record.contribution_month for record in records})
+            rows_parsed += len(batch)
+            
+            for record in records:
+                entity_ids['employees'].add(record.employee_id)
+                entity_ids['departments'].add(record.department_id)
+                entity_ids['pods'].add(record.pod_id)
+                entity_ids['products'].add(record.product_id)
+                if record.feature_id is not None:
+                    entity_ids['features'].add(record.feature_id)
+            
+            raw_file_storage.update_raw_file_status(raw_file_id, 'PROCESSING', {
+                'rows_parsed': rows_parsed,
+                'rows_written': rows_written,
+                'error_count': len(errors),
+            })
+    except Exception:
+        if rows_written:
+            affected_months = contribution_storage.get_contribution_months_by_source_file(raw_file_id)
+            contribution_storage.delete_contributions_by_source_file(raw_file_id)
+            metrics_cache_service.invalidate_months(affected_months)
+        raise
+    
+    parse_summary = {
+        'total_rows': rows_parsed,
+        'rows_parsed': rows_parsed,
+        'rows_written': rows_written,
+        'created_records': rows_written,
+        'created_employees': len(entity_ids['employees']),
+        'created_departments': len(entity_ids['departments']),
+        'created_pods': len(entity_ids['pods']),
+        'created_products': len(entity_ids['products']),
+        'created_features': len(entity_ids['features']),
+        'error_count': len(errors),
+        'errors': errors,  # Store errors for download
+    }
+    if not rows_parsed and errors:
+        # All rows had errors
+        parse_summary['failure_reason'] = 'All rows failed validation'
+    return parse_summary
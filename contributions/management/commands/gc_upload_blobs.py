@@ -0,0 +1,32 @@
+"""Management command to delete upload blobs no raw file references."""
+from django.core.management.base import BaseCommand
+from contributions.services import file_storage_service
+
+
+class Command(BaseCommand):
+    help = 'Delete stored upload blobs that no raw file references any more'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age-hours',
+            type=float,
+            default=24,
+            help='Only delete unreferenced blobs older than this (default: 24)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be deleted without deleting anything',
+        )
+    
+    def handle(self, *args, **options):
+        result = file_storage_service.collect_unreferenced_blobs(
+            min_age_seconds=int(options['min_age_hours'] * 3600),
+            dry_run=options['dry_run'],
+        )
+        
+        action = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {result['deleted']} unreferenced blobs ({result['bytes_freed']} bytes); "
+            f"{result['referenced']} referenced, {result['kept_recent']} too recent to delete"
+        ))
@@ -0,0 +1,50 @@
+"""Management command to move uploads stored under their own names into the blob store."""
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from contributions.services import file_storage_service
+from contributions.storages import raw_file_storage
+
+
+class Command(BaseCommand):
+    help = 'Move raw files stored outside the blob store into it (hard-linked, so no data is copied)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep-originals',
+            action='store_true',
+            help='Keep the original file names next to the blobs',
+        )
+    
+    def handle(self, *args, **options):
+        blob_prefix = f"{file_storage_service.BLOB_DIR}/"
+        moved = 0
+        missing = 0
+        original_paths = set()
+        
+        for raw_file in raw_file_storage.list_raw_files_outside_storage_prefix(blob_prefix):
+            file_path = Path(settings.MEDIA_ROOT) / raw_file.storage_path
+            if not file_path.is_file():
+                # e.g. allocation runs, which have no stored file
+                missing += 1
+                continue
+            
+            checksum = file_storage_service.calculate_checksum(file_path)
+            storage_path = file_storage_service.store_local_file(file_path, checksum)
+            
+            # Live files keep unique checksums; an older live copy of the same content keeps none
+            existing = raw_file_storage.get_raw_file_by_checksum(checksum)
+            if existing and existing.id != raw_file.id and raw_file.status != 'FAILED':
+                checksum = None
+            
+            raw_file_storage.update_raw_file_storage(raw_file.id, storage_path, checksum)
+            original_paths.add(file_path)
+            moved += 1
+        
+        if not options['keep_originals']:
+            for file_path in original_paths:
+                file_path.unlink(missing_ok=True)
+        
+        self.stdout.write(self.style.SUCCESS(
+            f'Moved {moved} raw files into the blob store ({missing} without a stored file skipped)'
+        ))
@@ -0,0 +1,60 @@
+"""Management command to process the submitted allocations of every pod for a month."""
+from django.core.management.base import BaseCommand
+from contributions.interactors.allocation_processing_interactor import ProcessMonthAllocationsInteractor
+from contributions.exceptions import DomainException
+
+
+class Command(BaseCommand):
+    help = 'Process the SUBMITTED Pod Lead allocations of every pod for a month, one transaction per pod'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--month',
+            type=str,
+            required=True,
+            help='Month in YYYY-MM format'
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            choices=['records', 'csv'],
+            default='records',
+            help='Create contribution records (default) or one CSV per pod'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Maximum pods processed concurrently (default: ALLOCATION_PROCESSING_WORKERS)'
+        )
+    
+    def handle(self, *args, **options):
+        try:
+            result = ProcessMonthAllocationsInteractor(
+                month=options['month'],
+                output_format=options['output'],
+                workers=options['workers']
+            ).execute()
+        except DomainException as e:
+            self.stdout.write(self.style.ERROR(str(e)))
+            return
+        
+        if not result['pod_count']:
+            self.stdout.write(self.style.WARNING(f'No submitted allocations found for {result["month"]}'))
+            return
+        
+        for pod in result['pods']:
+            if pod['status'] == 'SUCCESS':
+                detail = pod.get('csv_path') or f'{pod.get("created_records", 0)} records'
+                self.stdout.write(f'  pod {pod["pod_id"]}: {pod.get("processed_count", 0)} allocations -> {detail}')
+            else:
+                self.stdout.write(self.style.ERROR(f'  pod {pod["pod_id"]}: failed: {pod["error"]}'))
+        
+        summary = (
+            f'{result["month"]}: processed {result["succeeded_count"]} of {result["pod_count"]} pods '
+            f'({result["processed_count"]} allocations, {result["created_records"]} records)'
+        )
+        if result['failed_count']:
+            self.stdout.write(self.style.WARNING(summary))
+        else:
+            self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,46 @@
+"""Management command to process uploads still waiting in the background queue."""
+from django.core.management.base import BaseCommand
+from contributions.interactors.upload_interactor import process_queued_upload, discard_partial_upload
+from contributions.storages import raw_file_storage
+
+
+class Command(BaseCommand):
+    help = 'Process QUEUED uploads (e.g. left behind by a restart) synchronously'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--include-processing',
+            action='store_true',
+            help='Also retry uploads stuck in PROCESSING (only when no worker is running); '
+                 'the records a previous run already wrote are deleted first',
+        )
+    
+    def handle(self, *args, **options):
+        statuses = ['QUEUED']
+        if options['include_processing']:
+            statuses.append('PROCESSING')
+        
+        raw_file_ids = raw_file_storage.list_raw_file_ids_by_status(statuses)
+        if not raw_file_ids:
+            self.stdout.write(self.style.SUCCESS('No pending uploads'))
+            return
+        
+        interrupted_ids = set()
+        if options['include_processing']:
+            interrupted_ids = set(raw_file_storage.list_raw_file_ids_by_status(['PROCESSING']))
+        
+        for raw_file_id in raw_file_ids:
+            try:
+                if raw_file_id in interrupted_ids:
+                    deleted_count = discard_partial_upload(raw_file_id)
+                    if deleted_count:
+                        self.stdout.write(f'Upload {raw_file_id}: deleted {deleted_count} records of the interrupted run')
+                process_queued_upload(raw_file_id)
+                raw_file = raw_file_storage.get_raw_file_by_id(raw_file_id)
+                style = self.style.SUCCESS if raw_file.status == 'COMPLETED' else self.style.ERROR
+                self.stdout.write(style(
+                    f'Upload {raw_file_id} ({raw_file.file_name}): {raw_file.status}, '
+                    f'{raw_file.parse_summary.get("rows_written", 0)} rows written'
+                ))
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'Upload {raw_file_id}: FAILED ({str(e)})'))
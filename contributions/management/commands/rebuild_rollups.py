@@ -0,0 +1,63 @@
+"""Management command to rebuild and verify monthly contribution rollups."""
+from datetime import datetime, date
+from django.core.management.base import BaseCommand
+from contributions.storages import contribution_rollup_storage
+
+
+class Command(BaseCommand):
+    help = 'Rebuild monthly contribution rollups from raw contribution records, or check them against the raw data'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--month',
+            type=str,
+            help='Month in YYYY-MM format (default: every month with contributions)',
+            default=None
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare rollups against the raw records, do not rebuild',
+        )
+    
+    def handle(self, *args, **options):
+        if options['month']:
+            try:
+                month_date = datetime.strptime(options['month'], '%Y-%m').date()
+            except ValueError:
+                self.stdout.write(self.style.ERROR(f'Invalid month format: {options["month"]}. Expected YYYY-MM'))
+                return
+            months = [date(month_date.year, month_date.month, 1)]
+        else:
+            months = contribution_rollup_storage.list_contribution_months()
+        
+        if not months:
+            self.stdout.write(self.style.WARNING('No contribution months found'))
+            return
+        
+        mismatched_months = 0
+        for month in months:
+            month_str = month.strftime('%Y-%m')
+            
+            if options['check']:
+                mismatches = contribution_rollup_storage.find_month_mismatches(month)
+                if mismatches:
+                    mismatched_months += 1
+                    self.stdout.write(self.style.ERROR(f'{month_str}: {len(mismatches)} rollup rows differ from raw data'))
+                    for mismatch in mismatches[:20]:
+                        self.stdout.write(
+                            f'  employee={mismatch["employee_id"]} pod={mismatch["pod_id"]} '
+                            f'product={mismatch["product_id"]} feature={mismatch["feature_id"]}: '
+                            f'expected {mismatch["expected_hours"]}h/{mismatch["expected_count"]} records, '
+                            f'found {mismatch["actual_hours"]}h/{mismatch["actual_count"]} records'
+                        )
+                else:
+                    self.stdout.write(self.style.SUCCESS(f'{month_str}: rollups match raw data'))
+            else:
+                created = contribution_rollup_storage.rebuild_month(month)
+                self.stdout.write(self.style.SUCCESS(f'{month_str}: rebuilt {created} rollup rows'))
+        
+        if options['check'] and mismatched_months:
+            self.stdout.write(self.style.WARNING(
+                f'{mismatched_months} month(s) out of sync. Run rebuild_rollups without --check to fix.'
+            ))
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:09
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+ROLLUP_KEY_FIELDS = ('contribution_month', 'department_id', 'pod_id', 'employee_id', 'product_id', 'feature_id')
+
+
+def backfill_rollups(apps, schema_editor):
+    """Build rollups for all existing contribution records."""
+    ContributionRecord = apps.get_model('contributions', 'ContributionRecord')
+    ContributionMonthlyRollup = apps.get_model('contributions', 'ContributionMonthlyRollup')
+
+    aggregates = ContributionRecord.objects.values(*ROLLUP_KEY_FIELDS).annotate(
+        hours=Sum('effort_hours'),
+        record_count=Count('id')
+    ).order_by()
+    ContributionMonthlyRollup.objects.bulk_create(
+        [
+            ContributionMonthlyRollup(
+                hours=row['hours'] or Decimal('0'),
+                record_count=row['record_count'],
+                **{field: row[field] for field in ROLLUP_KEY_FIELDS}
+            )
+            for row in aggregates
+        ],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0003_update_pod_lead_allocation_model'),
+        ('core', '0003_update_pod_lead_allocation_model'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContributionMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contribution_month', models.DateField()),
+                ('hours', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('record_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contribution_rollups', to='core.department')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contribution_rollups', to='core.employee')),
+                ('feature', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='contribution_rollups', to='core.feature')),
+                ('pod', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contribution_rollups', to='core.pod')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='contribution_rollups', to='core.product')),
+            ],
+            options={
+                'db_table': 'contribution_monthly_rollups',
+                'ordering': ['-contribution_month', 'employee'],
+                'indexes': [models.Index(fields=['contribution_month'], name='idx_rollup_month'), models.Index(fields=['product', 'contribution_month'], name='idx_rollup_prod_month'), models.Index(fields=['pod', 'contribution_month'], name='idx_rollup_pod_month'), models.Index(fields=['department', 'contribution_month'], name='idx_rollup_dept_month'), models.Index(fields=['employee', 'contribution_month'], name='idx_rollup_emp_month')],
+                'unique_together': {('contribution_month', 'department', 'pod', 'employee', 'product', 'feature')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
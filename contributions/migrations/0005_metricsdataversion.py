@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0004_contributionmonthlyrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricsDataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contribution_month', models.DateField(unique=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'metrics_data_versions',
+                'ordering': ['-contribution_month'],
+            },
+        ),
+    ]
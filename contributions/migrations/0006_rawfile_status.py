@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-16 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0005_metricsdataversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rawfile',
+            name='status',
+            field=models.CharField(choices=[('QUEUED', 'Queued'), ('PROCESSING', 'Processing'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], db_index=True, default='COMPLETED', max_length=20),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-17 00:24
+
+from django.db import migrations, models
+
+
+def fill_active_checksums(apps, schema_editor):
+    """Clear empty checksums, and copy the checksums of files that did not fail (the newest file per checksum)."""
+    RawFile = apps.get_model('contributions', 'RawFile')
+
+    RawFile.objects.filter(checksum='').update(checksum=None)
+
+    seen = set()
+    live_files = RawFile.objects.exclude(checksum=None).exclude(status='FAILED').order_by('-uploaded_at', '-id')
+    for raw_file_id, checksum in live_files.values_list('id', 'checksum'):
+        if checksum in seen:
+            continue
+        seen.add(checksum)
+        RawFile.objects.filter(id=raw_file_id).update(active_checksum=checksum)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0006_rawfile_status'),
+        ('core', '0003_update_pod_lead_allocation_model'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='rawfile',
+            name='checksum',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='rawfile',
+            name='active_checksum',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(fill_active_checksums, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='rawfile',
+            name='active_checksum',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contributions', '0007_rawfile_checksum_unique'),
+        ('core', '0003_update_pod_lead_allocation_model'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contributionrecord',
+            index=models.Index(fields=['contribution_month', 'id'], name='idx_contrib_month_id'),
+        ),
+        migrations.RemoveIndex(
+            model_name='contributionrecord',
+            name='idx_contrib_month',
+        ),
+    ]
@@ -6,18 +6,36 @@ from core.models import Employee, Department, Pod, Product, Feature
 
 class RawFile(models.Model):
     """RawFile model for storing uploaded contribution files."""
+    STATUS_CHOICES = [
+        ('QUEUED', 'Queued'),
+        ('PROCESSING', 'Processing'),
+        ('COMPLETED', 'Completed'),
+        ('FAILED', 'Failed'),
+    ]
+
     file_name = models.CharField(max_length=255)
     uploaded_by = models.ForeignKey(Employee, on_delete=models.SET_NULL, null=True, related_name='uploaded_files')
     uploaded_at = models.DateTimeField(auto_now_add=True)
     storage_path = models.CharField(max_length=500)
     file_size = models.BigIntegerField(default=0)
-    checksum = models.CharField(max_length=64, blank=True, null=True)
+    checksum = models.CharField(max_length=64, blank=True, null=True, db_index=True)
+    # Checksum of a file that did not fail (NULL once it failed), so that one
+    # live file per content is enforced by a plain unique index on every backend
+    active_checksum = models.CharField(max_length=64, blank=True, null=True, unique=True, editable=False)
     parse_summary = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='COMPLETED', db_index=True)
 
     class Meta:
         db_table = 'raw_files'
         ordering = ['-uploaded_at']
 
+    def save(self, *args, **kwargs):
+        self.active_checksum = None if self.status == 'FAILED' else self.checksum
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and ({'status', 'checksum'} & set(update_fields)):
+            kwargs['update_fields'] = {*update_fields, 'active_checksum'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.file_name} - {self.uploaded_at}"
 
@@ -40,7 +58,7 @@ class ContributionRecord(models.Model):
         db_table = 'contribution_records'
         ordering = ['-contribution_month', 'employee']
         indexes = [
-            models.Index(fields=['contribution_month'], name='idx_contrib_month'),
+            models.Index(fields=['contribution_month', 'id'], name='idx_contrib_month_id'),
             models.Index(fields=['product', 'contribution_month'], name='idx_contrib_prod_month'),
             models.Index(fields=['pod', 'contribution_month'], name='idx_contrib_pod_month'),
             models.Index(fields=['department', 'contribution_month'], name='idx_contrib_dept_month'),
@@ -86,3 +104,45 @@ class PodLeadAllocation(models.Model):
 
     def __str__(self):
         return f"{self.employee.employee_code} - {self.contribution_month} - {self.status}"
+
+
+class ContributionMonthlyRollup(models.Model):
+    """Pre-summed contribution hours per month/department/pod/employee/product/feature."""
+    contribution_month = models.DateField()
+    department = models.ForeignKey(Department, on_delete=models.CASCADE, related_name='contribution_rollups')
+    pod = models.ForeignKey(Pod, on_delete=models.CASCADE, related_name='contribution_rollups')
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='contribution_rollups')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='contribution_rollups')
+    feature = models.ForeignKey(Feature, on_delete=models.SET_NULL, null=True, blank=True, related_name='contribution_rollups')
+    hours = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    record_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'contribution_monthly_rollups'
+        ordering = ['-contribution_month', 'employee']
+        unique_together = [['contribution_month', 'department', 'pod', 'employee', 'product', 'feature']]
+        indexes = [
+            models.Index(fields=['contribution_month'], name='idx_rollup_month'),
+            models.Index(fields=['product', 'contribution_month'], name='idx_rollup_prod_month'),
+            models.Index(fields=['pod', 'contribution_month'], name='idx_rollup_pod_month'),
+            models.Index(fields=['department', 'contribution_month'], name='idx_rollup_dept_month'),
+            models.Index(fields=['employee', 'contribution_month'], name='idx_rollup_emp_month'),
+        ]
+
+    def __str__(self):
+        return f"{self.contribution_month} - {self.employee_id} - {self.product_id}: {self.hours}"
+
+
+class MetricsDataVersion(models.Model):
+    """Per-month data version used to invalidate cached dashboard responses."""
+    contribution_month = models.DateField(unique=True)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'metrics_data_versions'
+        ordering = ['-contribution_month']
+
+    def __str__(self):
+        return f"{self.contribution_month} - v{self.version}"
@@ -72,3 +72,27 @@ def present_processing_result(result: dict) -> dict:
         'message': result.get('message', 'Processing completed')
     }
 
+
+
+def present_month_processing_result(result: dict) -> dict:
+    """Present the result of processing a month for all pods."""
+    return {
+        'month': result['month'],
+        'output_format': result['output_format'],
+        'pod_count': result['pod_count'],
+        'succeeded_count': result['succeeded_count'],
+        'failed_count': result['failed_count'],
+        'processed_count': result['processed_count'],
+        'created_records': result['created_records'],
+        'pods': [
+            {
+                'pod_id': pod['pod_id'],
+                'status': pod['status'],
+                'processed_count': pod.get('processed_count', 0),
+                'created_records': pod.get('created_records', 0),
+                'csv_path': pod.get('csv_path'),
+                'error': pod.get('error'),
+            }
+            for pod in result['pods']
+        ],
+    }
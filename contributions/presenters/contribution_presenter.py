@@ -0,0 +1,39 @@
+"""Presenter for contribution listing responses."""
+import json
+from typing import Iterable, Iterator
+from contributions.storages.storage_dto import ContributionRecordDTO
+
+# Fields of a record in the listing, in response order
+LISTED_FIELDS = (
+    'id', 'contribution_month', 'employee_id', 'employee_code', 'employee_name', 'department_id', 'department_name',
+    'pod_id', 'pod_name', 'product_id', 'product_name', 'feature_id', 'feature_name', 'effort_hours', 'description',
+)
+
+
+def present_contribution(record: ContributionRecordDTO) -> dict:
+    """Present one contribution record."""
+    data = record.to_dict(LISTED_FIELDS)
+    data['contribution_month'] = record.contribution_month.strftime('%Y-%m')
+    data['effort_hours'] = float(record.effort_hours)
+    return data
+
+
+def present_contribution_page(page: dict) -> dict:
+    """Present a page of contribution records."""
+    return {
+        'results': [present_contribution(row) for row in page['results']],
+        'count': len(page['results']),
+        'next_cursor': page['next_cursor'],
+    }
+
+
+def render_contributions_ndjson(rows: Iterable[ContributionRecordDTO], batch_size: int = 500) -> Iterator[bytes]:
+    """Encode contribution records as NDJSON (one JSON object per line), a batch of lines at a time."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(present_contribution(row)))
+        if len(lines) >= batch_size:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
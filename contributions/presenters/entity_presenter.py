@@ -35,6 +35,7 @@ def present_raw_file(raw_file: RawFileDTO) -> dict:
         'uploaded_by_id': raw_file.uploaded_by_id,
         'uploaded_at': raw_file.uploaded_at.isoformat() if raw_file.uploaded_at else None,
         'file_size': raw_file.file_size,
+        'status': raw_file.status,
         'parse_summary': raw_file.parse_summary,
     }
 
@@ -1,6 +1,10 @@
 """Presenter for upload responses."""
 from contributions.common.response import success_response, error_response
 from contributions.exceptions import DomainException, ValidationException
+from contributions.storages.storage_dto import RawFileDTO
+
+# Errors included in a status response; the full list is available as CSV
+STATUS_ERRORS_LIMIT = 50
 
 
 def present_upload_result(result: dict) -> dict:
@@ -13,6 +17,37 @@ def present_upload_result(result: dict) -> dict:
     }
 
 
+def present_upload_job(result: dict) -> dict:
+    """Present a queued upload job."""
+    return {
+        'job_id': result['raw_file_id'],
+        'raw_file_id': result['raw_file_id'],
+        'status': result['status'],
+        'status_url': f"/api/uploads/{result['raw_file_id']}/status/",
+    }
+
+
+def present_upload_status(raw_file: RawFileDTO) -> dict:
+    """Present upload processing status and progress."""
+    summary = raw_file.parse_summary or {}
+    errors = summary.get('errors', [])
+    return {
+        'job_id': raw_file.id,
+        'raw_file_id': raw_file.id,
+        'file_name': raw_file.file_name,
+        'status': raw_file.status,
+        'uploaded_at': raw_file.uploaded_at.isoformat() if raw_file.uploaded_at else None,
+        'progress': {
+            'rows_parsed': summary.get('rows_parsed', summary.get('total_rows', 0)),
+            'rows_written': summary.get('rows_written', summary.get('created_records', 0)),
+            'error_count': summary.get('error_count', len(errors)),
+        },
+        'errors': errors[:STATUS_ERRORS_LIMIT],
+        'failure_reason': summary.get('failure_reason'),
+        'summary': {key: value for key, value in summary.items() if key != 'errors'},
+    }
+
+
 def present_upload_error(exception: DomainException) -> dict:
     """Present upload error."""
     if isinstance(exception, ValidationException):
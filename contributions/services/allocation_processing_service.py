@@ -1,12 +1,19 @@
 """Service for processing Pod Lead allocations."""
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pathlib import Path
 import pandas as pd
 from django.conf import settings
+from django.db import transaction, connection, close_old_connections, connections
 from contributions.exceptions import ValidationException
-from contributions.storages.storage_dto import PodLeadAllocationDTO
+from contributions.storages.storage_dto import PodLeadAllocationDTO, ContributionRecordDTO
+
+logger = logging.getLogger(__name__)
+
+ALLOCATION_PRODUCTS = ['Academy', 'Intensive', 'NIAT']
 
 
 def validate_allocation_percentages(
@@ -38,30 +45,29 @@ def calculate_hours_from_percentage(percent: Decimal, baseline_hours: Decimal) -
 
 def process_allocation_to_records(
     allocation: PodLeadAllocationDTO,
-    source_file_id: int
+    source_file_id: int,
+    product_ids: Dict[str, int] = None
 ) -> List[Dict]:
     """
     Convert allocation percentages to ContributionRecord entries.
     
+    Args:
+        product_ids: Product IDs by name (looked up if not given)
+    
     Returns:
         List of ContributionRecordDTO dicts ready for creation
     """
-    from contributions.storages import (
-        product_storage, contribution_storage
-    )
+    if product_ids is None:
+        from contributions.storages import product_storage
+        product_ids = product_storage.get_product_ids_by_names(ALLOCATION_PRODUCTS)
     
     records = []
     
-    # Get product IDs
-    academy = product_storage.get_product_by_name('Academy')
-    intensive = product_storage.get_product_by_name('Intensive')
-    niat = product_storage.get_product_by_name('NIAT')
-    
     # Process each product with non-zero percentage
     products = [
-        (academy.id, allocation.academy_percent),
-        (intensive.id, allocation.intensive_percent),
-        (niat.id, allocation.niat_percent),
+        (product_ids['Academy'], allocation.academy_percent),
+        (product_ids['Intensive'], allocation.intensive_percent),
+        (product_ids['NIAT'], allocation.niat_percent),
     ]
     
     for product_id, percent in products:
@@ -82,9 +88,35 @@ def process_allocation_to_records(
     return records
 
 
+def build_allocation_records(
+    allocations: List[PodLeadAllocationDTO],
+    source_file_id: int
+) -> List[ContributionRecordDTO]:
+    """
+    Convert many allocations to contribution records in memory.
+    
+    Products and employees are looked up once for all allocations; each
+    record takes the department and pod of its employee.
+    """
+    from contributions.storages import product_storage, employee_storage
+    
+    product_ids = product_storage.get_product_ids_by_names(ALLOCATION_PRODUCTS)
+    employees = employee_storage.get_employees_by_ids(allocation.employee_id for allocation in allocations)
+    
+    records = []
+    for allocation in allocations:
+        employee = employees[allocation.employee_id]
+        for record_data in process_allocation_to_records(allocation, source_file_id, product_ids):
+            record_data['department_id'] = employee.department_id
+            record_data['pod_id'] = employee.pod_id
+            records.append(ContributionRecordDTO(**record_data))
+    return records
+
+
 def process_allocation_to_csv(
     allocations: List[PodLeadAllocationDTO],
-    month: date
+    month: date,
+    pod_id: Optional[int] = None
 ) -> Path:
     """
     Generate CSV in canonical template format from allocations.
@@ -99,12 +131,14 @@ def process_allocation_to_csv(
     intensive = product_storage.get_product_by_name('Intensive')
     niat = product_storage.get_product_by_name('NIAT')
     
+    # Get employee details for all allocations at once
+    employees = employee_storage.get_employees_by_ids(allocation.employee_id for allocation in allocations)
+    
     # Prepare CSV rows
     csv_rows = []
     
     for allocation in allocations:
-        # Get employee details
-        employee = employee_storage.get_employee_by_id(allocation.employee_id)
+        employee = employees[allocation.employee_id]
         
         # Create rows for each product with non-zero percentage
         products = [
@@ -144,7 +178,8 @@ def process_allocation_to_csv(
     uploads_dir.mkdir(parents=True, exist_ok=True)
     
     month_str = month.strftime('%Y-%m')
-    filename = f"pod_allocations_{month_str}.csv"
+    # One file per pod, so pods processed together do not overwrite each other
+    filename = f"pod_allocations_{pod_id}_{month_str}.csv" if pod_id is not None else f"pod_allocations_{month_str}.csv"
     file_path = uploads_dir / filename
     
     df.to_csv(file_path, index=False)
@@ -169,69 +204,133 @@ def process_all_pod_allocations(
         Dict with processing summary
     """
     from contributions.storages import (
-        pod_lead_allocation_storage, contribution_storage, raw_file_storage, employee_storage
+        pod_lead_allocation_storage, contribution_storage, raw_file_storage
     )
+    from contributions.services import metrics_cache_service
     
-    # Get submitted allocations
-    allocations = pod_lead_allocation_storage.get_submitted_allocations_by_pod(pod_id, month)
-    
-    if not allocations:
-        return {
-            'processed_count': 0,
-            'message': 'No submitted allocations found'
-        }
-    
-    if output_format == 'records':
-        # Create a dummy RawFile for source tracking
-        from contributions.storages import employee_storage, raw_file_storage
-        pod_lead = employee_storage.get_employee_by_id(allocations[0].pod_lead_id)
+    # One transaction per pod: records, rollups and statuses change together
+    with transaction.atomic():
+        # Lock the submitted allocations, so concurrent runs for the pod cannot process them twice
+        allocations = pod_lead_allocation_storage.get_submitted_allocations_by_pod(pod_id, month, lock=True)
         
-        raw_file = raw_file_storage.create_raw_file(
-            file_name=f"pod_allocations_{month.strftime('%Y-%m')}.csv",
-            storage_path=f"allocations/pod_{pod_id}_{month.strftime('%Y-%m')}.csv",
-            uploaded_by_id=pod_lead.id,
-            file_size=0,
-            checksum='',
-            parse_summary={'source': 'pod_lead_allocation', 'pod_id': pod_id, 'month': month.strftime('%Y-%m')}
-        )
+        if not allocations:
+            return {
+                'processed_count': 0,
+                'message': 'No submitted allocations found'
+            }
         
-        # Process each allocation to records
-        created_records = 0
-        for allocation in allocations:
-            records = process_allocation_to_records(allocation, raw_file.id)
+        if output_format == 'records':
+            # Create a dummy RawFile for source tracking
+            raw_file = raw_file_storage.create_raw_file(
+                file_name=f"pod_allocations_{month.strftime('%Y-%m')}.csv",
+                storage_path=f"allocations/pod_{pod_id}_{month.strftime('%Y-%m')}.csv",
+                uploaded_by_id=allocations[0].pod_lead_id,
+                file_size=0,
+                checksum=None,
+                parse_summary={'source': 'pod_lead_allocation', 'pod_id': pod_id, 'month': month.strftime('%Y-%m')}
+            )
             
-            for record_data in records:
-                # Get employee to fill department/pod
-                employee = employee_storage.get_employee_by_id(allocation.employee_id)
-                record_data['department_id'] = employee.department_id
-                record_data['pod_id'] = employee.pod_id
-                
-                # Create contribution record
-                contribution_storage.create_contribution_record(
-                    **record_data
-                )
-                created_records += 1
-            
-            # Mark allocation as processed
-            pod_lead_allocation_storage.mark_allocation_processed(allocation.id)
-        
-        return {
-            'processed_count': len(allocations),
-            'created_records': created_records,
-            'output_format': 'records'
-        }
-    
-    else:  # CSV format
-        # Generate CSV
-        csv_path = process_allocation_to_csv(allocations, month)
+            # Convert all allocations in memory and write them at once
+            records = build_allocation_records(allocations, raw_file.id)
+            created_records = contribution_storage.bulk_create_contributions(records, raw_file.id)
+            result = {
+                'processed_count': len(allocations),
+                'created_records': created_records,
+                'output_format': 'records'
+            }
+        else:  # CSV format
+            csv_path = process_allocation_to_csv(allocations, month, pod_id)
+            result = {
+                'processed_count': len(allocations),
+                'csv_path': str(csv_path.relative_to(Path(settings.MEDIA_ROOT))),
+                'output_format': 'csv'
+            }
         
-        # Mark allocations as processed
-        for allocation in allocations:
-            pod_lead_allocation_storage.mark_allocation_processed(allocation.id)
+        # Mark allocations as processed; a run that lost the race rolls back everything it wrote
+        allocation_ids = [allocation.id for allocation in allocations]
+        if pod_lead_allocation_storage.mark_allocations_processed(allocation_ids) != len(allocation_ids):
+            raise ValidationException(f"Allocations of pod {pod_id} were processed by another run")
         
-        return {
-            'processed_count': len(allocations),
-            'csv_path': str(csv_path.relative_to(Path(settings.MEDIA_ROOT))),
-            'output_format': 'csv'
-        }
+        if output_format == 'records':
+            # Invalidate cached dashboards of the processed month
+            metrics_cache_service.invalidate_month(month)
+    
+    return result
+
+
+def get_month_worker_count(pod_count: int, workers: Optional[int] = None) -> int:
+    """
+    Number of pods to process concurrently for a month.
+    
+    Defaults to ALLOCATION_PROCESSING_WORKERS. SQLite allows a single
+    writer at a time, so pods are always processed one after another there.
+    """
+    if workers is None:
+        workers = getattr(settings, 'ALLOCATION_PROCESSING_WORKERS', 4)
+    if connection.vendor == 'sqlite':
+        return 1
+    return max(1, min(workers, pod_count))
+
+
+def process_month_allocations(
+    month: date,
+    output_format: str = 'records',
+    workers: Optional[int] = None
+) -> Dict:
+    """
+    Process the SUBMITTED allocations of every pod for a month.
+    
+    Pods are processed on a bounded thread pool, each in its own
+    transaction (see process_all_pod_allocations), so a failing pod does
+    not roll back the others and the run takes about as long as the
+    slowest pod.
+    
+    Args:
+        month: Contribution month
+        output_format: 'records' or 'csv'
+        workers: Maximum pods processed concurrently (default: ALLOCATION_PROCESSING_WORKERS)
+    
+    Returns:
+        Dict with totals and a result per pod
+    """
+    from contributions.storages import pod_lead_allocation_storage
+    
+    pod_ids = pod_lead_allocation_storage.get_pod_ids_with_submitted_allocations(month)
+    worker_count = get_month_worker_count(len(pod_ids), workers)
+    
+    if worker_count <= 1:
+        results = [_process_pod(pod_id, month, output_format) for pod_id in pod_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix='allocation-worker') as executor:
+            futures = [
+                executor.submit(_process_pod, pod_id, month, output_format, close_connections=True)
+                for pod_id in pod_ids
+            ]
+            results = [future.result() for future in futures]
+    
+    succeeded = [result for result in results if result['status'] == 'SUCCESS']
+    return {
+        'month': month.strftime('%Y-%m'),
+        'output_format': output_format,
+        'pod_count': len(pod_ids),
+        'succeeded_count': len(succeeded),
+        'failed_count': len(results) - len(succeeded),
+        'processed_count': sum(result.get('processed_count', 0) for result in succeeded),
+        'created_records': sum(result.get('created_records', 0) for result in succeeded),
+        'pods': results,
+    }
+
 
+def _process_pod(pod_id: int, month: date, output_format: str, close_connections: bool = False) -> Dict:
+    """Process one pod of a month run, reporting a failure instead of raising it."""
+    if close_connections:
+        close_old_connections()
+    try:
+        result = process_all_pod_allocations(pod_id, month, output_format)
+        return {'pod_id': pod_id, 'status': 'SUCCESS', **result}
+    except Exception as e:
+        logger.exception("Processing allocations of pod %s for %s failed", pod_id, month)
+        return {'pod_id': pod_id, 'status': 'FAILED', 'error': str(e)}
+    finally:
+        if close_connections:
+            connections.close_all()
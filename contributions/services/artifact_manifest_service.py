@@ -0,0 +1,78 @@
+"""Service fingerprinting generated files so they are only rewritten when their input changes."""
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+MANIFEST_SUFFIX = '.manifest.json'
+
+
+def compute_fingerprint(*parts: Any) -> str:
+    """
+    SHA-256 over the JSON form of the inputs of a generated file.
+    
+    Parts are typically a format version plus the rows the file is built
+    from; dates and decimals are hashed through their string form.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def get_manifest_path(file_path: Path) -> Path:
+    """Sidecar manifest of a generated file (e.g. sheet.xlsx.manifest.json)."""
+    file_path = Path(file_path)
+    return file_path.with_name(file_path.name + MANIFEST_SUFFIX)
+
+
+def read_fingerprint(file_path: Path) -> Optional[str]:
+    """Fingerprint recorded for a generated file, or None if it has no readable manifest."""
+    try:
+        with open(get_manifest_path(file_path), 'r', encoding='utf-8') as f:
+            return json.load(f).get('fingerprint')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def is_up_to_date(file_path: Path, fingerprint: str) -> bool:
+    """Whether the file exists and was generated from input with this fingerprint."""
+    return Path(file_path).exists() and read_fingerprint(file_path) == fingerprint
+
+
+def write_artifact(file_path: Path, fingerprint: str, write: Callable[[Path], None]) -> bool:
+    """
+    Generate a file unless it is already up to date with its input.
+    
+    write(path) produces the file at a temporary path in the same
+    directory, which then replaces the target; the manifest is written
+    last, so an interrupted run leaves a mismatched manifest and the file
+    is generated again next time.
+    
+    Args:
+        file_path: Target file
+        fingerprint: Fingerprint of the input (see compute_fingerprint)
+        write: Function writing the file to the given path
+    
+    Returns:
+        True if the file was (re)generated, False if it was left untouched
+    """
+    file_path = Path(file_path)
+    if is_up_to_date(file_path, fingerprint):
+        return False
+    
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f".{file_path.stem}-{uuid.uuid4().hex}{file_path.suffix}")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, file_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    
+    manifest_path = get_manifest_path(file_path)
+    tmp_manifest = manifest_path.with_name(f".{manifest_path.name}-{uuid.uuid4().hex}")
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint}, f)
+    os.replace(tmp_manifest, manifest_path)
+    return True
@@ -0,0 +1,52 @@
+"""Service running jobs on a local background worker pool."""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from django.conf import settings
+from django.db import transaction, close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared worker pool (created on first use)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(getattr(settings, 'UPLOAD_WORKERS', 2), 1),
+                    thread_name_prefix='upload-worker'
+                )
+    return _executor
+
+
+def submit_after_commit(job: Callable, *args) -> None:
+    """
+    Run a job in the background once the current transaction commits.
+    
+    Jobs only see committed rows, so they are submitted from
+    transaction.on_commit. With UPLOAD_WORKERS = 0 the job runs inline
+    instead (e.g. for local debugging).
+    """
+    if getattr(settings, 'UPLOAD_WORKERS', 2) <= 0:
+        transaction.on_commit(lambda: _run_job(job, *args, close_connections=False))
+    else:
+        transaction.on_commit(lambda: get_executor().submit(_run_job, job, *args))
+
+
+def _run_job(job: Callable, *args, close_connections: bool = True) -> None:
+    """Run a job with its own database connection, logging failures."""
+    if close_connections:
+        close_old_connections()
+    try:
+        job(*args)
+    except Exception:
+        logger.exception("Background job %s%r failed", getattr(job, '__name__', job), args)
+    finally:
+        if close_connections:
+            connections.close_all()
@@ -0,0 +1,106 @@
+"""Service resolving parsed contribution rows to entities in bulk."""
+from typing import List, Dict, Tuple
+from contributions.services import metrics_cache_service, token_revocation_service
+from contributions.storages import (
+    department_storage, pod_storage, product_storage, feature_storage, employee_storage
+)
+from contributions.storages.storage_dto import ContributionRecordDTO, ContributionRowBatchDTO
+
+
+def build_contribution_records(
+    batches: List[ContributionRowBatchDTO],
+    source_file_id: int
+) -> Tuple[List[ContributionRecordDTO], Dict[str, int]]:
+    """
+    Upsert the entities referenced by parsed rows and build their contribution records.
+    
+    Distinct departments, pods, products, features and employees are
+    collected from all batches and resolved with a handful of IN lookups and
+    bulk writes per entity type, then every row is mapped to IDs in memory.
+    Entities end up in the same state as when upserting row by row: a
+    feature keeps the description of its first row, an employee takes the
+    details of their last row.
+    
+    Args:
+        batches: Validated row batches from file_parser_service
+        source_file_id: RawFile ID the records are created from
+    
+    Returns:
+        Tuple of (records, counts) where counts holds the number of distinct
+        employees, departments, pods, products and features referenced
+    """
+    rows = []
+    for batch in batches:
+        columns = batch.columns
+        empty = [''] * len(batch)
+        rows.extend(zip(
+            columns['employee_code'],
+            columns['employee_name'],
+            columns['email'],
+            columns['department'],
+            columns['pod'],
+            columns['product'],
+            columns.get('feature_name', empty),
+            columns.get('description', empty),
+            batch.contribution_months,
+            batch.effort_hours,
+        ))
+    
+    # Departments and products
+    department_ids = department_storage.bulk_get_or_create_department_ids(row[3] for row in rows)
+    product_ids = product_storage.bulk_get_or_create_product_ids(row[5] for row in rows)
+    
+    # Pods belong to the department of their row
+    pod_ids = pod_storage.bulk_get_or_create_pod_ids((row[4], department_ids[row[3]]) for row in rows)
+    
+    # Features are created with the description of the first row naming them
+    feature_descriptions = {}
+    for row in rows:
+        if row[6]:
+            feature_descriptions.setdefault((row[6], product_ids[row[5]]), row[7])
+    feature_ids = feature_storage.bulk_get_or_create_feature_ids(feature_descriptions)
+    
+    # Employees take the details of the last row they appear in
+    employees = {}
+    for row in rows:
+        department_id = department_ids[row[3]]
+        employees[row[0]] = {
+            'name': row[1],
+            'email': row[2],
+            'department_id': department_id,
+            'pod_id': pod_ids[(row[4], department_id)],
+        }
+    if token_revocation_service.is_stateless_authz_enabled():
+        token_revocation_service.revoke_employee_tokens(
+            employee_storage.get_employee_ids_with_changed_scope(employees)
+        )
+    employee_ids = employee_storage.bulk_upsert_employees(employees)
+    # Bulk writes send no signals; names and pod memberships may have changed
+    if employees:
+        metrics_cache_service.invalidate_all()
+    
+    records = []
+    for (employee_code, _, _, department, pod, product, feature_name, description,
+         contribution_month, effort_hours) in rows:
+        department_id = department_ids[department]
+        product_id = product_ids[product]
+        records.append(ContributionRecordDTO(
+            employee_id=employee_ids[employee_code],
+            department_id=department_id,
+            pod_id=pod_ids[(pod, department_id)],
+            product_id=product_id,
+            feature_id=feature_ids[(feature_name, product_id)] if feature_name else None,
+            contribution_month=contribution_month,
+            effort_hours=effort_hours,
+            description=description,
+            source_file_id=source_file_id,
+        ))
+    
+    counts = {
+        'employees': len(set(employee_ids.values())),
+        'departments': len(set(department_ids.values())),
+        'pods': len(set(pod_ids.values())),
+        'products': len(set(product_ids.values())),
+        'features': len(set(feature_ids.values())),
+    }
+    return records, counts
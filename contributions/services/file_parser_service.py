@@ -2,10 +2,31 @@
 import pandas as pd
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Iterator
 from pathlib import Path
 import re
+import numpy as np
+from openpyxl import load_workbook
+from pandas.io.parsers import TextParser
 from contributions.exceptions import InvalidFileFormatException, ValidationException
+from contributions.storages.storage_dto import ContributionRowBatchDTO
+from contributions.services import sheet_reader_service
+
+
+REQUIRED_COLUMNS = [
+    'employee_code', 'employee_name', 'email', 'department', 'pod',
+    'product', 'contribution_month', 'effort_hours'
+]
+OPTIONAL_COLUMNS = ['feature_name', 'description', 'reported_by', 'source']
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+MONTH_PATTERN = r'^\d{4}-\d{2}$'
+MONTH_REGEX = re.compile(MONTH_PATTERN)
+
+DEFAULT_CHUNK_ROWS = 5000
+
+# Bump whenever parsing or validation output changes; cached parse results of older versions are ignored
+PARSER_VERSION = 1
 
 
 def parse_excel_file(file_path: str) -> Tuple[List[Dict], List[Dict]]:
@@ -18,9 +39,26 @@ def parse_excel_file(file_path: str) -> Tuple[List[Dict], List[Dict]]:
     Returns:
         Tuple of (parsed_rows, errors)
     """
+    batches, errors = parse_contribution_batches(file_path)
+    rows = []
+    for batch in batches:
+        rows.extend(batch.to_rows())
+    return rows, errors
+
+
+def parse_contribution_batches(file_path: str) -> Tuple[List[ContributionRowBatchDTO], List[Dict]]:
+    """
+    Parse Excel or CSV file into validated columnar batches (one per sheet).
+    
+    Args:
+        file_path: Path to Excel or CSV file
+    
+    Returns:
+        Tuple of (batches, errors)
+    """
     try:
         file_path_obj = Path(file_path)
-        all_rows = []
+        all_batches = []
         all_errors = []
         
         # Detect file type - check if it's actually Excel even if extension is .csv
@@ -48,36 +86,7 @@ def parse_excel_file(file_path: str) -> Tuple[List[Dict], List[Dict]]:
                 except:
                     df = pd.read_csv(file_path, encoding='cp1252')
             
-            # Validate headers - feature_name, reported_by, and source are optional
-            required_columns = [
-                'employee_code', 'employee_name', 'email', 'department', 'pod',
-                'product', 'contribution_month', 'effort_hours'
-            ]
-            optional_columns = ['feature_name', 'description', 'reported_by', 'source']
-            
-            # Normalize column names (case-insensitive, strip whitespace)
-            df.columns = [col.strip().lower() for col in df.columns]
-            
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                all_errors.append({
-                    'sheet': 'CSV',
-                    'row': 0,
-                    'field': 'headers',
-                    'message': f"Missing required columns: {', '.join(missing_columns)}"
-                })
-            else:
-                # Process each row
-                for idx, row in df.iterrows():
-                    row_num = idx + 2  # CSV row number (1-indexed + header)
-                    normalized_row = normalize_row(row, df.columns)
-                    
-                    # Validate row
-                    validation_errors = validate_row(normalized_row, row_num, 'CSV')
-                    if validation_errors:
-                        all_errors.extend(validation_errors)
-                    else:
-                        all_rows.append(normalized_row)
+            sheet_results = [parse_sheet_frame(df, 'CSV')]
         else:
             # Handle Excel file
             excel_file = pd.ExcelFile(file_path)
@@ -88,131 +97,279 @@ def parse_excel_file(file_path: str) -> Tuple[List[Dict], List[Dict]]:
                 # If only Master sheet exists, process it anyway
                 sheets_to_process = excel_file.sheet_names
             
-            for sheet_name in sheets_to_process:
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                
-                # Validate headers - feature_name, reported_by, and source are optional
-                required_columns = [
-                    'employee_code', 'employee_name', 'email', 'department', 'pod',
-                    'product', 'contribution_month', 'effort_hours'
-                ]
-                optional_columns = ['feature_name', 'description', 'reported_by', 'source']
-                
-                # Normalize column names (case-insensitive, strip whitespace)
-                df.columns = [col.strip().lower() for col in df.columns]
-                
-                missing_columns = [col for col in required_columns if col not in df.columns]
-                if missing_columns:
-                    all_errors.append({
-                        'sheet': sheet_name,
-                        'row': 0,
-                        'field': 'headers',
-                        'message': f"Missing required columns: {', '.join(missing_columns)}"
-                    })
-                    continue
-                
-                # Process each row
-                for idx, row in df.iterrows():
-                    row_num = idx + 2  # Excel row number (1-indexed + header)
-                    normalized_row = normalize_row(row, df.columns)
-                    
-                    # Validate row
-                    validation_errors = validate_row(normalized_row, row_num, sheet_name)
-                    if validation_errors:
-                        all_errors.extend(validation_errors)
-                    else:
-                        all_rows.append(normalized_row)
+            # Sheets may be parsed in parallel; results come back in sheet order
+            sheet_results = sheet_reader_service.map_sheets(
+                file_path, sheets_to_process, _read_and_parse_sheet, workbook=excel_file
+            )
+        
+        for batch, errors in sheet_results:
+            all_errors.extend(errors)
+            if batch is not None and len(batch):
+                all_batches.append(batch)
         
-        return all_rows, all_errors
+        return all_batches, all_errors
     
     except Exception as e:
         raise InvalidFileFormatException(f"Error parsing file: {str(e)}")
 
 
-def normalize_row(row: pd.Series, headers: List[str]) -> Dict:
-    """Normalize a row to canonical format."""
-    normalized = {}
-    for header in headers:
-        value = row.get(header, '')
-        # Convert to string and strip whitespace
-        if pd.isna(value):
-            normalized[header] = ''
-        else:
-            normalized[header] = str(value).strip()
-    return normalized
+def iter_contribution_chunks(
+    file_path: str,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[Tuple[Optional[ContributionRowBatchDTO], List[Dict]]]:
+    """
+    Parse a file chunk by chunk, yielding (batch, errors) for up to chunk_rows rows at a time.
+    
+    XLSX workbooks are streamed with openpyxl in read-only mode, so only one
+    chunk of rows is held in memory at a time. Sheets, row numbers and error
+    order are the same as with parse_contribution_batches. Cells are not
+    type-inferred per column, so a whole number in a column of decimals
+    reads as "8" rather than "8.0". Other formats are parsed whole and
+    yielded a sheet at a time.
+    
+    Args:
+        file_path: Path to Excel or CSV file
+        chunk_rows: Maximum number of sheet rows per chunk
+    
+    Yields:
+        Tuple of (batch of valid rows or None, errors)
+    """
+    if not _is_xlsx(file_path):
+        batches, errors = parse_contribution_batches(file_path)
+        yield None, errors
+        for batch in batches:
+            yield batch, []
+        return
+    
+    try:
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            # Skip "Master" sheet if it exists (it's usually a summary), unless it is the only one
+            sheets_to_process = [s for s in workbook.sheetnames if s.lower() != 'master']
+            if not sheets_to_process:
+                sheets_to_process = workbook.sheetnames
+            
+            for sheet_name in sheets_to_process:
+                yield from _iter_sheet_chunks(workbook[sheet_name], sheet_name, chunk_rows)
+        finally:
+            workbook.close()
+    except Exception as e:
+        raise InvalidFileFormatException(f"Error parsing file: {str(e)}")
 
 
-def validate_row(row_dict: Dict, row_num: int, sheet_name: str) -> List[Dict]:
-    """Validate a row and return list of errors."""
-    errors = []
+def _iter_sheet_chunks(sheet, sheet_name: str, chunk_rows: int) -> Iterator[Tuple[Optional[ContributionRowBatchDTO], List[Dict]]]:
+    """Validate the rows of a read-only worksheet in chunks."""
+    # Stored dimensions can be wrong in read-only mode; read every row instead
+    sheet.reset_dimensions()
+    rows = map(_trim_row, sheet.iter_rows(values_only=True))
     
-    # Required fields
-    required_fields = [
-        'employee_code', 'employee_name', 'email', 'department', 'pod',
-        'product', 'contribution_month', 'effort_hours'
-    ]
-    
-    for field in required_fields:
-        if not row_dict.get(field) or row_dict[field] == '':
-            errors.append({
+    header = next(rows, None)
+    if not header:
+        # Same as pd.read_excel: no usable header means every column is missing
+        yield parse_sheet_frame(pd.DataFrame(), sheet_name)
+        return
+    
+    first_row = 2  # 1-indexed + header
+    chunk = []
+    parsed_any = False
+    for values in _pad_rows(rows, len(header)):
+        chunk.append(values)
+        if len(chunk) >= chunk_rows:
+            batch, errors = _parse_chunk(header, chunk, sheet_name, first_row)
+            yield batch, errors
+            if batch is None:
+                return
+            first_row += len(chunk)
+            chunk = []
+            parsed_any = True
+    
+    if chunk or not parsed_any:
+        yield _parse_chunk(header, chunk, sheet_name, first_row)
+
+
+def _pad_rows(rows: Iterator[list], width: int) -> Iterator[list]:
+    """
+    Fit data rows to the header width.
+    
+    Blank rows are kept (and fail validation) like with pd.read_excel,
+    except for trailing ones; cells beyond the header are dropped.
+    """
+    blank_rows = 0
+    for values in rows:
+        if not values:
+            blank_rows += 1
+            continue
+        for _ in range(blank_rows):
+            yield [''] * width
+        blank_rows = 0
+        yield values[:width] + [''] * (width - len(values))
+
+
+def _parse_chunk(header: list, chunk: List[list], sheet_name: str, first_row: int) -> Tuple[Optional[ContributionRowBatchDTO], List[Dict]]:
+    """Build a frame from raw sheet rows the way pd.read_excel would, and validate it."""
+    df = TextParser([header] + chunk, header=0, dtype=object).read()
+    return parse_sheet_frame(df, sheet_name, first_row=first_row)
+
+
+def _trim_row(row: tuple) -> list:
+    """Convert openpyxl cell values like pandas does, dropping trailing empty cells."""
+    values = []
+    for value in row:
+        if value is None:
+            value = ''
+        elif isinstance(value, float) and value.is_integer():
+            value = int(value)
+        values.append(value)
+    while values and values[-1] == '':
+        values.pop()
+    return values
+
+
+def _is_xlsx(file_path: str) -> bool:
+    """Whether a file is an XLSX (ZIP) workbook, whatever its extension."""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(2) == b'PK'
+    except OSError:
+        return False
+
+
+def _read_and_parse_sheet(workbook, sheet_name: str) -> Tuple[Optional[ContributionRowBatchDTO], List[Dict]]:
+    """Read one sheet of a workbook (path or pd.ExcelFile) and validate it."""
+    return parse_sheet_frame(pd.read_excel(workbook, sheet_name=sheet_name), sheet_name)
+
+
+def parse_sheet_frame(
+    df: pd.DataFrame,
+    sheet_name: str,
+    first_row: int = 2
+) -> Tuple[Optional[ContributionRowBatchDTO], List[Dict]]:
+    """
+    Validate one sheet (or a chunk of one) column by column.
+    
+    Every check runs as a mask over the whole column; error records are
+    produced per row in the same order as a row-by-row validation would.
+    
+    Args:
+        df: Sheet rows with the header as column names
+        sheet_name: Sheet name reported in errors
+        first_row: Sheet row number of the first frame row (2 = right after the header)
+    
+    Returns:
+        Tuple of (batch of valid rows or None if headers are missing, errors)
+    """
+    # Normalize column names (case-insensitive, strip whitespace)
+    df.columns = [col.strip().lower() for col in df.columns]
+    
+    # Validate headers - feature_name, reported_by, and source are optional
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing_columns:
+        return None, [{
+            'sheet': sheet_name,
+            'row': 0,
+            'field': 'headers',
+            'message': f"Missing required columns: {', '.join(missing_columns)}"
+        }]
+    
+    # Normalize every cell to a stripped string ('' for empty cells)
+    text = {header: _normalize_column(df[header]) for header in df.columns}
+    row_numbers = np.arange(len(df), dtype=np.int64) + first_row
+    
+    # (row position, check order, error) triples, sorted into row order at the end
+    failures = []
+    check_order = 0
+    
+    def add_failures(mask: np.ndarray, field: str, message) -> None:
+        for position in np.flatnonzero(mask).tolist():
+            failures.append((position, check_order, {
                 'sheet': sheet_name,
-                'row': row_num,
+                'row': int(row_numbers[position]),
                 'field': field,
-                'message': f"{field} is required"
-            })
+                'message': message(position),
+            }))
+    
+    # Required fields
+    for field in REQUIRED_COLUMNS:
+        add_failures((text[field] == '').to_numpy(), field, lambda position, field=field: f"{field} is required")
+        check_order += 1
     
     # Validate email format
-    email = row_dict.get('email', '')
-    if email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-        errors.append({
-            'sheet': sheet_name,
-            'row': row_num,
-            'field': 'email',
-            'message': f"Invalid email format: {email}"
-        })
-    
-    # Validate contribution_month format (YYYY-MM)
-    month_str = row_dict.get('contribution_month', '')
-    if month_str:
-        try:
-            # Try parsing as YYYY-MM
-            if isinstance(month_str, str):
-                if not re.match(r'^\d{4}-\d{2}$', month_str):
-                    errors.append({
-                        'sheet': sheet_name,
-                        'row': row_num,
-                        'field': 'contribution_month',
-                        'message': f"Invalid month format: {month_str}. Expected YYYY-MM"
-                    })
-        except Exception:
-            errors.append({
-                'sheet': sheet_name,
-                'row': row_num,
-                'field': 'contribution_month',
-                'message': f"Invalid month format: {month_str}"
-            })
-    
-    # Validate effort_hours (numeric, non-negative)
-    hours_str = row_dict.get('effort_hours', '')
-    if hours_str:
-        try:
-            hours = Decimal(str(hours_str))
-            if hours < 0:
-                errors.append({
-                    'sheet': sheet_name,
-                    'row': row_num,
-                    'field': 'effort_hours',
-                    'message': f"effort_hours must be non-negative: {hours}"
-                })
-        except (ValueError, InvalidOperation):
-            errors.append({
-                'sheet': sheet_name,
-                'row': row_num,
-                'field': 'effort_hours',
-                'message': f"Invalid effort_hours: {hours_str}. Must be numeric"
-            })
+    email = text['email']
+    invalid_email = (email != '') & ~email.str.match(EMAIL_PATTERN)
+    add_failures(invalid_email.to_numpy(), 'email', lambda position: f"Invalid email format: {email.iat[position]}")
+    check_order += 1
+    
+    # Validate contribution_month format (YYYY-MM) and resolve it to a date
+    month_text = text['contribution_month']
+    month_values = {value: _parse_month(value) for value in month_text[month_text != ''].unique()}
+    months = month_text.map(month_values)
+    invalid_month = ((month_text != '') & months.isna()).to_numpy()
+    add_failures(
+        invalid_month, 'contribution_month',
+        lambda position: f"Invalid month format: {month_text.iat[position]}. Expected YYYY-MM"
+    )
+    check_order += 1
+    
+    # Validate effort_hours (numeric, non-negative), parsing each distinct value once
+    hours_text = text['effort_hours']
+    hours_values = {value: _parse_hours(value) for value in hours_text[hours_text != ''].unique()}
+    hours = hours_text.map(hours_values)
+    invalid_hours = ((hours_text != '') & hours.isna()).to_numpy()
+    negative_hours = np.fromiter(
+        (isinstance(value, Decimal) and value < 0 for value in hours.tolist()),
+        dtype=bool,
+        count=len(hours)
+    )
+    add_failures(
+        invalid_hours, 'effort_hours',
+        lambda position: f"Invalid effort_hours: {hours_text.iat[position]}. Must be numeric"
+    )
+    add_failures(
+        negative_hours, 'effort_hours',
+        lambda position: f"effort_hours must be non-negative: {hours.iat[position]}"
+    )
     
-    return errors
+    failures.sort(key=lambda failure: (failure[0], failure[1]))
+    errors = [failure[2] for failure in failures]
+    
+    valid = np.ones(len(df), dtype=bool)
+    if failures:
+        valid[[failure[0] for failure in failures]] = False
+    
+    batch = ContributionRowBatchDTO(
+        sheet_name=sheet_name,
+        row_numbers=row_numbers[valid].tolist(),
+        columns={header: values[valid].tolist() for header, values in text.items()},
+        contribution_months=months[valid].tolist(),
+        effort_hours=hours[valid].tolist(),
+    )
+    return batch, errors
+
+
+def _normalize_column(column: pd.Series) -> pd.Series:
+    """Convert a column to stripped strings, with empty cells as ''."""
+    missing = column.isna()
+    normalized = column.astype(object).where(~missing, '').map(str).str.strip()
+    return normalized.reset_index(drop=True)
+
+
+def _parse_month(value: str) -> Optional[date]:
+    """Parse a YYYY-MM value, returning None if it is not a valid month."""
+    if not MONTH_REGEX.match(value):
+        return None
+    try:
+        return normalize_month(value)
+    except ValidationException:
+        return None
+
+
+def _parse_hours(value: str) -> Optional[Decimal]:
+    """Parse an effort_hours value, returning None if it is not numeric."""
+    try:
+        hours = Decimal(value)
+    except (ValueError, InvalidOperation):
+        return None
+    return None if hours.is_nan() else hours
 
 
 def normalize_month(month_str: str) -> date:
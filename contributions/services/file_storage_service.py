@@ -1,19 +1,36 @@
 """File storage service for handling uploaded files."""
 import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
 from django.conf import settings
-from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
 import hashlib
 
 
-def save_uploaded_file(file, check_duplicate: bool = True) -> tuple[str, int, str]:
+CHUNK_SIZE = 64 * 1024
+
+# Uploads are stored by content under MEDIA_ROOT/blobs/<first 2 hex chars>/<sha256><extension>
+# (the extension is kept since parsers detect the file type from it)
+BLOB_DIR = 'blobs'
+BLOB_TMP_DIR = 'tmp'
+
+
+def save_uploaded_file(file, check_duplicate: bool = True, validate_checksum=None) -> tuple[str, int, str]:
     """
-    Save uploaded file to media directory.
+    Save uploaded file to the content-addressed blob store.
+    
+    The file is read once, chunk by chunk, into a temporary file next to the
+    blobs while its size and SHA-256 checksum are computed, then moved to
+    its blob path. If the blob already exists the copy is dropped, so
+    uploading the same content again takes no extra disk space.
     
     Args:
         file: File object to save
-        check_duplicate: If True, check for existing file with same checksum before saving
+        check_duplicate: If True, return the existing file when one with the
+            same checksum is already recorded
+        validate_checksum: Called with the checksum before the file is stored;
+            if it raises, the temporary file is discarded and nothing is stored
     
     Returns:
         Tuple of (storage_path, file_size, checksum)
@@ -24,70 +41,184 @@ def save_uploaded_file(file, check_duplicate: bool = True) -> tuple[str, int, st
         # Try to get from request if available
         file_name = 'uploaded_file.xlsx'
     
-    # Read file content first to calculate checksum
-    file_content = b''
-    if hasattr(file, 'read'):
-        file.seek(0)  # Reset file pointer
-        file_content = file.read()
-        file.seek(0)  # Reset again for later use
-    elif hasattr(file, 'chunks'):
-        for chunk in file.chunks():
-            file_content += chunk
-    
-    # Calculate checksum from content (before saving)
-    import tempfile
-    with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-        tmp_file.write(file_content)
+    tmp_dir = get_blob_root() / BLOB_TMP_DIR
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Write to disk, hashing and counting on the way
+    hash_sha256 = hashlib.sha256()
+    file_size = 0
+    with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp_file:
         tmp_path = Path(tmp_file.name)
-        checksum = calculate_checksum(tmp_path)
-        tmp_path.unlink()  # Delete temp file
+        try:
+            for chunk in iter_file_chunks(file):
+                hash_sha256.update(chunk)
+                file_size += len(chunk)
+                tmp_file.write(chunk)
+        except BaseException:
+            tmp_file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+    checksum = hash_sha256.hexdigest()
+    
+    if validate_checksum is not None:
+        try:
+            validate_checksum(checksum)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     # Check for duplicate if enabled
     if check_duplicate:
         from contributions.storages import raw_file_storage
         existing_file = raw_file_storage.get_raw_file_by_checksum(checksum)
         if existing_file:
-            # Return existing file path instead of creating duplicate
+            # Discard the copy and return the existing file instead
+            tmp_path.unlink()
             return existing_file.storage_path, existing_file.file_size, existing_file.checksum
     
-    # Generate unique filename
-    filename = generate_unique_filename(file_name)
+    return _move_to_blob(tmp_path, get_blob_storage_path(checksum, file_name)), file_size, checksum
+
+
+def store_local_file(file_path: Path, checksum: str) -> str:
+    """
+    Add a file on local disk to the blob store.
+    
+    Files already under MEDIA_ROOT are hard-linked into place; anything
+    else is copied, so later edits to the source cannot change the blob.
+    
+    Args:
+        file_path: File to store
+        checksum: SHA-256 checksum of the file (from calculate_checksum)
     
-    # Create uploads directory if it doesn't exist
-    upload_dir = Path(settings.MEDIA_ROOT) / 'uploads'
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    Returns:
+        Storage path of the blob, relative to MEDIA_ROOT
+    """
+    relative_path = get_blob_storage_path(checksum, Path(file_path).name)
+    blob_path = Path(settings.MEDIA_ROOT) / relative_path
+    if blob_path.exists():
+        return relative_path
     
-    # Save file
-    file_path = upload_dir / filename
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+    if Path(file_path).resolve().is_relative_to(Path(settings.MEDIA_ROOT).resolve()):
+        try:
+            os.link(file_path, blob_path)
+            return relative_path
+        except FileExistsError:
+            return relative_path
+        except OSError:
+            pass  # e.g. a different filesystem, fall back to copying
     
-    # Write to disk
-    with open(file_path, 'wb') as f:
-        f.write(file_content)
+    tmp_dir = get_blob_root() / BLOB_TMP_DIR
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp_file:
+        tmp_path = Path(tmp_file.name)
+    shutil.copyfile(file_path, tmp_path)
+    return _move_to_blob(tmp_path, relative_path)
+
+
+def _move_to_blob(tmp_path: Path, relative_path: str) -> str:
+    """Move a fully written temporary file to its blob path, dropping it if the blob exists."""
+    blob_path = Path(settings.MEDIA_ROOT) / relative_path
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+    if blob_path.exists():
+        tmp_path.unlink()
+    else:
+        os.replace(tmp_path, blob_path)
+    return relative_path
+
+
+def get_blob_root() -> Path:
+    """Get the directory holding the blob store."""
+    return Path(settings.MEDIA_ROOT) / BLOB_DIR
+
+
+def get_blob_storage_path(checksum: str, file_name: str) -> str:
+    """Get the storage path (relative to MEDIA_ROOT) of the blob for a checksum and file name."""
+    extension = os.path.splitext(file_name)[1].lower()
+    return f"{BLOB_DIR}/{checksum[:2]}/{checksum}{extension}"
+
+
+def collect_unreferenced_blobs(min_age_seconds: int, dry_run: bool = False) -> dict:
+    """
+    Delete blobs no raw file references any more.
+    
+    Reference counts come from RawFile.storage_path. Cached parse results
+    are kept while their blob is referenced and their parser version is
+    current. Blobs (and leftover temporary files) younger than
+    min_age_seconds are kept, since an upload in progress stores its blob
+    before its RawFile is created.
+    
+    Args:
+        min_age_seconds: Minimum age of an unreferenced blob before it is deleted
+        dry_run: If True, only report what would be deleted
+    
+    Returns:
+        Dict with referenced, deleted and kept_recent blob counts and bytes_freed
+    """
+    from contributions.storages import raw_file_storage
+    from contributions.services import parse_cache_service
+    references = raw_file_storage.count_raw_files_by_storage_path(f"{BLOB_DIR}/")
+    referenced_checksums = {Path(storage_path).name.split('.')[0] for storage_path in references}
+    media_root = Path(settings.MEDIA_ROOT)
+    cutoff = time.time() - min_age_seconds
     
-    # Calculate file size
-    file_size = file_path.stat().st_size
+    result = {'referenced': 0, 'deleted': 0, 'kept_recent': 0, 'bytes_freed': 0}
+    blob_root = get_blob_root()
+    if not blob_root.exists():
+        return result
     
-    # Return relative path from MEDIA_ROOT
-    relative_path = f"uploads/{filename}"
+    for path in blob_root.glob('*/*'):
+        # Cached parse results (and their temporary copies) are directories
+        is_cache_dir = path.is_dir() and parse_cache_service.is_cache_file(path.name)
+        if not (path.is_file() or is_cache_dir):
+            continue
+        if path.parent.name == BLOB_TMP_DIR:
+            referenced = False
+        elif parse_cache_service.is_cache_file(path.name):
+            referenced = parse_cache_service.get_cache_file_checksum(path.name) in referenced_checksums
+        else:
+            referenced = references.get(path.relative_to(media_root).as_posix(), 0) > 0
+        if referenced:
+            result['referenced'] += 1
+            continue
+        
+        # ctime also moves when a blob is hard-linked into place
+        stat = path.stat()
+        if max(stat.st_mtime, stat.st_ctime) > cutoff:
+            result['kept_recent'] += 1
+            continue
+        
+        result['deleted'] += 1
+        if is_cache_dir:
+            result['bytes_freed'] += sum(file.stat().st_size for file in path.iterdir())
+            if not dry_run:
+                shutil.rmtree(path, ignore_errors=True)
+            continue
+        result['bytes_freed'] += stat.st_size
+        if not dry_run:
+            path.unlink(missing_ok=True)
     
-    return relative_path, file_size, checksum
+    return result
 
 
-def generate_unique_filename(original_name: str) -> str:
-    """Generate unique filename with timestamp prefix."""
-    from datetime import datetime
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-    name, ext = os.path.splitext(original_name)
-    return f"{timestamp}_{name}{ext}"
+def iter_file_chunks(file):
+    """Iterate over the content of an uploaded (or plain) file object in chunks."""
+    if hasattr(file, 'chunks'):
+        # Django File objects rewind themselves
+        yield from file.chunks(chunk_size=CHUNK_SIZE)
+        return
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    yield from iter(lambda: file.read(CHUNK_SIZE), b'')
 
 
 def calculate_checksum(file_path: Path) -> str:
-    """Calculate MD5 checksum of file."""
-    hash_md5 = hashlib.md5()
+    """Calculate SHA-256 checksum of file."""
+    hash_sha256 = hashlib.sha256()
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            hash_sha256.update(chunk)
+    return hash_sha256.hexdigest()
 
 
 def get_file_path_by_id(raw_file_id: int) -> Path:
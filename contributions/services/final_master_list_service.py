@@ -1,11 +1,34 @@
 """Service for generating final master list from processed allocations."""
-import pandas as pd
+import csv
+from itertools import groupby
 from pathlib import Path
 from datetime import date
 from decimal import Decimal
-from typing import Dict
+from typing import Iterator, List
+import pandas as pd
 from django.conf import settings
-from contributions.storages import pod_lead_allocation_storage, employee_storage, department_storage
+from contributions.services import artifact_manifest_service, xlsx_export_service
+from contributions.storages import pod_lead_allocation_storage
+
+# Bump when the master list layout changes so existing lists are regenerated
+MASTER_LIST_FORMAT_VERSION = 1
+
+MASTER_LIST_HEADERS = [
+    'employee_code', 'employee_name', 'email', 'department', 'pod',
+    'product', 'description', 'contribution_month', 'effort_hours'
+]
+
+# Department listed for employees without one
+UNKNOWN_DEPARTMENT = 'Unknown'
+
+# Allocations read from the database per round trip when streaming
+STREAM_CHUNK_SIZE = 2000
+
+PRODUCT_PERCENT_COLUMNS = [
+    ('Academy', 'academy_percent'),
+    ('Intensive', 'intensive_percent'),
+    ('NIAT', 'niat_percent'),
+]
 
 
 def generate_final_master_list(month: date) -> Path:
@@ -17,54 +40,24 @@ def generate_final_master_list(month: date) -> Path:
     description, contribution_month, effort_hours
     
     Steps:
-    1. Get all PROCESSED allocations for month
-    2. For each allocation:
-       - Calculate effort_hours = (percent / 100) * baseline_hours
-       - Create row with product-specific data
-    3. Combine all rows
-    4. Generate XLSX with multiple sheets (one per department)
-    5. Save to media/final_master_lists/
+    1. Get all PROCESSED allocations for month with their employees,
+       departments and pods in one query
+    2. Build one row per allocation and product with non-zero percentage,
+       effort_hours = (percent / 100) * baseline_hours (build_master_list_frame)
+    3. Generate XLSX with multiple sheets (one per department)
+    4. Save to media/final_master_lists/ (only if the rows changed since
+       the file was last generated)
     
     Returns:
         Path to generated master list file
     """
-    # Get all processed allocations
-    allocations = pod_lead_allocation_storage.get_processed_allocations_by_month(month)
+    # Get all processed allocations with their employee, department and pod (one query)
+    rows = pod_lead_allocation_storage.get_processed_allocation_rows(month)
     
-    if not allocations:
+    if not rows:
         raise ValueError(f"No processed allocations found for month {month.strftime('%Y-%m')}")
     
-    # Group by department
-    department_data = {}
-    
-    for alloc in allocations:
-        employee = employee_storage.get_employee_by_id(alloc.employee_id)
-        dept_name = employee.department_name or 'Unknown'
-        
-        if dept_name not in department_data:
-            department_data[dept_name] = []
-        
-        # Calculate hours for each product with non-zero percentage
-        products = [
-            ('Academy', alloc.academy_percent),
-            ('Intensive', alloc.intensive_percent),
-            ('NIAT', alloc.niat_percent),
-        ]
-        
-        for product_name, percent in products:
-            if percent > Decimal('0'):
-                hours = (percent / Decimal('100')) * alloc.baseline_hours
-                department_data[dept_name].append({
-                    'employee_code': alloc.employee_code,
-                    'employee_name': alloc.employee_name,
-                    'email': employee.email,
-                    'department': dept_name,
-                    'pod': employee.pod_name or '',
-                    'product': product_name,
-                    'description': alloc.product_description or '',
-                    'contribution_month': month.strftime('%Y-%m'),
-                    'effort_hours': float(hours)
-                })
+    master = build_master_list_frame(pd.DataFrame.from_records(rows), month)
     
     # Create directory if it doesn't exist
     master_list_dir = Path(settings.MEDIA_ROOT) / 'final_master_lists'
@@ -75,34 +68,144 @@ def generate_final_master_list(month: date) -> Path:
     filename = f"final_master_list_{month_str}.xlsx"
     file_path = master_list_dir / filename
     
-    # Check if file already exists - reuse it to prevent duplicates
-    if file_path.exists():
-        # File exists, return existing path (no overwrite)
-        return file_path
-    
     # Generate XLSX with multiple sheets (one per department)
-    headers = [
-        'employee_code', 'employee_name', 'email', 'department', 'pod',
-        'product', 'description', 'contribution_month', 'effort_hours'
-    ]
-    
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        # Create Master sheet with all data
-        all_data = []
-        for dept_name, rows in department_data.items():
-            all_data.extend(rows)
+    headers = MASTER_LIST_HEADERS
+    
+    def write(path: Path) -> None:
+        # Master sheet with all data, then a sheet for each department
+        sheets = [('Master', headers, master.itertuples(index=False, name=None))]
+        for dept_name, dept_rows in master.groupby('department', sort=False):
+            sheets.append((_department_sheet_name(dept_name), headers, dept_rows.itertuples(index=False, name=None)))
+        xlsx_export_service.write_xlsx(path, sheets)
+    
+    # Rewrite the list only if its content changed since it was last generated
+    fingerprint = artifact_manifest_service.compute_fingerprint(
+        MASTER_LIST_FORMAT_VERSION, headers, master.values.tolist()
+    )
+    artifact_manifest_service.write_artifact(file_path, fingerprint, write)
+    
+    return file_path
+
+
+def build_master_list_frame(allocations: pd.DataFrame, month: date) -> pd.DataFrame:
+    """
+    Turn processed allocation rows into master list rows (MASTER_LIST_HEADERS columns).
+    
+    Each allocation gives one row per product with a non-zero percentage,
+    in Academy, Intensive, NIAT order; rows are grouped by department in
+    order of first appearance. effort_hours = (percent / 100) * baseline
+    is computed on whole hundredths (both fields have two decimals), so
+    every value is the correctly rounded float of the exact Decimal result.
+    
+    Args:
+        allocations: Rows from get_processed_allocation_rows
+        month: Contribution month
+    """
+    departments = allocations['department_name'].fillna('')
+    base = pd.DataFrame({
+        'employee_code': allocations['employee_code'],
+        'employee_name': allocations['employee_name'],
+        'email': allocations['email'],
+        'department': departments.mask(departments == '', UNKNOWN_DEPARTMENT),
+        'pod': allocations['pod_name'].fillna(''),
+        'description': allocations['product_description'].fillna(''),
+        'contribution_month': month.strftime('%Y-%m'),
+    })
+    baseline = _to_hundredths(allocations['baseline_hours'])
+    
+    product_rows = []
+    for product_order, (product_name, column) in enumerate(PRODUCT_PERCENT_COLUMNS):
+        percent = _to_hundredths(allocations[column])
+        rows = base.assign(
+            product=product_name,
+            effort_hours=(percent * baseline) / 1e6,
+            product_order=product_order,
+        )
+        product_rows.append(rows[percent > 0])
+    
+    master = pd.concat(product_rows).rename_axis('allocation').reset_index()
+    master = master.sort_values(['allocation', 'product_order'], kind='stable')
+    
+    # Group departments in order of first appearance
+    department_order = pd.Categorical(master['department'], categories=pd.unique(master['department']))
+    master = master.iloc[department_order.codes.argsort(kind='stable')]
+    return master[MASTER_LIST_HEADERS].reset_index(drop=True)
+
+
+def _to_hundredths(values: pd.Series) -> pd.Series:
+    """Two-decimal values as exact integer hundredths."""
+    return (values.astype(float) * 100).round().astype('int64')
+
+
+def iter_master_list_rows(month: date) -> Iterator[List]:
+    """
+    Yield master list rows (in MASTER_LIST_HEADERS order) straight from the database.
+    
+    Allocations are read in chunks of STREAM_CHUNK_SIZE, so memory does
+    not depend on the size of the month. Rows are grouped by department.
+    """
+    month_str = month.strftime('%Y-%m')
+    allocations = pod_lead_allocation_storage.iter_processed_allocation_rows(
+        month, STREAM_CHUNK_SIZE, default_department_name=UNKNOWN_DEPARTMENT
+    )
+    for alloc in allocations:
+        dept_name = alloc['department_name'] or UNKNOWN_DEPARTMENT
         
-        if all_data:
-            master_df = pd.DataFrame(all_data, columns=headers)
-            master_df.to_excel(writer, sheet_name='Master', index=False)
+        # One row for each product with non-zero percentage
+        products = [
+            ('Academy', alloc['academy_percent']),
+            ('Intensive', alloc['intensive_percent']),
+            ('NIAT', alloc['niat_percent']),
+        ]
         
-        # Create sheet for each department
-        for dept_name, rows in department_data.items():
-            if rows:
-                dept_df = pd.DataFrame(rows, columns=headers)
-                # Clean sheet name (Excel has 31 char limit)
-                sheet_name = dept_name[:31] if len(dept_name) <= 31 else dept_name[:28] + '...'
-                dept_df.to_excel(writer, sheet_name=sheet_name, index=False)
+        for product_name, percent in products:
+            if percent > Decimal('0'):
+                hours = (percent / Decimal('100')) * alloc['baseline_hours']
+                yield [
+                    alloc['employee_code'],
+                    alloc['employee_name'],
+                    alloc['email'],
+                    dept_name,
+                    alloc['pod_name'] or '',
+                    product_name,
+                    alloc['product_description'] or '',
+                    month_str,
+                    float(hours),
+                ]
+
+
+def stream_master_list_xlsx(month: date) -> Iterator[bytes]:
+    """
+    Stream the master list as XLSX: a Master sheet, then one sheet per department.
     
-    return file_path
+    The allocations are read twice (once for the Master sheet, once for
+    the department sheets), each time as a chunked stream.
+    """
+    department_index = MASTER_LIST_HEADERS.index('department')
+    
+    def sheets():
+        yield 'Master', MASTER_LIST_HEADERS, iter_master_list_rows(month)
+        for dept_name, rows in groupby(iter_master_list_rows(month), key=lambda row: row[department_index]):
+            yield _department_sheet_name(dept_name), MASTER_LIST_HEADERS, rows
+    
+    return xlsx_export_service.stream_xlsx(sheets())
+
+
+def stream_master_list_csv(month: date) -> Iterator[str]:
+    """Stream the master list as CSV lines (all departments in one table)."""
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(MASTER_LIST_HEADERS)
+    for row in iter_master_list_rows(month):
+        yield writer.writerow(row)
+
 
+def _department_sheet_name(dept_name: str) -> str:
+    """Clean sheet name (Excel has 31 char limit)."""
+    return dept_name[:31] if len(dept_name) <= 31 else dept_name[:28] + '...'
+
+
+class _LineBuffer:
+    """File-like object handing each line written by csv.writer back to the caller."""
+    
+    def write(self, value: str) -> str:
+        return value
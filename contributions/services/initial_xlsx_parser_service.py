@@ -1,10 +1,11 @@
 """Service for parsing initial XLSX file with product/description data."""
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from contributions.exceptions import ValidationException
+from contributions.services import sheet_reader_service
 
 
 def parse_initial_xlsx(file_path: str) -> Tuple[Dict[str, Dict], List[Dict]]:
@@ -65,117 +66,21 @@ def parse_initial_xlsx(file_path: str) -> Tuple[Dict[str, Dict], List[Dict]]:
                 })
                 return employee_data, errors
             
-            # Process each team/department sub-sheet
-            for sheet_name in sub_sheets:
-                
-                df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                
-                # Normalize column names
-                df.columns = [col.strip().lower() for col in df.columns]
-                
-                # Required columns
-                required_columns = ['employee_code', 'product', 'description', 'contribution_month']
-                missing_columns = [col for col in required_columns if col not in df.columns]
-                
-                if missing_columns:
-                    errors.append({
-                        'sheet': sheet_name,
-                        'row': 0,
-                        'field': 'headers',
-                        'message': f"Missing required columns: {', '.join(missing_columns)}"
-                    })
-                    continue
-                
-                # Process each row
-                for idx, row in df.iterrows():
-                    row_num = idx + 2  # Excel row number (1-indexed + header)
-                    row_errors = []
-                    
-                    # Extract fields
-                    employee_code = str(row.get('employee_code', '')).strip()
-                    employee_name = str(row.get('employee_name', '')).strip() if pd.notna(row.get('employee_name')) else ''
-                    email = str(row.get('email', '')).strip() if pd.notna(row.get('email')) else ''
-                    department = str(row.get('department', '')).strip() if pd.notna(row.get('department')) else ''
-                    pod = str(row.get('pod', '')).strip() if pd.notna(row.get('pod')) else ''
-                    product = str(row.get('product', '')).strip()
-                    description = str(row.get('description', '')).strip() if pd.notna(row.get('description')) else ''
-                    contribution_month = str(row.get('contribution_month', '')).strip()
-                    effort_hours = row.get('effort_hours', 0)
-                    
-                    # Validate required fields
-                    if not employee_code:
-                        row_errors.append({
-                            'sheet': sheet_name,
-                            'row': row_num,
-                            'field': 'employee_code',
-                            'message': 'employee_code is required'
-                        })
-                    if not product:
-                        row_errors.append({
-                            'sheet': sheet_name,
-                            'row': row_num,
-                            'field': 'product',
-                            'message': 'product is required'
-                        })
-                    if not contribution_month:
-                        row_errors.append({
-                            'sheet': sheet_name,
-                            'row': row_num,
-                            'field': 'contribution_month',
-                            'message': 'contribution_month is required'
-                        })
-                    
-                    # Normalize month format
-                    month_str = None
-                    if contribution_month:
-                        try:
-                            # Try various formats
-                            if len(contribution_month) == 7 and '-' in contribution_month:
-                                # YYYY-MM format
-                                month_str = contribution_month
-                            else:
-                                # Try parsing as date
-                                if '/' in contribution_month:
-                                    month_date = datetime.strptime(contribution_month, '%Y/%m/%d')
-                                elif '-' in contribution_month:
-                                    month_date = datetime.strptime(contribution_month, '%Y-%m-%d')
-                                else:
-                                    month_date = datetime.strptime(contribution_month, '%Y%m%d')
-                                month_str = month_date.strftime('%Y-%m')
-                        except:
-                            row_errors.append({
-                                'sheet': sheet_name,
-                                'row': row_num,
-                                'field': 'contribution_month',
-                                'message': f'Invalid month format: {contribution_month}'
-                            })
-                    
-                    if row_errors:
-                        errors.extend(row_errors)
+            # Process each team/department sub-sheet (possibly in parallel),
+            # merging results in sheet order as a serial pass would
+            sheet_results = sheet_reader_service.map_sheets(
+                file_path, sub_sheets, _parse_initial_sheet, workbook=excel_file
+            )
+            for sheet_data, sheet_errors, failure in sheet_results:
+                errors.extend(sheet_errors)
+                for employee_code, data in sheet_data.items():
+                    if employee_code in employee_data:
+                        employee_data[employee_code]['products'].extend(data['products'])
                     else:
-                        # Initialize employee data if not exists
-                        if employee_code not in employee_data:
-                            employee_data[employee_code] = {
-                                'employee_code': employee_code,
-                                'employee_name': employee_name,
-                                'email': email,
-                                'department': department,
-                                'pod': pod,
-                                'products': []
-                            }
-                        
-                        # Convert effort_hours to Decimal
-                        try:
-                            hours = Decimal(str(effort_hours)) if pd.notna(effort_hours) else Decimal('0')
-                        except:
-                            hours = Decimal('0')
-                        
-                        employee_data[employee_code]['products'].append({
-                            'product': product,
-                            'description': description,
-                            'contribution_month': month_str,
-                            'effort_hours': hours
-                        })
+                        employee_data[employee_code] = data
+                if failure:
+                    # Stop at the first failing sheet, like the serial loop did
+                    raise failure
         else:
             # Handle CSV file
             try:
@@ -257,3 +162,130 @@ def parse_initial_xlsx(file_path: str) -> Tuple[Dict[str, Dict], List[Dict]]:
     
     return employee_data, errors
 
+def _parse_initial_sheet(workbook, sheet_name: str) -> Tuple[Dict[str, Dict], List[Dict], Optional[Exception]]:
+    """
+    Parse one team/department sheet of an initial XLSX workbook.
+    
+    Returns:
+        Tuple of (employee_data, errors, failure) for the sheet, where failure
+        is the exception that stopped parsing it (if any)
+    """
+    employee_data = {}
+    errors = []
+    try:
+        _parse_initial_sheet_rows(workbook, sheet_name, employee_data, errors)
+    except Exception as e:
+        return employee_data, errors, e
+    return employee_data, errors, None
+
+
+def _parse_initial_sheet_rows(workbook, sheet_name: str, employee_data: Dict[str, Dict], errors: List[Dict]):
+    """Fill employee_data and errors from the rows of one sheet."""
+    df = pd.read_excel(workbook, sheet_name=sheet_name)
+    
+    # Normalize column names
+    df.columns = [col.strip().lower() for col in df.columns]
+    
+    # Required columns
+    required_columns = ['employee_code', 'product', 'description', 'contribution_month']
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    
+    if missing_columns:
+        errors.append({
+            'sheet': sheet_name,
+            'row': 0,
+            'field': 'headers',
+            'message': f"Missing required columns: {', '.join(missing_columns)}"
+        })
+        return
+    
+    # Process each row
+    for idx, row in df.iterrows():
+        row_num = idx + 2  # Excel row number (1-indexed + header)
+        row_errors = []
+        
+        # Extract fields
+        employee_code = str(row.get('employee_code', '')).strip()
+        employee_name = str(row.get('employee_name', '')).strip() if pd.notna(row.get('employee_name')) else ''
+        email = str(row.get('email', '')).strip() if pd.notna(row.get('email')) else ''
+        department = str(row.get('department', '')).strip() if pd.notna(row.get('department')) else ''
+        pod = str(row.get('pod', '')).strip() if pd.notna(row.get('pod')) else ''
+        product = str(row.get('product', '')).strip()
+        description = str(row.get('description', '')).strip() if pd.notna(row.get('description')) else ''
+        contribution_month = str(row.get('contribution_month', '')).strip()
+        effort_hours = row.get('effort_hours', 0)
+        
+        # Validate required fields
+        if not employee_code:
+            row_errors.append({
+                'sheet': sheet_name,
+                'row': row_num,
+                'field': 'employee_code',
+                'message': 'employee_code is required'
+            })
+        if not product:
+            row_errors.append({
+                'sheet': sheet_name,
+                'row': row_num,
+                'field': 'product',
+                'message': 'product is required'
+            })
+        if not contribution_month:
+            row_errors.append({
+                'sheet': sheet_name,
+                'row': row_num,
+                'field': 'contribution_month',
+                'message': 'contribution_month is required'
+            })
+        
+        # Normalize month format
+        month_str = None
+        if contribution_month:
+            try:
+                # Try various formats
+                if len(contribution_month) == 7 and '-' in contribution_month:
+                    # YYYY-MM format
+                    month_str = contribution_month
+                else:
+                    # Try parsing as date
+                    if '/' in contribution_month:
+                        month_date = datetime.strptime(contribution_month, '%Y/%m/%d')
+                    elif '-' in contribution_month:
+                        month_date = datetime.strptime(contribution_month, '%Y-%m-%d')
+                    else:
+                        month_date = datetime.strptime(contribution_month, '%Y%m%d')
+                    month_str = month_date.strftime('%Y-%m')
+            except:
+                row_errors.append({
+                    'sheet': sheet_name,
+                    'row': row_num,
+                    'field': 'contribution_month',
+                    'message': f'Invalid month format: {contribution_month}'
+                })
+        
+        if row_errors:
+            errors.extend(row_errors)
+        else:
+            # Initialize employee data if not exists
+            if employee_code not in employee_data:
+                employee_data[employee_code] = {
+                    'employee_code': employee_code,
+                    'employee_name': employee_name,
+                    'email': email,
+                    'department': department,
+                    'pod': pod,
+                    'products': []
+                }
+            
+            # Convert effort_hours to Decimal
+            try:
+                hours = Decimal(str(effort_hours)) if pd.notna(effort_hours) else Decimal('0')
+            except:
+                hours = Decimal('0')
+            
+            employee_data[employee_code]['products'].append({
+                'product': product,
+                'description': description,
+                'contribution_month': month_str,
+                'effort_hours': hours
+            })
@@ -1,7 +1,9 @@
 """JWT service for token generation and validation."""
+from typing import Optional
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from contributions.storages import employee_storage
+from contributions.storages.storage_dto import EmployeeDTO
 from contributions.exceptions import EntityNotFoundException
 
 
@@ -44,6 +46,27 @@ def validate_token(token: str) -> dict:
         return {'valid': False}
 
 
+def get_employee_from_claims(validated_token) -> Optional[EmployeeDTO]:
+    """
+    Employee identity carried by the claims of a validated access token.
+    
+    Only the fields generate_tokens embeds are set (name and email are
+    left empty). Returns None for tokens issued without these claims.
+    """
+    claims = ('employee_id', 'employee_code', 'role', 'department_id', 'pod_id', 'iat')
+    if any(claim not in validated_token for claim in claims):
+        return None
+    return EmployeeDTO(
+        id=validated_token['employee_id'],
+        employee_code=validated_token['employee_code'],
+        name='',
+        email='',
+        department_id=validated_token['department_id'],
+        pod_id=validated_token['pod_id'],
+        role=validated_token['role'],
+    )
+
+
 def get_employee_from_token(token: str) -> int:
     """Extract employee ID from token."""
     try:
@@ -0,0 +1,188 @@
+"""Versioned response cache for dashboard metrics."""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Optional
+from django.conf import settings
+from django.utils.module_loading import import_string
+from contributions.storages import metrics_version_storage
+
+
+class LocalMemoryLRUBackend:
+    """Process-local LRU cache with a per-entry timeout."""
+    
+    def __init__(self, max_entries: int = 512, timeout: int = 3600, **kwargs):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.timeout if self.timeout else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DjangoCacheBackend:
+    """
+    Backend storing entries in one of the Django cache framework caches.
+    
+    Keys are prefixed with a namespace held in the same cache, so clear()
+    drops only the metrics entries (by moving to a new namespace) and
+    leaves the rest of a shared cache alone.
+    """
+    NAMESPACE_KEY = 'metrics:namespace'
+    
+    def __init__(self, cache_alias: str = 'default', timeout: int = 3600, **kwargs):
+        from django.core.cache import caches
+        self.cache = caches[cache_alias]
+        self.timeout = timeout
+    
+    def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(self._namespaced(key))
+    
+    def set(self, key: str, value: Any) -> None:
+        self.cache.set(self._namespaced(key), value, self.timeout)
+    
+    def clear(self) -> None:
+        # Entries of the old namespace expire on their own
+        self.cache.set(self.NAMESPACE_KEY, uuid.uuid4().hex, timeout=None)
+    
+    def _namespaced(self, key: str) -> str:
+        namespace = self.cache.get(self.NAMESPACE_KEY)
+        if namespace is None:
+            self.cache.add(self.NAMESPACE_KEY, uuid.uuid4().hex, timeout=None)
+            namespace = self.cache.get(self.NAMESPACE_KEY)
+        return f"{namespace}:{key}"
+
+
+BACKENDS = {
+    'locmem': LocalMemoryLRUBackend,
+    'django': DjangoCacheBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def get_backend():
+    """Get the configured cache backend (created on first use)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                config = _get_config()
+                backend_name = config.get('BACKEND', 'locmem')
+                backend_class = BACKENDS.get(backend_name) or import_string(backend_name)
+                _backend = backend_class(
+                    max_entries=config.get('MAX_ENTRIES', 512),
+                    timeout=config.get('TIMEOUT', 3600),
+                    cache_alias=config.get('CACHE_ALIAS', 'default'),
+                )
+    return _backend
+
+
+def get_or_compute(scope: str, object_id: Optional[int], month: date, compute: Callable[[], Any]) -> Any:
+    """
+    Return cached metrics for (scope, id, month, data-version) or compute and store them.
+    
+    Args:
+        scope: Dashboard scope ('org', 'department', 'pod', 'employee')
+        object_id: ID of the scoped entity (None for org)
+        month: First-of-month date of the dashboard
+        compute: Callable producing the metrics on a miss
+    """
+    if not _get_config().get('ENABLED', True):
+        return compute()
+    
+    version = metrics_version_storage.get_month_version(month)
+    key = f"metrics:{scope}:{object_id if object_id is not None else '-'}:{month.strftime('%Y-%m')}:v{version}"
+    
+    backend = get_backend()
+    value = backend.get(key)
+    if value is not None:
+        _record('hits')
+        return value
+    
+    _record('misses')
+    value = compute()
+    backend.set(key, value)
+    return value
+
+
+def invalidate_month(month: date) -> int:
+    """Invalidate all cached dashboards of a month by bumping its data version."""
+    if month.day != 1:
+        month = date(month.year, month.month, 1)
+    return metrics_version_storage.bump_month_version(month)
+
+
+def invalidate_months(months) -> None:
+    """Invalidate all cached dashboards of several months."""
+    for month in {date(m.year, m.month, 1) for m in months}:
+        metrics_version_storage.bump_month_version(month)
+
+
+def invalidate_all() -> int:
+    """
+    Invalidate the cached dashboards of every month.
+    
+    Used when names or rosters change (employees, departments, pods,
+    products, features), which every month's dashboards show.
+    """
+    return metrics_version_storage.bump_all_months_version()
+
+
+def get_stats() -> dict:
+    """Get hit/miss counters of this process."""
+    with _stats_lock:
+        hits = _stats['hits']
+        misses = _stats['misses']
+    total = hits + misses
+    return {
+        'backend': _get_config().get('BACKEND', 'locmem'),
+        'enabled': _get_config().get('ENABLED', True),
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+    }
+
+
+def reset() -> None:
+    """Clear cached entries and counters."""
+    get_backend().clear()
+    with _stats_lock:
+        _stats['hits'] = 0
+        _stats['misses'] = 0
+
+
+def _record(counter: str) -> None:
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def _get_config() -> dict:
+    return getattr(settings, 'METRICS_CACHE', {})
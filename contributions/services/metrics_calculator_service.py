@@ -1,15 +1,23 @@
 """Metrics calculation service with robust percentage calculations."""
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
+import numpy as np
 from typing import List, Dict
 from django.db.models import Sum
-from contributions.models import ContributionRecord
+from contributions.models import ContributionRecord, ContributionMonthlyRollup
 from contributions.storages.storage_dto import (
     OrgMetricsDTO, DepartmentMetricsDTO, PodMetricsDTO, EmployeeMetricsDTO,
     ProductBreakdownDTO, PodBreakdownDTO, EmployeeBreakdownDTO, FeatureBreakdownDTO,
     DepartmentBreakdownDTO
 )
-from contributions.storages import contribution_storage
+from contributions.storages import contribution_rollup_storage
+from contributions.exceptions import EntityNotFoundException
+
+
+CENTS = Decimal('0.01')
+FULL_BASIS_POINTS = 10000
+# Every possible percentage as a Decimal, indexed by basis points
+PERCENT_VALUES = [Decimal(points).scaleb(-2) for points in range(FULL_BASIS_POINTS + 1)]
 
 
 def calculate_percentages(items: List[Dict], total_hours: Decimal) -> List[Dict]:
@@ -23,41 +31,108 @@ def calculate_percentages(items: List[Dict], total_hours: Decimal) -> List[Dict]
     Returns:
         List of dicts with 'percent' field added (Decimal, 2 decimal places)
     """
-    if total_hours == 0:
-        return [{**item, 'percent': Decimal('0.00')} for item in items]
+    return calculate_percentages_batch([[dict(item) for item in items]], [total_hours])[0]
+
+
+def calculate_percentages_batch(groups: List[List[Dict]], totals: List[Decimal]) -> List[List[Dict]]:
+    """
+    Calculate percentages for many item lists at once.
     
-    result = []
+    Hours are converted to integer cents and every group is split into
+    integer basis points (0.01%) in one vectorized pass. The basis points
+    left over by flooring are handed out by the largest-remainder method,
+    so each group sums to exactly 100.00 whenever its items add up to its
+    total. Groups whose items do not add up to the total (e.g. a partial
+    list) keep the previous behaviour of adjusting the last item.
+    
+    Args:
+        groups: List of item lists, each item a dict with 'hours' key (Decimal)
+        totals: Total hours of each group (Decimal)
+    
+    Returns:
+        The given item lists, with a 'percent' field (Decimal, 2 decimal
+        places) set on every item in place
+    """
+    sizes = np.fromiter(map(len, groups), dtype=np.int64, count=len(groups))
+    total_cents = _to_cents(np.fromiter(map(float, totals), dtype=np.float64, count=len(groups)))
+    hours_cents = _to_cents(np.fromiter(
+        (float(item.get('hours') or 0) for items in groups for item in items),
+        dtype=np.float64,
+        count=int(sizes.sum())
+    ))
+    
+    group_index = np.repeat(np.arange(len(groups)), sizes)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1])) if len(groups) else sizes
+    item_totals = total_cents[group_index]
+    safe_totals = np.where(item_totals > 0, item_totals, 1)
+    
+    scaled = hours_cents * FULL_BASIS_POINTS
+    basis_points = np.where(item_totals > 0, scaled // safe_totals, 0)
+    remainders = np.where(item_totals > 0, scaled % safe_totals, 0)
+    
+    # Basis points still missing per group after flooring
+    floored_sums = np.zeros(len(groups), dtype=np.int64)
+    np.add.at(floored_sums, group_index, basis_points)
+    deficits = np.where(total_cents > 0, FULL_BASIS_POINTS - floored_sums, 0)
+    
+    # Rank items by remainder (largest first, earlier items win ties) within each group
+    order = np.lexsort((np.arange(len(hours_cents)), -remainders, group_index))
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order)) - starts[group_index[order]]
+    basis_points += ranks < deficits[group_index]
+    
+    # Largest remainder only applies when the items add up to the total
+    exact = (deficits >= 0) & (deficits <= sizes)
+    
+    percents = basis_points.tolist()
+    for items, start, total, is_exact, total_hours in zip(groups, starts.tolist(), total_cents.tolist(), exact.tolist(), totals):
+        if total <= 0:
+            for item in items:
+                item['percent'] = Decimal('0.00')
+        elif is_exact:
+            for item, points in zip(items, percents[start:start + len(items)]):
+                item['percent'] = PERCENT_VALUES[points]
+        else:
+            _calculate_percentages_adjusting_last(items, total_hours)
+    return groups
+
+
+def _calculate_percentages_adjusting_last(items: List[Dict], total_hours: Decimal) -> None:
+    """Round each item half-up and push the rounding error onto the last item."""
     for item in items:
         hours = item.get('hours', Decimal('0'))
         if hours == 0:
-            percent = Decimal('0.00')
+            item['percent'] = Decimal('0.00')
         else:
-            percent = (hours / total_hours) * Decimal('100')
-            percent = percent.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        result.append({**item, 'percent': percent})
-    
-    # Ensure percentages sum to 100%
-    total_percent = sum(item['percent'] for item in result)
-    if total_percent != Decimal('100.00'):
-        # Adjust last item to make sum exactly 100%
-        diff = Decimal('100.00') - total_percent
-        if result:
-            result[-1]['percent'] += diff
-            result[-1]['percent'] = result[-1]['percent'].quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-    
-    return result
+            item['percent'] = ((hours / total_hours) * Decimal('100')).quantize(CENTS, rounding=ROUND_HALF_UP)
+    
+    total_percent = sum(item['percent'] for item in items)
+    if items and total_percent != Decimal('100.00'):
+        items[-1]['percent'] = (items[-1]['percent'] + Decimal('100.00') - total_percent).quantize(
+            CENTS, rounding=ROUND_HALF_UP
+        )
+
+
+def _to_cents(hours: np.ndarray) -> np.ndarray:
+    """
+    Convert hours to integer cents.
+    
+    Hours are stored with two decimal places, so rounding the float value
+    times 100 recovers the exact cent amount.
+    """
+    return np.rint(hours * 100).astype(np.int64)
 
 
 def calculate_org_metrics(month: date) -> OrgMetricsDTO:
     """Calculate organization-level metrics."""
     # Get total org hours
-    total_hours = contribution_storage.get_total_hours_by_month(month)
+    total_hours = contribution_rollup_storage.get_total_hours_by_month(month)
     
     # Group by product
-    product_aggregates = ContributionRecord.objects.filter(
+    product_aggregates = ContributionMonthlyRollup.objects.filter(
         contribution_month=month
     ).values('product_id', 'product__name').annotate(
-        hours=Sum('effort_hours')
+        hours=Sum('hours')
     ).order_by('-hours')
     
     products = []
@@ -82,10 +157,10 @@ def calculate_org_metrics(month: date) -> OrgMetricsDTO:
     ]
     
     # Get top departments
-    dept_aggregates = ContributionRecord.objects.filter(
+    dept_aggregates = ContributionMonthlyRollup.objects.filter(
         contribution_month=month
     ).values('department_id', 'department__name').annotate(
-        hours=Sum('effort_hours')
+        hours=Sum('hours')
     ).order_by('-hours')[:10]
     
     top_departments = [
@@ -98,10 +173,10 @@ def calculate_org_metrics(month: date) -> OrgMetricsDTO:
     ]
     
     # Get top pods with department information and percentage
-    pod_aggregates = ContributionRecord.objects.filter(
+    pod_aggregates = ContributionMonthlyRollup.objects.filter(
         contribution_month=month
     ).values('pod_id', 'pod__name', 'department_id', 'department__name').annotate(
-        hours=Sum('effort_hours')
+        hours=Sum('hours')
     ).order_by('-hours')[:10]
     
     top_pods = [
@@ -118,84 +193,51 @@ def calculate_org_metrics(month: date) -> OrgMetricsDTO:
     
     # Calculate department breakdown with product distribution
     # Get all departments with their product breakdowns
-    dept_product_aggregates = ContributionRecord.objects.filter(
+    dept_product_aggregates = ContributionMonthlyRollup.objects.filter(
         contribution_month=month
     ).values('department_id', 'department__name', 'product_id', 'product__name').annotate(
-        hours=Sum('effort_hours')
+        hours=Sum('hours')
     ).order_by('department_id', 'product_id')
     
     # Group by department
-    department_breakdowns = []
-    current_dept_id = None
-    current_dept_name = None
-    current_dept_products = []
-    current_dept_total = Decimal('0')
-    
+    dept_groups = {}
     for agg in dept_product_aggregates:
-        dept_id = agg['department_id']
-        dept_name = agg['department__name']
-        product_id = agg['product_id']
-        product_name = agg['product__name']
+        dept_data = dept_groups.setdefault(agg['department_id'], {
+            'department_name': agg['department__name'],
+            'total': Decimal('0'),
+            'products': [],
+        })
         hours = Decimal(str(agg['hours'] or 0))
-        
-        if current_dept_id is None or current_dept_id != dept_id:
-            # Save previous department if exists
-            if current_dept_id is not None:
-                # Calculate percentages for this department's products
-                dept_products_with_percent = calculate_percentages(
-                    current_dept_products, current_dept_total
-                )
-                department_breakdowns.append(
-                    DepartmentBreakdownDTO(
-                        department_id=current_dept_id,
-                        department_name=current_dept_name,
-                        total_hours=current_dept_total,
-                        products=[
-                            ProductBreakdownDTO(
-                                product_id=item['product_id'],
-                                product_name=item['product_name'],
-                                hours=item['hours'],
-                                percent=item['percent'],
-                            )
-                            for item in dept_products_with_percent
-                        ],
-                    )
-                )
-            
-            # Start new department
-            current_dept_id = dept_id
-            current_dept_name = dept_name
-            current_dept_products = []
-            current_dept_total = Decimal('0')
-        
-        current_dept_products.append({
-            'product_id': product_id,
-            'product_name': product_name,
+        dept_data['products'].append({
+            'product_id': agg['product_id'],
+            'product_name': agg['product__name'],
             'hours': hours,
         })
-        current_dept_total += hours
+        dept_data['total'] += hours
     
-    # Don't forget the last department
-    if current_dept_id is not None:
-        dept_products_with_percent = calculate_percentages(
-            current_dept_products, current_dept_total
-        )
-        department_breakdowns.append(
-            DepartmentBreakdownDTO(
-                department_id=current_dept_id,
-                department_name=current_dept_name,
-                total_hours=current_dept_total,
-                products=[
-                    ProductBreakdownDTO(
-                        product_id=item['product_id'],
-                        product_name=item['product_name'],
-                        hours=item['hours'],
-                        percent=item['percent'],
-                    )
-                    for item in dept_products_with_percent
-                ],
-            )
+    # Calculate percentages for every department's products in one pass
+    dept_products_with_percent = calculate_percentages_batch(
+        [dept_data['products'] for dept_data in dept_groups.values()],
+        [dept_data['total'] for dept_data in dept_groups.values()]
+    )
+    
+    department_breakdowns = [
+        DepartmentBreakdownDTO(
+            department_id=dept_id,
+            department_name=dept_data['department_name'],
+            total_hours=dept_data['total'],
+            products=[
+                ProductBreakdownDTO(
+                    product_id=item['product_id'],
+                    product_name=item['product_name'],
+                    hours=item['hours'],
+                    percent=item['percent'],
+                )
+                for item in products_with_percent
+            ],
         )
+        for (dept_id, dept_data), products_with_percent in zip(dept_groups.items(), dept_products_with_percent)
+    ]
     
     return OrgMetricsDTO(
         month=month.strftime('%Y-%m'),
@@ -209,14 +251,14 @@ def calculate_org_metrics(month: date) -> OrgMetricsDTO:
 
 def calculate_product_metrics(product_id: int, month: date) -> Dict:
     """Calculate product-level metrics."""
-    total_hours = contribution_storage.get_total_hours_by_product(product_id, month)
+    total_hours = contribution_rollup_storage.get_total_hours_by_product(product_id, month)
     
     # Group by department
-    dept_aggregates = ContributionRecord.objects.filter(
+    dept_aggregates = ContributionMonthlyRollup.objects.filter(
         product_id=product_id,
         contribution_month=month
     ).values('department_id', 'department__name').annotate(
-        hours=Sum('effort_hours')
+        hours=Sum('hours')
     ).order_by('-hours')
     
     departments = []
@@ -230,11 +272,11 @@ def calculate_product_metrics(product_id: int, month: date) -> Dict:
     departments_with_percent = calculate_percentages(departments, total_hours)
     
     # Group by pod
-    pod_aggregates = ContributionRecord.objects.filter(
+    pod_aggregates = ContributionMonthlyRollup.objects.filter(
         product_id=product_id,
         contribution_month=month
     ).values('pod_id', 'pod__name').annotate(
-        hours=Sum('effort_hours')
+        hours=Sum('hours')
     ).order_by('-hours')
     
     pods = []
@@ -274,76 +316,131 @@ def calculate_product_metrics(product_id: int, month: date) -> Dict:
 
 def calculate_department_metrics(department_id: int, month: date) -> DepartmentMetricsDTO:
     """Calculate department-level metrics."""
+    return calculate_bulk_department_metrics([department_id], month)[0]
+
+
+def calculate_bulk_department_metrics(department_ids: List[int], month: date) -> List[DepartmentMetricsDTO]:
+    """
+    Calculate department-level metrics for several departments at once.
+    
+    A single grouped (department, pod, product) query feeds both the pod
+    breakdowns and the department product distributions, so the cost is two
+    queries no matter how many departments or pods are involved.
+    
+    Returns:
+        List of DepartmentMetricsDTO in the same order as department_ids
+    """
     # Ensure month is first day of month for consistent querying
     if month.day != 1:
         month = date(month.year, month.month, 1)
     
-    total_hours = contribution_storage.get_total_hours_by_department(department_id, month)
+    # Get department names (raises for unknown departments, like the single lookup did)
+    from contributions.storages import department_storage
+    departments = {dept.id: dept for dept in department_storage.list_departments_by_ids(department_ids)}
+    for department_id in department_ids:
+        if department_id not in departments:
+            raise EntityNotFoundException(f"Department with id {department_id} not found")
     
-    # Get pods with their total hours aggregated - only pods with actual contributions
-    # This ensures we only get pods that exist in the data for this month
+    # Group by department, pod and product in one query
     # Use exact date match - data should be stored as first-of-month dates
-    pod_aggregates = ContributionRecord.objects.filter(
-        department_id=department_id,
-        contribution_month=month,
-        pod_id__isnull=False
-    ).select_related('pod').values(
-        'pod_id', 
-        'pod__name'
+    aggregates = ContributionMonthlyRollup.objects.filter(
+        department_id__in=department_ids,
+        contribution_month=month
+    ).values(
+        'department_id', 'pod_id', 'pod__name', 'product_id', 'product__name'
     ).annotate(
-        total_hours=Sum('effort_hours')
-    ).filter(
-        total_hours__gt=0  # Only include pods with non-zero hours
-    ).order_by('-total_hours')
-    
-    # Get pod names mapping
-    from contributions.storages import pod_storage
-    pods = []
-    seen_pod_ids = set()  # Track processed pods to prevent duplicates
+        hours=Sum('hours')
+    ).order_by('-hours')
     
-    for pod_agg in pod_aggregates:
-        pod_id = pod_agg['pod_id']
+    # {department_id: {'total': Decimal, 'products': {product_id: item}, 'pods': {pod_id: pod}}}
+    grouped = {
+        department_id: {'total': Decimal('0'), 'products': {}, 'pods': {}}
+        for department_id in department_ids
+    }
+    for agg in aggregates:
+        dept_data = grouped[agg['department_id']]
+        hours = agg['hours'] or Decimal('0')
+        dept_data['total'] += hours
         
-        # Skip if already processed (defensive check)
-        if pod_id in seen_pod_ids:
-            continue
-        seen_pod_ids.add(pod_id)
+        if agg['product_id'] not in dept_data['products']:
+            dept_data['products'][agg['product_id']] = {
+                'product_id': agg['product_id'],
+                'product_name': agg['product__name'],
+                'hours': Decimal('0'),
+            }
+        dept_data['products'][agg['product_id']]['hours'] += hours
         
-        # Get pod name from aggregate or storage
-        pod_name = pod_agg['pod__name']
-        if not pod_name:
-            try:
-                pod = pod_storage.get_pod_by_id(pod_id)
-                pod_name = pod.name
-            except:
-                pod_name = f"Pod {pod_id}"
+        if agg['pod_id'] is None:
+            continue
+        if agg['pod_id'] not in dept_data['pods']:
+            dept_data['pods'][agg['pod_id']] = {
+                'pod_name': agg['pod__name'],
+                'total_hours': Decimal('0'),
+                'products': [],
+            }
+        pod_data = dept_data['pods'][agg['pod_id']]
+        pod_data['total_hours'] += hours
+        # Rows arrive ordered by hours descending, so pod products stay sorted
+        pod_data['products'].append({
+            'product_id': agg['product_id'],
+            'product_name': agg['product__name'],
+            'hours': hours,
+        })
+    
+    from contributions.storages import pod_storage
+    results = []
+    for department_id in department_ids:
+        dept_data = grouped[department_id]
         
-        pod_total_hours = pod_agg['total_hours'] or Decimal('0')
+        # Only include pods with non-zero hours, largest first
+        pod_items = sorted(
+            ((pod_id, pod_data) for pod_id, pod_data in dept_data['pods'].items() if pod_data['total_hours'] > 0),
+            key=lambda entry: entry[1]['total_hours'],
+            reverse=True
+        )
         
-        # Get product breakdown for this pod
-        product_aggregates = ContributionRecord.objects.filter(
-            department_id=department_id,
-            pod_id=pod_id,
-            contribution_month=month
-        ).values('product_id', 'product__name').annotate(
-            hours=Sum('effort_hours')
-        ).order_by('-hours')
+        pods_products_with_percent = calculate_percentages_batch(
+            [pod_data['products'] for _, pod_data in pod_items],
+            [pod_data['total_hours'] for _, pod_data in pod_items]
+        )
         
-        products = []
-        for prod_agg in product_aggregates:
-            products.append({
-                'product_id': prod_agg['product_id'],
-                'product_name': prod_agg['product__name'],
-                'hours': prod_agg['hours'] or Decimal('0'),
-            })
+        pods = []
+        for (pod_id, pod_data), products_with_percent in zip(pod_items, pods_products_with_percent):
+            # Get pod name from aggregate or storage
+            pod_name = pod_data['pod_name']
+            if not pod_name:
+                try:
+                    pod = pod_storage.get_pod_by_id(pod_id)
+                    pod_name = pod.name
+                except:
+                    pod_name = f"Pod {pod_id}"
+            
+            pods.append(PodBreakdownDTO(
+                pod_id=pod_id,
+                pod_name=pod_name,
+                total_hours=pod_data['total_hours'],
+                products=[
+                    ProductBreakdownDTO(
+                        product_id=item['product_id'],
+                        product_name=item['product_name'],
+                        hours=item['hours'],
+                        percent=item['percent'],
+                    )
+                    for item in products_with_percent
+                ],
+            ))
         
-        products_with_percent = calculate_percentages(products, pod_total_hours)
+        # Product distribution for department
+        products = sorted(dept_data['products'].values(), key=lambda item: item['hours'], reverse=True)
+        products_with_percent = calculate_percentages(products, dept_data['total'])
         
-        pods.append(PodBreakdownDTO(
-            pod_id=pod_id,
-            pod_name=pod_name,
-            total_hours=pod_total_hours,
-            products=[
+        results.append(DepartmentMetricsDTO(
+            department_id=department_id,
+            department_name=departments[department_id].name,
+            month=month.strftime('%Y-%m'),
+            total_hours=dept_data['total'],
+            pods=pods,
+            product_distribution=[
                 ProductBreakdownDTO(
                     product_id=item['product_id'],
                     product_name=item['product_name'],
@@ -354,70 +451,53 @@ def calculate_department_metrics(department_id: int, month: date) -> DepartmentM
             ],
         ))
     
-    # Get product distribution for department
-    product_aggregates = ContributionRecord.objects.filter(
-        department_id=department_id,
-        contribution_month=month
-    ).values('product_id', 'product__name').annotate(
-        hours=Sum('effort_hours')
-    ).order_by('-hours')
-    
-    products = []
-    for agg in product_aggregates:
-        products.append({
-            'product_id': agg['product_id'],
-            'product_name': agg['product__name'],
-            'hours': agg['hours'] or Decimal('0'),
-        })
-    
-    products_with_percent = calculate_percentages(products, total_hours)
-    
-    # Get department name
-    from contributions.storages import department_storage
-    dept = department_storage.get_department_by_id(department_id)
-    
-    return DepartmentMetricsDTO(
-        department_id=department_id,
-        department_name=dept.name,
-        month=month.strftime('%Y-%m'),
-        total_hours=total_hours,
-        pods=pods,
-        product_distribution=[
-            ProductBreakdownDTO(
-                product_id=item['product_id'],
-                product_name=item['product_name'],
-                hours=item['hours'],
-                percent=item['percent'],
-            )
-            for item in products_with_percent
-        ],
-    )
+    return results
 
 
 def calculate_pod_metrics(pod_id: int, month: date) -> PodMetricsDTO:
-    """Calculate pod-level metrics."""
+    """
+    Calculate pod-level metrics.
+    
+    All employee x product sums for the pod/month are fetched with a single
+    grouped query and joined in memory against the pod roster, so the number
+    of queries does not grow with the size of the pod.
+    """
     # Ensure month is first day of month for consistent querying
     if month.day != 1:
         month = date(month.year, month.month, 1)
     
-    total_hours = contribution_storage.get_total_hours_by_pod(pod_id, month)
-    
-    # Group by product
-    product_aggregates = ContributionRecord.objects.filter(
+    # Group by employee and product in one query (ordered so that each
+    # employee's products come out already sorted by hours descending)
+    employee_product_aggregates = ContributionMonthlyRollup.objects.filter(
         pod_id=pod_id,
         contribution_month=month
-    ).values('product_id', 'product__name').annotate(
-        hours=Sum('effort_hours')
+    ).values('employee_id', 'product_id', 'product__name').annotate(
+        hours=Sum('hours')
     ).order_by('-hours')
     
-    products = []
-    for agg in product_aggregates:
-        products.append({
+    total_hours = Decimal('0')
+    product_totals = {}
+    employee_products = {}
+    for agg in employee_product_aggregates:
+        hours = agg['hours'] or Decimal('0')
+        total_hours += hours
+        
+        if agg['product_id'] not in product_totals:
+            product_totals[agg['product_id']] = {
+                'product_id': agg['product_id'],
+                'product_name': agg['product__name'],
+                'hours': Decimal('0'),
+            }
+        product_totals[agg['product_id']]['hours'] += hours
+        
+        employee_products.setdefault(agg['employee_id'], []).append({
             'product_id': agg['product_id'],
             'product_name': agg['product__name'],
-            'hours': agg['hours'] or Decimal('0'),
+            'hours': hours,
         })
     
+    products = sorted(product_totals.values(), key=lambda item: item['hours'], reverse=True)
+    
     # Calculate percentages only if there are hours
     if total_hours > 0:
         products_with_percent = calculate_percentages(products, total_hours)
@@ -429,44 +509,21 @@ def calculate_pod_metrics(pod_id: int, month: date) -> PodMetricsDTO:
     from contributions.storages import employee_storage
     pod_employees = employee_storage.list_employees_by_pod(pod_id)
     
-    # Get employee product breakdowns - show all employees, even with 0 hours
+    # Join employee product breakdowns against the roster - show all employees, even with 0 hours
+    roster_products = [employee_products.get(emp_dto.id, []) for emp_dto in pod_employees]
+    roster_totals = [sum((item['hours'] for item in emp_products), Decimal('0')) for emp_products in roster_products]
+    
+    # Calculate percentages for all employees' products in one pass
+    roster_products_with_percent = calculate_percentages_batch(roster_products, roster_totals)
+    
     employee_breakdowns = []
-    for emp_dto in pod_employees:
-        emp_id = emp_dto.id
-        
-        # Get total hours for this employee in this pod for this month
-        emp_total = ContributionRecord.objects.filter(
-            pod_id=pod_id,
-            employee_id=emp_id,
-            contribution_month=month
-        ).aggregate(total=Sum('effort_hours'))['total'] or Decimal('0')
-        
-        # Get product breakdown for this employee in this pod
-        emp_product_aggregates = ContributionRecord.objects.filter(
-            pod_id=pod_id,
-            employee_id=emp_id,
-            contribution_month=month
-        ).select_related('product').values('product_id', 'product__name').annotate(
-            hours=Sum('effort_hours')
-        ).order_by('-hours')
-        
-        emp_products = []
-        for prod_agg in emp_product_aggregates:
-            emp_products.append({
-                'product_id': prod_agg['product_id'],
-                'product_name': prod_agg['product__name'],
-                'hours': prod_agg['hours'] or Decimal('0'),
-            })
-        
-        # Calculate percentages for employee products
-        if emp_total > 0:
-            emp_products_with_percent = calculate_percentages(emp_products, emp_total)
-        else:
-            # If employee has no hours, show empty products list
+    for emp_dto, emp_total, emp_products_with_percent in zip(pod_employees, roster_totals, roster_products_with_percent):
+        # If employee has no hours, show empty products list
+        if emp_total <= 0:
             emp_products_with_percent = []
         
         employee_breakdowns.append(EmployeeBreakdownDTO(
-            employee_id=emp_id,
+            employee_id=emp_dto.id,
             employee_code=emp_dto.employee_code,
             employee_name=emp_dto.name,
             total_hours=emp_total,
@@ -512,14 +569,14 @@ def calculate_employee_metrics(employee_id: int, month: date) -> EmployeeMetrics
     if month.day != 1:
         month = date(month.year, month.month, 1)
     
-    total_hours = contribution_storage.get_total_hours_by_employee(employee_id, month)
+    total_hours = contribution_rollup_storage.get_total_hours_by_employee(employee_id, month)
     
     # Group by product
-    product_aggregates = ContributionRecord.objects.filter(
+    product_aggregates = ContributionMonthlyRollup.objects.filter(
         employee_id=employee_id,
         contribution_month=month
-    ).select_related('product').values('product_id', 'product__name').annotate(
-        hours=Sum('effort_hours')
+    ).values('product_id', 'product__name').annotate(
+        hours=Sum('hours')
     ).order_by('-hours')
     
     products = []
@@ -536,7 +593,8 @@ def calculate_employee_metrics(employee_id: int, month: date) -> EmployeeMetrics
     else:
         products_with_percent = []
     
-    # Group by feature
+    # Group by feature - read from raw records since the description is part of
+    # the grouping and rollups are not keyed by it (bounded by one employee)
     feature_aggregates = ContributionRecord.objects.filter(
         employee_id=employee_id,
         contribution_month=month
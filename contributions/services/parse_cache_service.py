@@ -0,0 +1,158 @@
+"""Service caching validated parse results of stored uploads next to their blobs."""
+import json
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Dict, Tuple, Optional
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from contributions.services import file_parser_service, file_storage_service
+from contributions.storages.storage_dto import ContributionRowBatchDTO
+
+CACHE_MARKER = '.parsed-v'
+CACHE_META_FILE = 'meta.json'
+
+
+def parse_contribution_batches(
+    file_path: str,
+    checksum: Optional[str] = None
+) -> Tuple[List[ContributionRowBatchDTO], List[Dict]]:
+    """
+    Parse a stored file like file_parser_service.parse_contribution_batches, reusing cached results.
+    
+    Results are cached per file checksum and PARSER_VERSION, so reparsing
+    the same content skips decoding the workbook, and a parser change
+    makes older results unused automatically.
+    
+    Args:
+        file_path: Path to Excel or CSV file
+        checksum: SHA-256 checksum of the file (no caching without one)
+    
+    Returns:
+        Tuple of (batches, errors)
+    """
+    if not checksum or not getattr(settings, 'PARSE_CACHE_ENABLED', True):
+        return file_parser_service.parse_contribution_batches(file_path)
+    
+    cache_path = get_cache_path(checksum)
+    if cache_path.exists():
+        try:
+            return load_parse_result(cache_path)
+        except (OSError, ValueError, KeyError):
+            # Unreadable cache entry, parse again and replace it
+            shutil.rmtree(cache_path, ignore_errors=True)
+    
+    batches, errors = file_parser_service.parse_contribution_batches(file_path)
+    try:
+        save_parse_result(cache_path, batches, errors)
+    except OSError:
+        pass  # Caching is best effort
+    return batches, errors
+
+
+def get_cache_path(checksum: str, parser_version: int = None) -> Path:
+    """Get the cache directory path for a checksum (next to its blob)."""
+    if parser_version is None:
+        parser_version = file_parser_service.PARSER_VERSION
+    return file_storage_service.get_blob_root() / checksum[:2] / f"{checksum}{CACHE_MARKER}{parser_version}"
+
+
+def get_cache_file_checksum(file_name: str) -> Optional[str]:
+    """
+    Get the checksum a cache entry belongs to.
+    
+    Returns:
+        The checksum, or None if file_name is not a cache entry of the current parser version
+    """
+    suffix = f"{CACHE_MARKER}{file_parser_service.PARSER_VERSION}"
+    if not file_name.endswith(suffix):
+        return None
+    return file_name[:-len(suffix)]
+
+
+def is_cache_file(file_name: str) -> bool:
+    """Whether an entry in the blob store is a cache entry (of any parser version or format)."""
+    return CACHE_MARKER in file_name
+
+
+def save_parse_result(cache_path: Path, batches: List[ContributionRowBatchDTO], errors: List[Dict]) -> None:
+    """
+    Write parse results as a directory of uncompressed columnar .npy files.
+    
+    Every column is dictionary-encoded (distinct values plus int32 codes
+    per row), which keeps repeated values such as departments, pods and
+    months small. Errors and batch layout go into a JSON header. The
+    arrays are stored uncompressed, one file each, so that
+    load_parse_result can memory-map them instead of decompressing them.
+    """
+    meta = {
+        'parser_version': file_parser_service.PARSER_VERSION,
+        'errors': errors,
+        'batches': [],
+    }
+    arrays = {}
+    for index, batch in enumerate(batches):
+        meta['batches'].append({'sheet_name': batch.sheet_name, 'columns': list(batch.columns)})
+        arrays[f'b{index}_rows'] = np.asarray(batch.row_numbers, dtype=np.int64)
+        arrays[f'b{index}_months'] = np.asarray(batch.contribution_months, dtype='datetime64[D]')
+        _encode(arrays, f'b{index}_hours', [str(hours) for hours in batch.effort_hours])
+        for column_index, values in enumerate(batch.columns.values()):
+            _encode(arrays, f'b{index}_c{column_index}', values)
+    
+    # Write to a temporary directory first so readers never see a partial cache entry
+    tmp_dir = file_storage_service.get_blob_root() / file_storage_service.BLOB_TMP_DIR
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(dir=tmp_dir, suffix=CACHE_MARKER))
+    try:
+        for key, array in arrays.items():
+            np.save(tmp_path / f'{key}.npy', array, allow_pickle=False)
+        # The header goes last: an entry without it is never read
+        (tmp_path / CACHE_META_FILE).write_text(json.dumps(meta))
+        # Fails if another process stored the same entry meanwhile, which is fine
+        os.rename(tmp_path, cache_path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+
+def load_parse_result(cache_path: Path) -> Tuple[List[ContributionRowBatchDTO], List[Dict]]:
+    """Read parse results written by save_parse_result, memory-mapping the column files."""
+    meta = json.loads((cache_path / CACHE_META_FILE).read_text())
+    if meta['parser_version'] != file_parser_service.PARSER_VERSION:
+        raise ValueError(f"Cache written by parser version {meta['parser_version']}")
+    
+    def data(key: str) -> np.ndarray:
+        return np.load(cache_path / f'{key}.npy', mmap_mode='r', allow_pickle=False)
+    
+    batches = []
+    for index, layout in enumerate(meta['batches']):
+        hours_values = [Decimal(value) for value in data(f'b{index}_hours_values').tolist()]
+        batches.append(ContributionRowBatchDTO(
+            sheet_name=layout['sheet_name'],
+            row_numbers=data(f'b{index}_rows').tolist(),
+            columns={
+                header: _decode(data, f'b{index}_c{column_index}')
+                for column_index, header in enumerate(layout['columns'])
+            },
+            contribution_months=data(f'b{index}_months').tolist(),
+            effort_hours=_decode(data, f'b{index}_hours', hours_values),
+        ))
+    return batches, meta['errors']
+
+
+def _encode(arrays: dict, key: str, values: list) -> None:
+    """Dictionary-encode a column of strings into arrays."""
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    arrays[f'{key}_codes'] = codes.astype(np.int32)
+    arrays[f'{key}_values'] = np.asarray(uniques, dtype=str)
+
+
+def _decode(data, key: str, values: list = None) -> list:
+    """Expand a dictionary-encoded column back into a list (data loads an array by key)."""
+    if values is None:
+        values = data(f'{key}_values').tolist()
+    return np.asarray(values, dtype=object)[data(f'{key}_codes')].tolist()
@@ -1,51 +1,57 @@
 """Permission service for role-based access control."""
+from typing import Union
 from contributions.storages import employee_storage
+from contributions.storages.storage_dto import EmployeeDTO
 from contributions.exceptions import PermissionDeniedException, EntityNotFoundException
 
+# Checks take the requesting employee, or just their ID (the employee is then loaded)
+EmployeeRef = Union[EmployeeDTO, int]
 
-def check_ceo_permission(employee_id: int) -> bool:
-    """Check if employee has CEO role."""
+
+def get_employee(employee: EmployeeRef) -> EmployeeDTO:
+    """Resolve an employee reference, loading the employee only when given an ID."""
+    if isinstance(employee, EmployeeDTO):
+        return employee
     try:
-        employee = employee_storage.get_employee_by_id(employee_id)
-        if employee.role != 'CEO':
-            raise PermissionDeniedException("CEO access required")
-        return True
+        return employee_storage.get_employee_by_id(employee)
     except EntityNotFoundException:
-        raise EntityNotFoundException(f"Employee with id {employee_id} not found")
+        raise EntityNotFoundException(f"Employee with id {employee} not found")
+
+
+def check_ceo_permission(employee: EmployeeRef) -> bool:
+    """Check if employee has CEO role."""
+    employee = get_employee(employee)
+    if employee.role != 'CEO':
+        raise PermissionDeniedException("CEO access required")
+    return True
 
 
-def check_hod_permission(employee_id: int, department_id: int = None) -> bool:
+def check_hod_permission(employee: EmployeeRef, department_id: int = None) -> bool:
     """Check if employee has HOD role and optionally department access."""
-    try:
-        employee = employee_storage.get_employee_by_id(employee_id)
-        if employee.role != 'HOD':
-            raise PermissionDeniedException("HOD access required")
-        if department_id and employee.department_id != department_id:
-            raise PermissionDeniedException("Access denied to this department")
-        return True
-    except EntityNotFoundException:
-        raise EntityNotFoundException(f"Employee with id {employee_id} not found")
+    employee = get_employee(employee)
+    if employee.role != 'HOD':
+        raise PermissionDeniedException("HOD access required")
+    if department_id and employee.department_id != department_id:
+        raise PermissionDeniedException("Access denied to this department")
+    return True
 
 
-def check_pod_lead_permission(employee_id: int, pod_id: int = None) -> bool:
+def check_pod_lead_permission(employee: EmployeeRef, pod_id: int = None) -> bool:
     """Check if employee has Pod Lead role and optionally pod access."""
-    try:
-        employee = employee_storage.get_employee_by_id(employee_id)
-        if employee.role not in ['POD_LEAD', 'HOD', 'CEO', 'ADMIN']:
-            raise PermissionDeniedException("Pod Lead access required")
-        if pod_id and employee.pod_id != pod_id and employee.role not in ['HOD', 'CEO', 'ADMIN']:
-            raise PermissionDeniedException("Access denied to this pod")
-        return True
-    except EntityNotFoundException:
-        raise EntityNotFoundException(f"Employee with id {employee_id} not found")
+    employee = get_employee(employee)
+    if employee.role not in ['POD_LEAD', 'HOD', 'CEO', 'ADMIN']:
+        raise PermissionDeniedException("Pod Lead access required")
+    if pod_id and employee.pod_id != pod_id and employee.role not in ['HOD', 'CEO', 'ADMIN']:
+        raise PermissionDeniedException("Access denied to this pod")
+    return True
 
 
-def check_employee_permission(employee_id: int, target_employee_id: int) -> bool:
+def check_employee_permission(employee: EmployeeRef, target_employee_id: int) -> bool:
     """Check if employee can access target employee's data."""
     try:
-        employee = employee_storage.get_employee_by_id(employee_id)
+        employee = get_employee(employee)
         # Employees can access their own data
-        if employee_id == target_employee_id:
+        if employee.id == target_employee_id:
             return True
         # HOD, CEO, ADMIN can access any employee's data
         if employee.role in ['HOD', 'CEO', 'ADMIN']:
@@ -60,35 +66,25 @@ def check_employee_permission(employee_id: int, target_employee_id: int) -> bool
         raise EntityNotFoundException(f"Employee not found")
 
 
-def check_admin_permission(employee_id: int) -> bool:
+def check_admin_permission(employee: EmployeeRef) -> bool:
     """Check if employee has Admin role."""
-    try:
-        employee = employee_storage.get_employee_by_id(employee_id)
-        if employee.role != 'ADMIN':
-            raise PermissionDeniedException("Admin access required")
-        return True
-    except EntityNotFoundException:
-        raise EntityNotFoundException(f"Employee with id {employee_id} not found")
+    employee = get_employee(employee)
+    if employee.role != 'ADMIN':
+        raise PermissionDeniedException("Admin access required")
+    return True
 
 
-def can_upload_file(employee_id: int) -> bool:
+def can_upload_file(employee: EmployeeRef) -> bool:
     """Check if employee can upload files (HOD or Admin)."""
-    try:
-        employee = employee_storage.get_employee_by_id(employee_id)
-        if employee.role in ['HOD', 'ADMIN', 'CEO']:
-            return True
-        raise PermissionDeniedException("File upload requires HOD, Admin, or CEO role")
-    except EntityNotFoundException:
-        raise EntityNotFoundException(f"Employee with id {employee_id} not found")
+    employee = get_employee(employee)
+    if employee.role in ['HOD', 'ADMIN', 'CEO']:
+        return True
+    raise PermissionDeniedException("File upload requires HOD, Admin, or CEO role")
 
 
-def check_automation_permission(employee_id: int) -> bool:
+def check_automation_permission(employee: EmployeeRef) -> bool:
     """Check if employee has Automation role."""
-    try:
-        employee = employee_storage.get_employee_by_id(employee_id)
-        if employee.role != 'AUTOMATION':
-            raise PermissionDeniedException("Automation access required")
-        return True
-    except EntityNotFoundException:
-        raise EntityNotFoundException(f"Employee with id {employee_id} not found")
-
+    employee = get_employee(employee)
+    if employee.role != 'AUTOMATION':
+        raise PermissionDeniedException("Automation access required")
+    return True
@@ -1,11 +1,21 @@
 """Service for generating Pod Lead allocation sheets."""
-import pandas as pd
 from pathlib import Path
 from datetime import date
 from typing import List, Dict, Optional
 from django.conf import settings
+from contributions.services import artifact_manifest_service, xlsx_export_service
 from contributions.storages import employee_storage, pod_storage
 
+# Bump when the sheet layout changes so existing sheets are regenerated
+SHEET_FORMAT_VERSION = 1
+
+SHEET_HEADERS = [
+    'employee_code', 'employee_name', 'email', 'department', 'pod',
+    'product_description', 'product', 'contribution_month',
+    'Academy_product_contribution', 'Intensive_product_contribution',
+    'NIAT_product_contribution', 'is_verified_description'
+]
+
 
 def generate_pod_lead_allocation_sheets(
     pod_id: int,
@@ -23,6 +33,9 @@ def generate_pod_lead_allocation_sheets(
     
     One row per employee-product combination
     
+    The sheet is only rewritten when its rows (pod roster plus product
+    data) differ from the ones it was last generated from.
+    
     Returns:
         Path to generated sheet file
     """
@@ -71,9 +84,6 @@ def generate_pod_lead_allocation_sheets(
                     'is_verified_description': False
                 })
     
-    # Create DataFrame
-    df = pd.DataFrame(sheet_data)
-    
     # Create directory if it doesn't exist
     sheet_dir = Path(settings.MEDIA_ROOT) / 'pod_lead_sheets'
     sheet_dir.mkdir(parents=True, exist_ok=True)
@@ -83,14 +93,13 @@ def generate_pod_lead_allocation_sheets(
     filename = f"pod_{pod_id}_allocation_{month_str}.xlsx"
     file_path = sheet_dir / filename
     
-    # Check if file already exists - reuse it to prevent duplicates
-    if file_path.exists():
-        # File exists, return existing path (no overwrite)
-        return file_path
+    def write(path: Path) -> None:
+        rows = xlsx_export_service.rows_from_dicts(sheet_data, SHEET_HEADERS)
+        xlsx_export_service.write_xlsx(path, [(f'{pod.name}', SHEET_HEADERS, rows)])
     
-    # Save to Excel
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name=f'{pod.name}', index=False)
+    # Rewrite the sheet only if its content changed since it was last generated
+    fingerprint = artifact_manifest_service.compute_fingerprint(SHEET_FORMAT_VERSION, pod.name, sheet_data)
+    artifact_manifest_service.write_artifact(file_path, fingerprint, write)
     
     return file_path
 
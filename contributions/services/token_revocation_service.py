@@ -0,0 +1,67 @@
+"""Service rejecting access tokens whose role, department or pod claims went stale."""
+import time
+from typing import Iterable
+from django.conf import settings
+from django.db import transaction
+
+KEY_PREFIX = 'authz-revoked:'
+
+
+def is_stateless_authz_enabled() -> bool:
+    """Whether authorization uses the access token claims instead of loading the employee."""
+    return get_config().get('ENABLED', False)
+
+
+def get_config() -> dict:
+    """STATELESS_AUTHZ settings."""
+    return getattr(settings, 'STATELESS_AUTHZ', {})
+
+
+def get_cache():
+    """Django cache holding the revocation markers (shared by all processes in production)."""
+    from django.core.cache import caches
+    return caches[get_config().get('CACHE_ALIAS', 'default')]
+
+
+def get_marker_timeout() -> int:
+    """
+    Seconds a revocation marker is kept.
+    
+    Access tokens issued before the marker expire within the access token
+    lifetime, so the marker is not needed any longer than that.
+    """
+    lifetime = settings.SIMPLE_JWT.get('ACCESS_TOKEN_LIFETIME')
+    leeway = settings.SIMPLE_JWT.get('LEEWAY', 0) or 0
+    if hasattr(leeway, 'total_seconds'):
+        leeway = leeway.total_seconds()
+    return int(lifetime.total_seconds() + leeway) + 1
+
+
+def revoke_employee_tokens(employee_ids: Iterable[int]) -> None:
+    """
+    Reject the access tokens issued so far to these employees.
+    
+    Called when an employee's role, department or pod changes (or the
+    employee is deleted). The marker is written once the surrounding
+    transaction commits, so a token refreshed while the change is still
+    uncommitted is rejected as well; tokens issued within the same second
+    as the marker are rejected too and simply refreshed again.
+    """
+    employee_ids = {int(employee_id) for employee_id in employee_ids}
+    if not employee_ids or not is_stateless_authz_enabled():
+        return
+    
+    def write_markers():
+        revoked_at = int(time.time())
+        get_cache().set_many(
+            {f"{KEY_PREFIX}{employee_id}": revoked_at for employee_id in employee_ids},
+            timeout=get_marker_timeout()
+        )
+    
+    transaction.on_commit(write_markers)
+
+
+def is_token_revoked(employee_id: int, issued_at: int) -> bool:
+    """Whether an access token issued at this time (iat claim) was revoked since."""
+    revoked_at = get_cache().get(f"{KEY_PREFIX}{employee_id}")
+    return revoked_at is not None and issued_at <= revoked_at
@@ -0,0 +1,65 @@
+"""Signal receivers keeping derived state in step with model changes."""
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from core.models import Department, Employee, Feature, Pod, Product
+from contributions.models import RawFile
+from contributions.services import metrics_cache_service, token_revocation_service
+from contributions.storages import contribution_rollup_storage, contribution_storage, dimension_cache, employee_storage
+
+
+@receiver(pre_save, sender=Employee)
+def remember_employee_access_scope(sender, instance, **kwargs):
+    """Record the stored role, department and pod of an employee about to be saved."""
+    if instance.pk is None or not token_revocation_service.is_stateless_authz_enabled():
+        return
+    instance._previous_access_scope = employee_storage.get_employee_access_scope(instance.pk)
+
+
+@receiver(post_save, sender=Employee)
+def revoke_tokens_on_scope_change(sender, instance, created, **kwargs):
+    """Reject the employee's access tokens once its role, department or pod changed."""
+    previous = instance.__dict__.pop('_previous_access_scope', None)
+    if created or previous is None:
+        return
+    if previous != (instance.role, instance.department_id, instance.pod_id):
+        token_revocation_service.revoke_employee_tokens([instance.pk])
+
+
+@receiver(post_delete, sender=Employee)
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    """Reject the access tokens of a deleted employee."""
+    token_revocation_service.revoke_employee_tokens([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=Pod)
+def invalidate_dimension_cache(sender, **kwargs):
+    """Reload the cached dimension tables after a product, department or pod changed."""
+    dimension_cache.invalidate()
+
+
+@receiver(pre_delete, sender=RawFile)
+def subtract_rollups_on_raw_file_delete(sender, instance, **kwargs):
+    """
+    Remove the records of a raw file from the monthly rollups before its delete cascades to them.
+    
+    Runs in the transaction of the delete. Deleting an employee, department,
+    pod or product needs no receiver: the delete cascades to their rollup
+    rows together with their records.
+    """
+    months = contribution_storage.get_contribution_months_by_source_file(instance.pk)
+    if not months:
+        return
+    contribution_rollup_storage.subtract_contributions_by_source_file(instance.pk)
+    metrics_cache_service.invalidate_months(months)
+
+
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=Pod)
+@receiver([post_save, post_delete], sender=Feature)
+def invalidate_metrics_on_roster_change(sender, **kwargs):
+    """Drop cached dashboards of every month, which show these names and pod rosters."""
+    metrics_cache_service.invalidate_all()
@@ -0,0 +1,207 @@
+"""Storage layer for ContributionMonthlyRollup entities."""
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List, Dict
+from django.db.models import Sum, Count
+from django.db import transaction
+from contributions.models import ContributionRecord, ContributionMonthlyRollup
+from .storage_dto import ContributionRecordDTO
+
+
+ROLLUP_KEY_FIELDS = ('contribution_month', 'department_id', 'pod_id', 'employee_id', 'product_id', 'feature_id')
+
+
+def apply_contributions(records: Iterable[ContributionRecordDTO]) -> int:
+    """
+    Add newly written contribution records to the monthly rollups.
+    
+    Returns:
+        Number of rollup rows touched
+    """
+    deltas = {}
+    for record in records:
+        key = tuple(getattr(record, field) for field in ROLLUP_KEY_FIELDS)
+        hours, count = deltas.get(key, (Decimal('0'), 0))
+        deltas[key] = (hours + Decimal(str(record.effort_hours)), count + 1)
+    return apply_deltas(deltas)
+
+
+def subtract_contributions_by_source_file(source_file_id: int) -> int:
+    """
+    Remove the records of a source file from the monthly rollups.
+    
+    Must be called before the records themselves are deleted.
+    
+    Returns:
+        Number of rollup rows touched
+    """
+    aggregates = ContributionRecord.objects.filter(
+        source_file_id=source_file_id
+    ).values(*ROLLUP_KEY_FIELDS).annotate(
+        hours=Sum('effort_hours'),
+        record_count=Count('id')
+    ).order_by()
+    
+    deltas = {
+        tuple(agg[field] for field in ROLLUP_KEY_FIELDS): (-(agg['hours'] or Decimal('0')), -agg['record_count'])
+        for agg in aggregates
+    }
+    return apply_deltas(deltas)
+
+
+def apply_deltas(deltas: Dict[tuple, tuple]) -> int:
+    """
+    Apply (hours, record_count) deltas keyed by ROLLUP_KEY_FIELDS tuples.
+    
+    Existing rollup rows are locked and updated, missing ones are created and
+    rows that no longer cover any record are removed.
+    """
+    if not deltas:
+        return 0
+    
+    months = {key[0] for key in deltas}
+    employee_ids = {key[3] for key in deltas}
+    
+    with transaction.atomic():
+        existing = {}
+        rollups = ContributionMonthlyRollup.objects.select_for_update().filter(
+            contribution_month__in=months,
+            employee_id__in=employee_ids
+        )
+        for rollup in rollups:
+            key = tuple(getattr(rollup, field) for field in ROLLUP_KEY_FIELDS)
+            # Duplicate keys (e.g. after a feature was deleted) are harmless for
+            # readers since they always sum; fold new deltas into the first row
+            existing.setdefault(key, rollup)
+        
+        to_create = []
+        to_update = []
+        to_delete = []
+        for key, (hours, count) in deltas.items():
+            rollup = existing.get(key)
+            if rollup is None:
+                if count <= 0:
+                    continue
+                to_create.append(ContributionMonthlyRollup(
+                    hours=hours,
+                    record_count=count,
+                    **dict(zip(ROLLUP_KEY_FIELDS, key))
+                ))
+                continue
+            
+            rollup.hours += hours
+            rollup.record_count += count
+            if rollup.record_count <= 0:
+                to_delete.append(rollup.id)
+            else:
+                to_update.append(rollup)
+        
+        if to_update:
+            ContributionMonthlyRollup.objects.bulk_update(to_update, ['hours', 'record_count'], batch_size=1000)
+        if to_create:
+            ContributionMonthlyRollup.objects.bulk_create(to_create, batch_size=1000)
+        if to_delete:
+            ContributionMonthlyRollup.objects.filter(id__in=to_delete).delete()
+    
+    return len(to_update) + len(to_create) + len(to_delete)
+
+
+def rebuild_month(month: date) -> int:
+    """
+    Rebuild the rollups of a month from the raw contribution records.
+    
+    Returns:
+        Number of rollup rows created
+    """
+    with transaction.atomic():
+        ContributionMonthlyRollup.objects.filter(contribution_month=month).delete()
+        rollups = [
+            ContributionMonthlyRollup(
+                hours=row['hours'] or Decimal('0'),
+                record_count=row['record_count'],
+                **{field: row[field] for field in ROLLUP_KEY_FIELDS}
+            )
+            for row in _aggregate_raw_month(month)
+        ]
+        ContributionMonthlyRollup.objects.bulk_create(rollups, batch_size=1000)
+    return len(rollups)
+
+
+def find_month_mismatches(month: date) -> List[Dict]:
+    """
+    Compare the rollups of a month against the raw contribution records.
+    
+    Returns:
+        List of dicts describing every key whose hours or record count differ
+    """
+    expected = {
+        tuple(row[field] for field in ROLLUP_KEY_FIELDS): (row['hours'] or Decimal('0'), row['record_count'])
+        for row in _aggregate_raw_month(month)
+    }
+    
+    actual = {}
+    rollups = ContributionMonthlyRollup.objects.filter(
+        contribution_month=month
+    ).values(*ROLLUP_KEY_FIELDS).annotate(
+        hours_sum=Sum('hours'),
+        record_count_sum=Sum('record_count')
+    ).order_by()
+    for row in rollups:
+        actual[tuple(row[field] for field in ROLLUP_KEY_FIELDS)] = (row['hours_sum'] or Decimal('0'), row['record_count_sum'])
+    
+    mismatches = []
+    for key in set(expected) | set(actual):
+        expected_hours, expected_count = expected.get(key, (Decimal('0'), 0))
+        actual_hours, actual_count = actual.get(key, (Decimal('0'), 0))
+        if expected_hours != actual_hours or expected_count != actual_count:
+            mismatches.append({
+                **dict(zip(ROLLUP_KEY_FIELDS, key)),
+                'expected_hours': expected_hours,
+                'actual_hours': actual_hours,
+                'expected_count': expected_count,
+                'actual_count': actual_count,
+            })
+    return mismatches
+
+
+def list_contribution_months() -> List[date]:
+    """List every month that has raw contribution records or rollups."""
+    raw_months = set(ContributionRecord.objects.values_list('contribution_month', flat=True).distinct())
+    rollup_months = set(ContributionMonthlyRollup.objects.values_list('contribution_month', flat=True).distinct())
+    return sorted(raw_months | rollup_months)
+
+
+def get_total_hours_by_month(month: date) -> Decimal:
+    """Get total hours for a month across all contributions."""
+    result = ContributionMonthlyRollup.objects.filter(
+        contribution_month=month
+    ).aggregate(total=Sum('hours'))
+    return result['total'] or Decimal('0')
+
+
+def get_total_hours_by_product(product_id: int, month: date) -> Decimal:
+    """Get total hours for a product in a month."""
+    result = ContributionMonthlyRollup.objects.filter(
+        product_id=product_id,
+        contribution_month=month
+    ).aggregate(total=Sum('hours'))
+    return result['total'] or Decimal('0')
+
+
+def get_total_hours_by_employee(employee_id: int, month: date) -> Decimal:
+    """Get total hours for an employee in a month."""
+    result = ContributionMonthlyRollup.objects.filter(
+        employee_id=employee_id,
+        contribution_month=month
+    ).aggregate(total=Sum('hours'))
+    return result['total'] or Decimal('0')
+
+
+def _aggregate_raw_month(month: date):
+    """Group raw contribution records of a month by rollup key."""
+    return ContributionRecord.objects.filter(
+        contribution_month=month
+    ).values(*ROLLUP_KEY_FIELDS).annotate(
+        hours=Sum('effort_hours'),
+        record_count=Count('id')
+    ).order_by()
@@ -1,10 +1,12 @@
 """Storage layer for ContributionRecord entities."""
 from datetime import date
 from decimal import Decimal
+from typing import Iterator, Optional, Tuple
 from django.db.models import Sum, Q
 from django.db import transaction
 from contributions.models import ContributionRecord
 from .storage_dto import ContributionRecordDTO
+from . import contribution_rollup_storage, dimension_cache
 from ..exceptions import EntityNotFoundException
 
 
@@ -20,30 +22,33 @@ def create_contribution_record(
     description: str = None
 ) -> ContributionRecordDTO:
     """Create a single contribution record."""
-    record = ContributionRecord.objects.create(
-        employee_id=employee_id,
-        department_id=department_id,
-        pod_id=pod_id,
-        product_id=product_id,
-        feature_id=feature_id,
-        contribution_month=contribution_month,
-        effort_hours=effort_hours,
-        description=description,
-        source_file_id=source_file_id,
-    )
-    record.refresh_from_db()
-    return ContributionRecordDTO(
-        id=record.id,
-        employee_id=record.employee_id,
-        department_id=record.department_id,
-        pod_id=record.pod_id,
-        product_id=record.product_id,
-        feature_id=record.feature_id,
-        contribution_month=record.contribution_month,
-        effort_hours=record.effort_hours,
-        description=record.description,
-        source_file_id=record.source_file_id,
-    )
+    with transaction.atomic():
+        record = ContributionRecord.objects.create(
+            employee_id=employee_id,
+            department_id=department_id,
+            pod_id=pod_id,
+            product_id=product_id,
+            feature_id=feature_id,
+            contribution_month=contribution_month,
+            effort_hours=effort_hours,
+            description=description,
+            source_file_id=source_file_id,
+        )
+        record.refresh_from_db()
+        record_dto = ContributionRecordDTO(
+            id=record.id,
+            employee_id=record.employee_id,
+            department_id=record.department_id,
+            pod_id=record.pod_id,
+            product_id=record.product_id,
+            feature_id=record.feature_id,
+            contribution_month=record.contribution_month,
+            effort_hours=record.effort_hours,
+            description=record.description,
+            source_file_id=record.source_file_id,
+        )
+        contribution_rollup_storage.apply_contributions([record_dto])
+    return record_dto
 
 
 def bulk_create_contributions(records: list[ContributionRecordDTO], source_file_id: int) -> int:
@@ -66,40 +71,105 @@ def bulk_create_contributions(records: list[ContributionRecordDTO], source_file_
     
     with transaction.atomic():
         created = ContributionRecord.objects.bulk_create(contribution_records, batch_size=1000)
+        contribution_rollup_storage.apply_contributions(records)
     return len(created)
 
 
+def delete_contributions_by_source_file(source_file_id: int) -> int:
+    """Delete all contribution records created from a source file."""
+    with transaction.atomic():
+        contribution_rollup_storage.subtract_contributions_by_source_file(source_file_id)
+        deleted_count, _ = ContributionRecord.objects.filter(source_file_id=source_file_id).delete()
+    return deleted_count
+
+
+def get_contribution_months_by_source_file(source_file_id: int) -> list[date]:
+    """Get the distinct contribution months of the records created from a source file."""
+    return list(
+        ContributionRecord.objects.filter(
+            source_file_id=source_file_id
+        ).values_list('contribution_month', flat=True).distinct().order_by('contribution_month')
+    )
+
+
+# Fields read by iter_contribution_rows; department, pod and product names come from the dimension cache
+CONTRIBUTION_ROW_FIELDS = (
+    'id', 'employee_id', 'department_id', 'pod_id', 'product_id', 'contribution_month', 'effort_hours',
+    'source_file_id', 'feature_id', 'description', 'employee__employee_code', 'employee__name', 'feature__name',
+    'created_at', 'updated_at',
+)
+
+
+def iter_contribution_rows(
+    month: Optional[date] = None,
+    department_id: Optional[int] = None,
+    pod_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    employee_id: Optional[int] = None,
+    after: Optional[Tuple[date, int]] = None,
+    limit: Optional[int] = None,
+    chunk_size: int = 2000
+) -> Iterator[ContributionRecordDTO]:
+    """
+    Stream contribution records in (contribution_month, id) order.
+    
+    Rows are read as tuples in chunks (nothing is cached on the queryset)
+    and only joined with employees and features; department, pod and
+    product names come from the dimension cache. Filters left as None are
+    not applied.
+    
+    Args:
+        after: (contribution_month, id) of the last row already read (keyset cursor)
+        limit: Maximum number of rows (all rows if None)
+        chunk_size: Rows fetched from the database at a time
+    """
+    filters = {
+        'contribution_month': month,
+        'department_id': department_id,
+        'pod_id': pod_id,
+        'product_id': product_id,
+        'employee_id': employee_id,
+    }
+    rows = ContributionRecord.objects.filter(**{field: value for field, value in filters.items() if value is not None})
+    if after is not None:
+        after_month, after_id = after
+        rows = rows.filter(Q(contribution_month__gt=after_month) | Q(contribution_month=after_month, id__gt=after_id))
+    rows = rows.order_by('contribution_month', 'id').values_list(*CONTRIBUTION_ROW_FIELDS)
+    if limit is not None:
+        rows = rows[:limit]
+    
+    # Copies of the cached tables; rows looked up after a miss are added to them
+    departments = {None: None, **dimension_cache.departments.get_maps()[0]}
+    pods = {None: None, **dimension_cache.pods.get_maps()[0]}
+    products = dict(dimension_cache.products.get_maps()[0])
+    for (record_id, employee_id, department_id, pod_id, product_id, contribution_month, effort_hours, source_file_id,
+         feature_id, description, employee_code, employee_name, feature_name, created_at, updated_at) in rows.iterator(chunk_size=chunk_size):
+        if department_id not in departments:
+            departments[department_id] = dimension_cache.departments.get_by_id(department_id)
+        if pod_id not in pods:
+            pods[pod_id] = dimension_cache.pods.get_by_id(pod_id)
+        if product_id not in products:
+            products[product_id] = dimension_cache.products.get_by_id(product_id)
+        department = departments[department_id]
+        pod = pods[pod_id]
+        product = products[product_id]
+        # Positional, in field order
+        yield ContributionRecordDTO(
+            record_id, employee_id, department_id, pod_id, product_id, contribution_month, effort_hours,
+            source_file_id, feature_id, description, employee_code, employee_name,
+            department.name if department else None,
+            pod.name if pod else None,
+            product.name if product else None,
+            feature_name, created_at, updated_at,
+        )
+
+
 def get_contributions_by_month(month: date) -> list[ContributionRecordDTO]:
     """Get contributions by month."""
     contributions = ContributionRecord.objects.filter(
         contribution_month=month
-    ).select_related(
-        'employee', 'department', 'pod', 'product', 'feature'
     ).order_by('employee', 'product')
-    
-    return [
-        ContributionRecordDTO(
-            id=contrib.id,
-            employee_id=contrib.employee_id,
-            department_id=contrib.department_id,
-            pod_id=contrib.pod_id,
-            product_id=contrib.product_id,
-            feature_id=contrib.feature_id,
-            contribution_month=contrib.contribution_month,
-            effort_hours=contrib.effort_hours,
-            description=contrib.description,
-            source_file_id=contrib.source_file_id,
-            employee_code=contrib.employee.employee_code,
-            employee_name=contrib.employee.name,
-            department_name=contrib.department.name,
-            pod_name=contrib.pod.name,
-            product_name=contrib.product.name,
-            feature_name=contrib.feature.name if contrib.feature else None,
-            created_at=contrib.created_at,
-            updated_at=contrib.updated_at,
-        )
-        for contrib in contributions
-    ]
+    return _to_dtos(contributions)
 
 
 def get_contributions_by_employee(employee_id: int, month: date) -> list[ContributionRecordDTO]:
@@ -107,33 +177,8 @@ def get_contributions_by_employee(employee_id: int, month: date) -> list[Contrib
     contributions = ContributionRecord.objects.filter(
         employee_id=employee_id,
         contribution_month=month
-    ).select_related(
-        'employee', 'department', 'pod', 'product', 'feature'
     ).order_by('product', 'feature')
-    
-    return [
-        ContributionRecordDTO(
-            id=contrib.id,
-            employee_id=contrib.employee_id,
-            department_id=contrib.department_id,
-            pod_id=contrib.pod_id,
-            product_id=contrib.product_id,
-            feature_id=contrib.feature_id,
-            contribution_month=contrib.contribution_month,
-            effort_hours=contrib.effort_hours,
-            description=contrib.description,
-            source_file_id=contrib.source_file_id,
-            employee_code=contrib.employee.employee_code,
-            employee_name=contrib.employee.name,
-            department_name=contrib.department.name,
-            pod_name=contrib.pod.name,
-            product_name=contrib.product.name,
-            feature_name=contrib.feature.name if contrib.feature else None,
-            created_at=contrib.created_at,
-            updated_at=contrib.updated_at,
-        )
-        for contrib in contributions
-    ]
+    return _to_dtos(contributions)
 
 
 def get_contributions_by_pod(pod_id: int, month: date) -> list[ContributionRecordDTO]:
@@ -141,33 +186,8 @@ def get_contributions_by_pod(pod_id: int, month: date) -> list[ContributionRecor
     contributions = ContributionRecord.objects.filter(
         pod_id=pod_id,
         contribution_month=month
-    ).select_related(
-        'employee', 'department', 'pod', 'product', 'feature'
     ).order_by('employee', 'product')
-    
-    return [
-        ContributionRecordDTO(
-            id=contrib.id,
-            employee_id=contrib.employee_id,
-            department_id=contrib.department_id,
-            pod_id=contrib.pod_id,
-            product_id=contrib.product_id,
-            feature_id=contrib.feature_id,
-            contribution_month=contrib.contribution_month,
-            effort_hours=contrib.effort_hours,
-            description=contrib.description,
-            source_file_id=contrib.source_file_id,
-            employee_code=contrib.employee.employee_code,
-            employee_name=contrib.employee.name,
-            department_name=contrib.department.name,
-            pod_name=contrib.pod.name,
-            product_name=contrib.product.name,
-            feature_name=contrib.feature.name if contrib.feature else None,
-            created_at=contrib.created_at,
-            updated_at=contrib.updated_at,
-        )
-        for contrib in contributions
-    ]
+    return _to_dtos(contributions)
 
 
 def get_contributions_by_department(department_id: int, month: date) -> list[ContributionRecordDTO]:
@@ -175,33 +195,8 @@ def get_contributions_by_department(department_id: int, month: date) -> list[Con
     contributions = ContributionRecord.objects.filter(
         department_id=department_id,
         contribution_month=month
-    ).select_related(
-        'employee', 'department', 'pod', 'product', 'feature'
     ).order_by('pod', 'employee', 'product')
-    
-    return [
-        ContributionRecordDTO(
-            id=contrib.id,
-            employee_id=contrib.employee_id,
-            department_id=contrib.department_id,
-            pod_id=contrib.pod_id,
-            product_id=contrib.product_id,
-            feature_id=contrib.feature_id,
-            contribution_month=contrib.contribution_month,
-            effort_hours=contrib.effort_hours,
-            description=contrib.description,
-            source_file_id=contrib.source_file_id,
-            employee_code=contrib.employee.employee_code,
-            employee_name=contrib.employee.name,
-            department_name=contrib.department.name,
-            pod_name=contrib.pod.name,
-            product_name=contrib.product.name,
-            feature_name=contrib.feature.name if contrib.feature else None,
-            created_at=contrib.created_at,
-            updated_at=contrib.updated_at,
-        )
-        for contrib in contributions
-    ]
+    return _to_dtos(contributions)
 
 
 def get_contributions_by_product(product_id: int, month: date) -> list[ContributionRecordDTO]:
@@ -209,33 +204,13 @@ def get_contributions_by_product(product_id: int, month: date) -> list[Contribut
     contributions = ContributionRecord.objects.filter(
         product_id=product_id,
         contribution_month=month
-    ).select_related(
-        'employee', 'department', 'pod', 'product', 'feature'
     ).order_by('department', 'pod', 'employee')
-    
-    return [
-        ContributionRecordDTO(
-            id=contrib.id,
-            employee_id=contrib.employee_id,
-            department_id=contrib.department_id,
-            pod_id=contrib.pod_id,
-            product_id=contrib.product_id,
-            feature_id=contrib.feature_id,
-            contribution_month=contrib.contribution_month,
-            effort_hours=contrib.effort_hours,
-            description=contrib.description,
-            source_file_id=contrib.source_file_id,
-            employee_code=contrib.employee.employee_code,
-            employee_name=contrib.employee.name,
-            department_name=contrib.department.name,
-            pod_name=contrib.pod.name,
-            product_name=contrib.product.name,
-            feature_name=contrib.feature.name if contrib.feature else None,
-            created_at=contrib.created_at,
-            updated_at=contrib.updated_at,
-        )
-        for contrib in contributions
-    ]
+    return _to_dtos(contributions)
+
+
+def _to_dtos(contributions) -> list[ContributionRecordDTO]:
+    """DTOs of a queryset, read as row tuples without instantiating the records and their related models."""
+    return [ContributionRecordDTO.from_values(row) for row in contributions.values_list(*ContributionRecordDTO.VALUES_FIELDS)]
 
 
 def get_total_hours_by_month(month: date) -> Decimal:
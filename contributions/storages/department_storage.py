@@ -1,25 +1,24 @@
 """Storage layer for Department entities."""
 from core.models import Department
+from . import dimension_cache
 from .storage_dto import DepartmentDTO
 from ..exceptions import EntityNotFoundException
 
 
 def get_department_by_id(department_id: int) -> DepartmentDTO:
     """Get department by ID."""
-    try:
-        dept = Department.objects.get(id=department_id)
-        return DepartmentDTO(
-            id=dept.id,
-            name=dept.name,
-            created_at=dept.created_at,
-            updated_at=dept.updated_at,
-        )
-    except Department.DoesNotExist:
+    dept = dimension_cache.departments.get_by_id(department_id)
+    if dept is None:
         raise EntityNotFoundException(f"Department with id {department_id} not found")
+    return dept
 
 
 def get_or_create_department(name: str) -> DepartmentDTO:
     """Get or create a department."""
+    cached = dimension_cache.departments.get_by_key(name)
+    if cached is not None:
+        return cached
+    
     dept, _ = Department.objects.get_or_create(name=name)
     return DepartmentDTO(
         id=dept.id,
@@ -29,16 +28,41 @@ def get_or_create_department(name: str) -> DepartmentDTO:
     )
 
 
+def bulk_get_or_create_department_ids(names) -> dict[str, int]:
+    """
+    Get or create departments for many names at once.
+    
+    Returns:
+        Dict mapping each name to its department ID
+    """
+    names = list(dict.fromkeys(names))
+    by_name = dimension_cache.departments.get_maps()[1]
+    ids = {name: by_name[name].id for name in names if name in by_name}
+    missing = [name for name in names if name not in ids]
+    if missing:
+        Department.objects.bulk_create([Department(name=name) for name in missing], ignore_conflicts=True)
+        dimension_cache.invalidate()
+        ids.update(Department.objects.filter(name__in=missing).values_list('name', 'id'))
+    
+    # Names matched by a case-insensitive collation fall back to a single lookup
+    for name in [name for name in names if name not in ids]:
+        ids[name] = get_or_create_department(name).id
+    return ids
+
+
+def list_departments_by_ids(department_ids: list[int]) -> list[DepartmentDTO]:
+    """List departments with the given IDs."""
+    department_ids = set(department_ids)
+    by_id = dimension_cache.departments.get_maps()[0]
+    if not department_ids <= by_id.keys():
+        # Reloads the table if a department was written after it was cached
+        for department_id in department_ids - by_id.keys():
+            dimension_cache.departments.get_by_id(department_id)
+        by_id = dimension_cache.departments.get_maps()[0]
+    return [dept for dept in by_id.values() if dept.id in department_ids]
+
+
 def list_departments() -> list[DepartmentDTO]:
     """List all departments."""
-    departments = Department.objects.all().order_by('name')
-    return [
-        DepartmentDTO(
-            id=dept.id,
-            name=dept.name,
-            created_at=dept.created_at,
-            updated_at=dept.updated_at,
-        )
-        for dept in departments
-    ]
+    return dimension_cache.departments.list()
 
@@ -0,0 +1,164 @@
+"""Process-local cache of the dimension tables (products, departments, pods)."""
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+from django.conf import settings
+from django.db import connection, transaction
+from core.models import Department, Pod, Product
+from .storage_dto import DepartmentDTO, PodDTO, ProductDTO
+
+VERSION_KEY = 'dimension-cache-version'
+
+
+class DimensionTable:
+    """
+    One dimension table held in memory as id -> DTO and key -> DTO maps.
+    
+    The whole table is loaded on first use (these tables hold a few dozen
+    rows and change about once a month) and reloaded after the dimension
+    version changed, after DIMENSION_CACHE_TIMEOUT seconds, or when a
+    lookup misses (the row may have been written by another process).
+    Ids and keys still missing after such a reload are remembered until
+    the next load, so unknown ones do not reload the table on every call.
+    """
+    
+    def __init__(self, load: Callable[[], List], key: Callable[[object], Hashable]):
+        self._load = load
+        self._key = key
+        self._lock = threading.Lock()
+        self._version = None
+        self._loaded_at = 0.0
+        self._by_id: Dict[int, object] = {}
+        self._by_key: Dict[Hashable, object] = {}
+        # Ids and keys not found by a reload since the last load
+        self._missing: Tuple[Set[int], Set[Hashable]] = (set(), set())
+    
+    def get_maps(self) -> Tuple[Dict[int, object], Dict[Hashable, object]]:
+        """(id -> DTO, key -> DTO) maps of the current version, in table order."""
+        if has_uncommitted_writes():
+            # This transaction wrote dimension rows, which may still roll back:
+            # read its view of the table instead of sharing it
+            return self._load_maps()
+        
+        version = get_version()
+        with self._lock:
+            if self._version != version or time.monotonic() - self._loaded_at >= _get_timeout():
+                self._reload()
+                self._version = version
+            return self._by_id, self._by_key
+    
+    def get_by_id(self, row_id: int):
+        return self._get(0, row_id)
+    
+    def get_by_key(self, key: Hashable):
+        return self._get(1, key)
+    
+    def list(self) -> list:
+        return list(self.get_maps()[0].values())
+    
+    def _get(self, index: int, lookup: Hashable):
+        """Row by id (index 0) or key (index 1)."""
+        row = self.get_maps()[index].get(lookup)
+        if row is not None or has_uncommitted_writes():
+            return row
+        with self._lock:
+            if lookup in self._missing[index]:
+                return None
+            # Written by another process whose version change was not seen yet, or unknown
+            self._reload()
+            row = (self._by_id, self._by_key)[index].get(lookup)
+            if row is None:
+                self._missing[index].add(lookup)
+            return row
+    
+    def _reload(self) -> None:
+        """Load the shared maps from the database (the caller holds the lock)."""
+        self._by_id, self._by_key = self._load_maps()
+        self._missing = (set(), set())
+        self._loaded_at = time.monotonic()
+    
+    def _load_maps(self) -> Tuple[Dict[int, object], Dict[Hashable, object]]:
+        rows = self._load()
+        return {row.id: row for row in rows}, {self._key(row): row for row in rows}
+
+
+def _load_products() -> List[ProductDTO]:
+    return _load(Product, ProductDTO)
+
+
+def _load_departments() -> List[DepartmentDTO]:
+    return _load(Department, DepartmentDTO)
+
+
+def _load_pods() -> List[PodDTO]:
+    return _load(Pod, PodDTO)
+
+
+def _load(model, dto_class) -> list:
+    rows = model.objects.order_by('name', 'id').values_list(*dto_class.VALUES_FIELDS)
+    return [dto_class.from_values(row) for row in rows]
+
+
+products = DimensionTable(_load_products, key=lambda product: product.name)
+departments = DimensionTable(_load_departments, key=lambda dept: dept.name)
+pods = DimensionTable(_load_pods, key=lambda pod: (pod.name, pod.department_id))
+
+
+def _get_cache():
+    from django.core.cache import caches
+    return caches[getattr(settings, 'DIMENSION_CACHE_ALIAS', 'default')]
+
+
+def _get_timeout() -> float:
+    return getattr(settings, 'DIMENSION_CACHE_TIMEOUT', 60)
+
+
+def get_version() -> Optional[str]:
+    """
+    Current dimension version, shared by all processes through the Django cache.
+    
+    Every process holding tables of another version reloads them. A
+    version that was evicted from the cache is replaced by a new one, so
+    tables are never reused across an eviction. With a per-process cache
+    (the default local memory cache) other processes only see a change
+    once their tables are DIMENSION_CACHE_TIMEOUT seconds old.
+    """
+    cache = _get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def has_uncommitted_writes() -> bool:
+    """Whether the current transaction wrote dimension rows that are not committed yet."""
+    if not getattr(connection, '_dimension_cache_dirty', False):
+        return False
+    if connection.in_atomic_block:
+        return True
+    # The transaction was rolled back
+    connection._dimension_cache_dirty = False
+    return False
+
+
+def invalidate() -> None:
+    """
+    Make every process reload the dimension tables on next use.
+    
+    Called from the post_save/post_delete receivers of the dimension
+    models and after bulk writes (which send no signals). Inside a
+    transaction the shared version changes once it commits; until the
+    transaction ends it reads the tables from the database, so rows it
+    wrote are never shared and rows rolled back are never served.
+    """
+    def bump():
+        connection._dimension_cache_dirty = False
+        _get_cache().set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    
+    if connection.in_atomic_block:
+        connection._dimension_cache_dirty = True
+        transaction.on_commit(bump)
+    else:
+        bump()
@@ -1,4 +1,5 @@
 """Storage layer for Employee entities."""
+from django.utils import timezone
 from core.models import Employee
 from .storage_dto import EmployeeDTO
 from ..exceptions import EntityNotFoundException
@@ -7,20 +8,8 @@ from ..exceptions import EntityNotFoundException
 def get_employee_by_code(employee_code: str) -> EmployeeDTO:
     """Get employee by employee code."""
     try:
-        employee = Employee.objects.select_related('department', 'pod').get(employee_code=employee_code)
-        return EmployeeDTO(
-            id=employee.id,
-            employee_code=employee.employee_code,
-            name=employee.name,
-            email=employee.email,
-            department_id=employee.department_id,
-            pod_id=employee.pod_id,
-            role=employee.role,
-            department_name=employee.department.name if employee.department else None,
-            pod_name=employee.pod.name if employee.pod else None,
-            created_at=employee.created_at,
-            updated_at=employee.updated_at,
-        )
+        row = Employee.objects.values_list(*EmployeeDTO.VALUES_FIELDS).get(employee_code=employee_code)
+        return EmployeeDTO.from_values(row)
     except Employee.DoesNotExist:
         raise EntityNotFoundException(f"Employee with code {employee_code} not found")
 
@@ -28,20 +17,8 @@ def get_employee_by_code(employee_code: str) -> EmployeeDTO:
 def get_employee_by_id(employee_id: int) -> EmployeeDTO:
     """Get employee by ID."""
     try:
-        employee = Employee.objects.select_related('department', 'pod').get(id=employee_id)
-        return EmployeeDTO(
-            id=employee.id,
-            employee_code=employee.employee_code,
-            name=employee.name,
-            email=employee.email,
-            department_id=employee.department_id,
-            pod_id=employee.pod_id,
-            role=employee.role,
-            department_name=employee.department.name if employee.department else None,
-            pod_name=employee.pod.name if employee.pod else None,
-            created_at=employee.created_at,
-            updated_at=employee.updated_at,
-        )
+        row = Employee.objects.values_list(*EmployeeDTO.VALUES_FIELDS).get(id=employee_id)
+        return EmployeeDTO.from_values(row)
     except Employee.DoesNotExist:
         raise EntityNotFoundException(f"Employee with id {employee_id} not found")
 
@@ -101,23 +78,132 @@ def get_or_create_employee(
     )
 
 
+def bulk_upsert_employees(employees: dict[str, dict]) -> dict[str, int]:
+    """
+    Create or update many employees at once.
+    
+    Applies the same field updates as get_or_create_employee: existing
+    employees get the given name, email, department, pod and the
+    EMPLOYEE role; new employees are created with them.
+    
+    Args:
+        employees: Dict mapping employee_code to a dict with 'name', 'email',
+            'department_id' and 'pod_id'
+    
+    Returns:
+        Dict mapping each employee_code to its employee ID
+    """
+    now = timezone.now()
+    existing = Employee.objects.filter(employee_code__in=employees.keys())
+    
+    to_update = []
+    for employee in existing:
+        fields = employees.get(employee.employee_code)
+        if fields is None:
+            continue
+        employee.name = fields['name']
+        employee.email = fields['email']
+        if fields.get('department_id'):
+            employee.department_id = fields['department_id']
+        if fields.get('pod_id'):
+            employee.pod_id = fields['pod_id']
+        employee.role = 'EMPLOYEE'
+        employee.updated_at = now
+        to_update.append(employee)
+    
+    if to_update:
+        Employee.objects.bulk_update(
+            to_update, ['name', 'email', 'department_id', 'pod_id', 'role', 'updated_at'], batch_size=1000
+        )
+    
+    ids = {employee.employee_code: employee.id for employee in to_update}
+    missing = [code for code in employees if code not in ids]
+    if missing:
+        Employee.objects.bulk_create(
+            [
+                Employee(
+                    employee_code=code,
+                    name=employees[code]['name'],
+                    email=employees[code]['email'],
+                    department_id=employees[code].get('department_id'),
+                    pod_id=employees[code].get('pod_id'),
+                    role='EMPLOYEE',
+                )
+                for code in missing
+            ],
+            batch_size=1000,
+            ignore_conflicts=True
+        )
+        ids.update(Employee.objects.filter(employee_code__in=missing).values_list('employee_code', 'id'))
+    
+    # Codes matched by a case-insensitive collation fall back to a single upsert
+    for code in [code for code in employees if code not in ids]:
+        fields = employees[code]
+        ids[code] = get_or_create_employee(
+            employee_code=code,
+            name=fields['name'],
+            email=fields['email'],
+            department_id=fields.get('department_id'),
+            pod_id=fields.get('pod_id'),
+        ).id
+    return ids
+
+
+def get_employee_access_scope(employee_id: int):
+    """
+    Role, department and pod of an employee (the scope carried by its access tokens).
+    
+    Returns:
+        Tuple of (role, department_id, pod_id), or None if the employee does not exist
+    """
+    return Employee.objects.filter(id=employee_id).values_list('role', 'department_id', 'pod_id').first()
+
+
+def get_employee_ids_with_changed_scope(employees: dict[str, dict]) -> list[int]:
+    """
+    IDs of existing employees whose role, department or pod bulk_upsert_employees would change.
+    
+    Args:
+        employees: Same dict as passed to bulk_upsert_employees
+    """
+    changed = []
+    existing = Employee.objects.filter(employee_code__in=employees.keys()).values_list(
+        'id', 'employee_code', 'role', 'department_id', 'pod_id'
+    )
+    for employee_id, employee_code, role, department_id, pod_id in existing:
+        fields = employees.get(employee_code)
+        if fields is None:
+            continue
+        if (
+            role != 'EMPLOYEE'
+            or (fields.get('department_id') and fields['department_id'] != department_id)
+            or (fields.get('pod_id') and fields['pod_id'] != pod_id)
+        ):
+            changed.append(employee_id)
+    return changed
+
+
+def get_employees_by_ids(employee_ids) -> dict[int, EmployeeDTO]:
+    """
+    Get many employees by ID in one query.
+    
+    Returns:
+        Dict mapping each employee ID to its EmployeeDTO
+    
+    Raises:
+        EntityNotFoundException if any of the employees does not exist
+    """
+    employee_ids = set(employee_ids)
+    rows = Employee.objects.filter(id__in=employee_ids).values_list(*EmployeeDTO.VALUES_FIELDS)
+    employees = {row[0]: EmployeeDTO.from_values(row) for row in rows}
+    missing = employee_ids - employees.keys()
+    if missing:
+        raise EntityNotFoundException(f"Employee with id {min(missing)} not found")
+    return employees
+
+
 def list_employees_by_pod(pod_id: int) -> list[EmployeeDTO]:
     """List employees by pod."""
-    employees = Employee.objects.filter(pod_id=pod_id).select_related('department', 'pod').order_by('name')
-    return [
-        EmployeeDTO(
-            id=emp.id,
-            employee_code=emp.employee_code,
-            name=emp.name,
-            email=emp.email,
-            department_id=emp.department_id,
-            pod_id=emp.pod_id,
-            role=emp.role,
-            department_name=emp.department.name if emp.department else None,
-            pod_name=emp.pod.name if emp.pod else None,
-            created_at=emp.created_at,
-            updated_at=emp.updated_at,
-        )
-        for emp in employees
-    ]
+    rows = Employee.objects.filter(pod_id=pod_id).order_by('name').values_list(*EmployeeDTO.VALUES_FIELDS)
+    return [EmployeeDTO.from_values(row) for row in rows]
 
@@ -41,6 +41,44 @@ def get_or_create_feature(name: str, product_id: int, description: str = None) -
     )
 
 
+def bulk_get_or_create_feature_ids(descriptions: dict[tuple[str, int], str]) -> dict[tuple[str, int], int]:
+    """
+    Get or create features for many (name, product_id) pairs at once.
+    
+    Args:
+        descriptions: Dict mapping (name, product_id) to the description used
+            when the feature has to be created
+    
+    Returns:
+        Dict mapping each (name, product_id) pair to its feature ID
+    """
+    keys = list(descriptions)
+    
+    def lookup(wanted):
+        features = Feature.objects.filter(
+            name__in={name for name, _ in wanted},
+            product_id__in={product_id for _, product_id in wanted}
+        ).values_list('name', 'product_id', 'id')
+        return {(name, product_id): feature_id for name, product_id, feature_id in features if (name, product_id) in wanted}
+    
+    ids = lookup(set(keys))
+    missing = [key for key in keys if key not in ids]
+    if missing:
+        Feature.objects.bulk_create(
+            [
+                Feature(name=name, product_id=product_id, description=descriptions[(name, product_id)] or None)
+                for name, product_id in missing
+            ],
+            ignore_conflicts=True
+        )
+        ids.update(lookup(set(missing)))
+    
+    # Names matched by a case-insensitive collation fall back to a single lookup
+    for name, product_id in [key for key in keys if key not in ids]:
+        ids[(name, product_id)] = get_or_create_feature(name, product_id, descriptions[(name, product_id)]).id
+    return ids
+
+
 def list_features_by_product(product_id: int) -> list[FeatureDTO]:
     """List features by product."""
     features = Feature.objects.filter(product_id=product_id).select_related('product').order_by('name')
@@ -0,0 +1,36 @@
+"""Storage layer for per-month metrics data versions."""
+from datetime import date
+from django.db.models import F, Sum
+from contributions.models import MetricsDataVersion
+
+# Month of the row holding the version shared by all months (bumped when names or rosters change)
+ALL_MONTHS = date(1900, 1, 1)
+
+
+def get_month_version(month: date) -> int:
+    """
+    Get the current data version for a month (0 if the month was never touched).
+    
+    The version is the sum of the month's own version and the one shared
+    by all months; both only grow, so bumping either yields a new version.
+    """
+    versions = MetricsDataVersion.objects.filter(
+        contribution_month__in=[month, ALL_MONTHS]
+    ).aggregate(total=Sum('version'))
+    return versions['total'] or 0
+
+
+def bump_month_version(month: date) -> int:
+    """Increment the data version for a month and return the new version."""
+    _, created = MetricsDataVersion.objects.get_or_create(
+        contribution_month=month,
+        defaults={'version': 1}
+    )
+    if not created:
+        MetricsDataVersion.objects.filter(contribution_month=month).update(version=F('version') + 1)
+    return get_month_version(month)
+
+
+def bump_all_months_version() -> int:
+    """Increment the version shared by all months and return it."""
+    return bump_month_version(ALL_MONTHS)
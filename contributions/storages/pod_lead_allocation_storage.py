@@ -1,8 +1,12 @@
 """Storage layer for Pod Lead Allocation operations."""
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, NullIf
+from django.utils import timezone
 from contributions.models import PodLeadAllocation
 from contributions.storages.storage_dto import PodLeadAllocationDTO
 from contributions.exceptions import EntityNotFoundException
@@ -115,6 +119,66 @@ def get_allocation_by_employee_product_month(
         return None
 
 
+def get_allocations_by_employee_products(
+    employee_products: Iterable[Tuple[int, str]],
+    month: date
+) -> Dict[Tuple[int, str], PodLeadAllocationDTO]:
+    """
+    Get the allocations of many employee-product pairs for a month with one query.
+    
+    Returns:
+        Dict of allocation DTOs by (employee_id, product); pairs without an
+        allocation are left out
+    """
+    employee_products = set(employee_products)
+    if not employee_products:
+        return {}
+    
+    allocations = PodLeadAllocation.objects.filter(
+        employee_id__in={employee_id for employee_id, _ in employee_products},
+        product__in={product for _, product in employee_products},
+        contribution_month=month
+    ).select_related('employee', 'pod_lead')
+    
+    return {
+        (alloc.employee_id, alloc.product): convert_to_dto(alloc)
+        for alloc in allocations
+        if (alloc.employee_id, alloc.product) in employee_products
+    }
+
+
+def bulk_update_allocations(allocations: List[PodLeadAllocationDTO]) -> List[PodLeadAllocationDTO]:
+    """
+    Save the percentages, verification flag and status of many allocations.
+    
+    If an allocation appears more than once, the last occurrence is saved.
+    
+    Returns:
+        The given allocations with their new updated_at date, in the same order
+    """
+    now = timezone.now()
+    latest = {allocation.id: allocation for allocation in allocations}
+    
+    PodLeadAllocation.objects.bulk_update(
+        [
+            PodLeadAllocation(
+                id=allocation.id,
+                academy_percent=allocation.academy_percent,
+                intensive_percent=allocation.intensive_percent,
+                niat_percent=allocation.niat_percent,
+                is_verified_description=allocation.is_verified_description,
+                status=allocation.status,
+                updated_at=now,  # bulk_update skips auto_now
+            )
+            for allocation in latest.values()
+        ],
+        ['academy_percent', 'intensive_percent', 'niat_percent', 'is_verified_description', 'status', 'updated_at'],
+        batch_size=500
+    )
+    
+    return [replace(allocation, updated_at=now.date()) for allocation in allocations]
+
+
 def get_processed_allocations_by_month(month: date) -> List[PodLeadAllocationDTO]:
     """Get all processed allocations for a month."""
     allocations = PodLeadAllocation.objects.filter(
@@ -125,6 +189,70 @@ def get_processed_allocations_by_month(month: date) -> List[PodLeadAllocationDTO
     return [convert_to_dto(alloc) for alloc in allocations]
 
 
+def get_processed_allocation_rows(month: date) -> List[Dict]:
+    """
+    Get the processed allocations of a month with their employee details in one joined query.
+    
+    Ordered by employee name and product, like get_processed_allocations_by_month.
+    
+    Returns:
+        Dicts as yielded by iter_processed_allocation_rows
+    """
+    rows = _processed_allocation_rows(month).order_by('employee__name', 'product', 'id')
+    return list(rows)
+
+
+def iter_processed_allocation_rows(
+    month: date,
+    chunk_size: int = 2000,
+    default_department_name: Optional[str] = None
+) -> Iterator[Dict]:
+    """
+    Stream the processed allocations of a month with their employee details.
+    
+    One joined query read in chunks (rows are not cached on the queryset),
+    ordered by department, employee name and product.
+    
+    Args:
+        month: Contribution month
+        chunk_size: Rows read per round trip
+        default_department_name: Department name that rows without a department
+            are listed under by the caller; they are ordered together with it
+    
+    Yields:
+        Dicts with employee_code, employee_name, email, department_name,
+        pod_name, product_description, academy_percent, intensive_percent,
+        niat_percent and baseline_hours
+    """
+    department_name = F('employee__department__name')
+    if default_department_name is not None:
+        department_name = Coalesce(NullIf(department_name, Value('')), Value(default_department_name))
+    rows = _processed_allocation_rows(month).order_by(
+        department_name, 'employee__name', 'product', 'id'
+    )
+    return rows.iterator(chunk_size=chunk_size)
+
+
+def _processed_allocation_rows(month: date):
+    """Values queryset of processed allocations joined with employee, department and pod."""
+    return PodLeadAllocation.objects.filter(
+        contribution_month=month,
+        status='PROCESSED'
+    ).values(
+        'product_description', 'academy_percent', 'intensive_percent', 'niat_percent', 'baseline_hours',
+        employee_code=F('employee__employee_code'),
+        employee_name=F('employee__name'),
+        email=F('employee__email'),
+        department_name=F('employee__department__name'),
+        pod_name=F('employee__pod__name'),
+    )
+
+
+def count_allocations_by_status(month: date, status: str) -> int:
+    """Count the allocations of a month with a given status."""
+    return PodLeadAllocation.objects.filter(contribution_month=month, status=status).count()
+
+
 def get_pending_allocations_by_pod(pod_id: int, month: date) -> List[PodLeadAllocationDTO]:
     """Get pending allocations for a pod."""
     allocations = PodLeadAllocation.objects.filter(
@@ -136,17 +264,36 @@ def get_pending_allocations_by_pod(pod_id: int, month: date) -> List[PodLeadAllo
     return [convert_to_dto(alloc) for alloc in allocations]
 
 
-def get_submitted_allocations_by_pod(pod_id: int, month: date) -> List[PodLeadAllocationDTO]:
-    """Get submitted allocations for a pod."""
+def get_submitted_allocations_by_pod(pod_id: int, month: date, lock: bool = False) -> List[PodLeadAllocationDTO]:
+    """
+    Get submitted allocations for a pod.
+    
+    Args:
+        lock: Lock the allocation rows until the current transaction ends
+            (SELECT ... FOR UPDATE), so no other run can process them meanwhile
+    """
     allocations = PodLeadAllocation.objects.filter(
         employee__pod_id=pod_id,
         contribution_month=month,
         status='SUBMITTED'
     ).select_related('employee', 'pod_lead').order_by('employee__name')
+    if lock:
+        allocations = allocations.select_for_update(of=('self',))
     
     return [convert_to_dto(alloc) for alloc in allocations]
 
 
+def get_pod_ids_with_submitted_allocations(month: date) -> List[int]:
+    """Get IDs of pods that have submitted allocations for a month."""
+    pod_ids = PodLeadAllocation.objects.filter(
+        contribution_month=month,
+        status='SUBMITTED',
+        employee__pod_id__isnull=False
+    ).values_list('employee__pod_id', flat=True).distinct().order_by('employee__pod_id')
+    
+    return list(pod_ids)
+
+
 def mark_allocation_submitted(allocation_id: int) -> PodLeadAllocationDTO:
     """Mark allocation as submitted."""
     allocation = PodLeadAllocation.objects.get(id=allocation_id)
@@ -163,6 +310,20 @@ def mark_allocation_processed(allocation_id: int) -> PodLeadAllocationDTO:
     return convert_to_dto(allocation)
 
 
+def mark_allocations_processed(allocation_ids: List[int]) -> int:
+    """
+    Mark many SUBMITTED allocations as processed with a single UPDATE.
+    
+    Returns:
+        Number of allocations marked; allocations that are no longer
+        SUBMITTED (e.g. processed by another run) are left unchanged
+    """
+    return PodLeadAllocation.objects.filter(id__in=allocation_ids, status='SUBMITTED').update(
+        status='PROCESSED',
+        updated_at=timezone.now(),  # update() skips auto_now
+    )
+
+
 def convert_to_dto(allocation: PodLeadAllocation) -> PodLeadAllocationDTO:
     """Convert ORM object to DTO."""
     return PodLeadAllocationDTO(
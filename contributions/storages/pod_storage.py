@@ -1,27 +1,24 @@
 """Storage layer for Pod entities."""
 from core.models import Pod
+from . import dimension_cache
 from .storage_dto import PodDTO
 from ..exceptions import EntityNotFoundException
 
 
 def get_pod_by_id(pod_id: int) -> PodDTO:
     """Get pod by ID."""
-    try:
-        pod = Pod.objects.select_related('department').get(id=pod_id)
-        return PodDTO(
-            id=pod.id,
-            name=pod.name,
-            department_id=pod.department_id,
-            department_name=pod.department.name,
-            created_at=pod.created_at,
-            updated_at=pod.updated_at,
-        )
-    except Pod.DoesNotExist:
+    pod = dimension_cache.pods.get_by_id(pod_id)
+    if pod is None:
         raise EntityNotFoundException(f"Pod with id {pod_id} not found")
+    return pod
 
 
 def get_or_create_pod(name: str, department_id: int) -> PodDTO:
     """Get or create a pod."""
+    cached = dimension_cache.pods.get_by_key((name, department_id))
+    if cached is not None:
+        return cached
+    
     pod, _ = Pod.objects.get_or_create(
         name=name,
         department_id=department_id,
@@ -39,18 +36,40 @@ def get_or_create_pod(name: str, department_id: int) -> PodDTO:
     )
 
 
+def bulk_get_or_create_pod_ids(keys) -> dict[tuple[str, int], int]:
+    """
+    Get or create pods for many (name, department_id) pairs at once.
+    
+    Returns:
+        Dict mapping each (name, department_id) pair to its pod ID
+    """
+    keys = list(dict.fromkeys(keys))
+    
+    def lookup(wanted):
+        pods = Pod.objects.filter(
+            name__in={name for name, _ in wanted},
+            department_id__in={department_id for _, department_id in wanted}
+        ).values_list('name', 'department_id', 'id')
+        return {(name, department_id): pod_id for name, department_id, pod_id in pods if (name, department_id) in wanted}
+    
+    by_key = dimension_cache.pods.get_maps()[1]
+    ids = {key: by_key[key].id for key in keys if key in by_key}
+    missing = [key for key in keys if key not in ids]
+    if missing:
+        Pod.objects.bulk_create(
+            [Pod(name=name, department_id=department_id) for name, department_id in missing],
+            ignore_conflicts=True
+        )
+        dimension_cache.invalidate()
+        ids.update(lookup(set(missing)))
+    
+    # Names matched by a case-insensitive collation fall back to a single lookup
+    for name, department_id in [key for key in keys if key not in ids]:
+        ids[(name, department_id)] = get_or_create_pod(name, department_id).id
+    return ids
+
+
 def list_pods_by_department(department_id: int) -> list[PodDTO]:
     """List pods by department."""
-    pods = Pod.objects.filter(department_id=department_id).select_related('department').order_by('name')
-    return [
-        PodDTO(
-            id=pod.id,
-            name=pod.name,
-            department_id=pod.department_id,
-            department_name=pod.department.name,
-            created_at=pod.created_at,
-            updated_at=pod.updated_at,
-        )
-        for pod in pods
-    ]
+    return [pod for pod in dimension_cache.pods.list() if pod.department_id == department_id]
 
@@ -1,25 +1,24 @@
 """Storage layer for Product entities."""
 from core.models import Product
+from . import dimension_cache
 from .storage_dto import ProductDTO
 from ..exceptions import EntityNotFoundException
 
 
 def get_product_by_id(product_id: int) -> ProductDTO:
     """Get product by ID."""
-    try:
-        product = Product.objects.get(id=product_id)
-        return ProductDTO(
-            id=product.id,
-            name=product.name,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
-        )
-    except Product.DoesNotExist:
+    product = dimension_cache.products.get_by_id(product_id)
+    if product is None:
         raise EntityNotFoundException(f"Product with id {product_id} not found")
+    return product
 
 
 def get_or_create_product(name: str) -> ProductDTO:
     """Get or create a product."""
+    cached = dimension_cache.products.get_by_key(name)
+    if cached is not None:
+        return cached
+    
     product, _ = Product.objects.get_or_create(name=name)
     return ProductDTO(
         id=product.id,
@@ -29,30 +28,54 @@ def get_or_create_product(name: str) -> ProductDTO:
     )
 
 
+def bulk_get_or_create_product_ids(names) -> dict[str, int]:
+    """
+    Get or create products for many names at once.
+    
+    Returns:
+        Dict mapping each name to its product ID
+    """
+    names = list(dict.fromkeys(names))
+    by_name = dimension_cache.products.get_maps()[1]
+    ids = {name: by_name[name].id for name in names if name in by_name}
+    missing = [name for name in names if name not in ids]
+    if missing:
+        Product.objects.bulk_create([Product(name=name) for name in missing], ignore_conflicts=True)
+        dimension_cache.invalidate()
+        ids.update(Product.objects.filter(name__in=missing).values_list('name', 'id'))
+    
+    # Names matched by a case-insensitive collation fall back to a single lookup
+    for name in [name for name in names if name not in ids]:
+        ids[name] = get_or_create_product(name).id
+    return ids
+
+
 def get_product_by_name(name: str) -> ProductDTO:
     """Get product by name."""
-    try:
-        product = Product.objects.get(name=name)
-        return ProductDTO(
-            id=product.id,
-            name=product.name,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
-        )
-    except Product.DoesNotExist:
+    product = dimension_cache.products.get_by_key(name)
+    if product is None:
         raise EntityNotFoundException(f"Product with name '{name}' not found")
+    return product
+
+
+def get_product_ids_by_names(names) -> dict[str, int]:
+    """
+    Get IDs of many products by name.
+    
+    Raises:
+        EntityNotFoundException if any of the products does not exist
+    """
+    by_name = dimension_cache.products.get_maps()[1]
+    ids = {}
+    for name in dict.fromkeys(names):
+        product = by_name.get(name) or dimension_cache.products.get_by_key(name)
+        if product is None:
+            raise EntityNotFoundException(f"Product with name '{name}' not found")
+        ids[name] = product.id
+    return ids
 
 
 def list_products() -> list[ProductDTO]:
     """List all products."""
-    products = Product.objects.all().order_by('name')
-    return [
-        ProductDTO(
-            id=product.id,
-            name=product.name,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
-        )
-        for product in products
-    ]
+    return dimension_cache.products.list()
 
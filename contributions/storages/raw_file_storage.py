@@ -1,25 +1,27 @@
 """Storage layer for RawFile entities."""
+from django.db import transaction, IntegrityError
+from django.db.models import Case, Count, F, Value, When
 from contributions.models import RawFile
 from .storage_dto import RawFileDTO
 from ..exceptions import EntityNotFoundException, DuplicateUploadException
 
 
 def get_raw_file_by_checksum(checksum: str) -> RawFileDTO:
-    """Get raw file by checksum if exists."""
-    try:
-        raw_file = RawFile.objects.get(checksum=checksum)
-        return RawFileDTO(
-            id=raw_file.id,
-            file_name=raw_file.file_name,
-            uploaded_by_id=raw_file.uploaded_by_id,
-            uploaded_at=raw_file.uploaded_at,
-            storage_path=raw_file.storage_path,
-            file_size=raw_file.file_size,
-            checksum=raw_file.checksum,
-            parse_summary=raw_file.parse_summary,
-        )
-    except RawFile.DoesNotExist:
+    """Get raw file by checksum if exists (uploads that failed processing are ignored)."""
+    raw_file = RawFile.objects.filter(active_checksum=checksum).first()
+    if raw_file is None:
         return None
+    return RawFileDTO(
+        id=raw_file.id,
+        file_name=raw_file.file_name,
+        uploaded_by_id=raw_file.uploaded_by_id,
+        uploaded_at=raw_file.uploaded_at,
+        storage_path=raw_file.storage_path,
+        file_size=raw_file.file_size,
+        checksum=raw_file.checksum,
+        parse_summary=raw_file.parse_summary,
+        status=raw_file.status,
+    )
 
 
 def create_raw_file(
@@ -29,13 +31,15 @@ def create_raw_file(
     file_size: int = 0,
     checksum: str = None,
     parse_summary: dict = None,
-    check_duplicate: bool = True
+    check_duplicate: bool = True,
+    status: str = 'COMPLETED'
 ) -> RawFileDTO:
     """
     Create a raw file record.
     
     Args:
         check_duplicate: If True, check for existing file with same checksum
+        status: Processing status (QUEUED for uploads processed in the background)
     """
     # Check for duplicate if checksum provided
     if check_duplicate and checksum:
@@ -45,14 +49,25 @@ def create_raw_file(
                 f"File with same checksum already exists: {existing.file_name} (uploaded at {existing.uploaded_at})"
             )
     
-    raw_file = RawFile.objects.create(
-        file_name=file_name,
-        storage_path=storage_path,
-        uploaded_by_id=uploaded_by_id,
-        file_size=file_size,
-        checksum=checksum,
-        parse_summary=parse_summary or {},
-    )
+    try:
+        with transaction.atomic():
+            raw_file = RawFile.objects.create(
+                file_name=file_name,
+                storage_path=storage_path,
+                uploaded_by_id=uploaded_by_id,
+                file_size=file_size,
+                checksum=checksum,
+                parse_summary=parse_summary or {},
+                status=status,
+            )
+    except IntegrityError:
+        # Checksums of files that did not fail are unique; a concurrent upload won
+        existing = get_raw_file_by_checksum(checksum) if checksum else None
+        if existing:
+            raise DuplicateUploadException(
+                f"File with same checksum already exists: {existing.file_name} (uploaded at {existing.uploaded_at})"
+            )
+        raise
     return RawFileDTO(
         id=raw_file.id,
         file_name=raw_file.file_name,
@@ -62,6 +77,7 @@ def create_raw_file(
         file_size=raw_file.file_size,
         checksum=raw_file.checksum,
         parse_summary=raw_file.parse_summary,
+        status=raw_file.status,
     )
 
 
@@ -78,6 +94,7 @@ def get_raw_file_by_id(raw_file_id: int) -> RawFileDTO:
             file_size=raw_file.file_size,
             checksum=raw_file.checksum,
             parse_summary=raw_file.parse_summary,
+            status=raw_file.status,
         )
     except RawFile.DoesNotExist:
         raise EntityNotFoundException(f"RawFile with id {raw_file_id} not found")
@@ -98,7 +115,63 @@ def update_raw_file_summary(raw_file_id: int, parse_summary: dict) -> RawFileDTO
             file_size=raw_file.file_size,
             checksum=raw_file.checksum,
             parse_summary=raw_file.parse_summary,
+            status=raw_file.status,
         )
     except RawFile.DoesNotExist:
         raise EntityNotFoundException(f"RawFile with id {raw_file_id} not found")
 
+
+def update_raw_file_status(raw_file_id: int, status: str, parse_summary: dict = None) -> None:
+    """Update raw file processing status (and parse summary if given)."""
+    # A failed file frees its checksum for a retry with the same file (and takes it back when reprocessed)
+    fields = {'status': status, 'active_checksum': None if status == 'FAILED' else F('checksum')}
+    if parse_summary is not None:
+        fields['parse_summary'] = parse_summary
+    updated = RawFile.objects.filter(id=raw_file_id).update(**fields)
+    if not updated:
+        raise EntityNotFoundException(f"RawFile with id {raw_file_id} not found")
+
+
+def list_raw_file_ids_by_status(statuses: list[str]) -> list[int]:
+    """List IDs of raw files in the given statuses, oldest first."""
+    return list(
+        RawFile.objects.filter(status__in=statuses).order_by('uploaded_at', 'id').values_list('id', flat=True)
+    )
+
+
+def count_raw_files_by_storage_path(prefix: str) -> dict[str, int]:
+    """Count raw files referencing each storage path under a prefix."""
+    return dict(
+        RawFile.objects.filter(storage_path__startswith=prefix)
+        .values('storage_path')
+        .annotate(references=Count('id'))
+        .values_list('storage_path', 'references')
+    )
+
+
+def list_raw_files_outside_storage_prefix(prefix: str) -> list[RawFileDTO]:
+    """List raw files whose storage path is not under a prefix, oldest first."""
+    raw_files = RawFile.objects.exclude(storage_path__startswith=prefix).order_by('uploaded_at', 'id')
+    return [
+        RawFileDTO(
+            id=raw_file.id,
+            file_name=raw_file.file_name,
+            uploaded_by_id=raw_file.uploaded_by_id,
+            uploaded_at=raw_file.uploaded_at,
+            storage_path=raw_file.storage_path,
+            file_size=raw_file.file_size,
+            checksum=raw_file.checksum,
+            parse_summary=raw_file.parse_summary,
+            status=raw_file.status,
+        )
+        for raw_file in raw_files
+    ]
+
+
+def update_raw_file_storage(raw_file_id: int, storage_path: str, checksum: str = None) -> None:
+    """Point a raw file at a new storage path (and checksum)."""
+    RawFile.objects.filter(id=raw_file_id).update(
+        storage_path=storage_path,
+        checksum=checksum,
+        active_checksum=Case(When(status='FAILED', then=Value(None)), default=Value(checksum)),
+    )
@@ -2,21 +2,53 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from datetime import date
-from typing import Optional, List, Dict
-
-
-@dataclass
-class DepartmentDTO:
+from typing import ClassVar, Optional, List, Dict, Tuple
+
+
+class RowDTO:
+    """
+    Base of slotted DTOs that are read in bulk.
+    
+    VALUES_FIELDS lists the values_list() lookups of the fields in field
+    order, so from_values builds a DTO straight from a row tuple without
+    instantiating a model.
+    """
+    __slots__ = ()
+    VALUES_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    
+    @classmethod
+    def from_values(cls, row: tuple):
+        """Build a DTO from a row of values_list(*VALUES_FIELDS)."""
+        return cls(*row)
+    
+    def to_dict(self, fields: Optional[Tuple[str, ...]] = None) -> dict:
+        """
+        Fields (all, or the given ones in the given order) as a dict.
+        
+        Shallow, unlike dataclasses.asdict, which deep-copies every value.
+        """
+        return {name: getattr(self, name) for name in fields or self.__slots__}
+
+
+# Departments, pods and products are shared through the dimension cache, so they are immutable
+@dataclass(frozen=True, slots=True)
+class DepartmentDTO(RowDTO):
     """Department Data Transfer Object."""
+    VALUES_FIELDS: ClassVar[Tuple[str, ...]] = ('id', 'name', 'created_at', 'updated_at')
+    
     id: int
     name: str
     created_at: Optional[date] = None
     updated_at: Optional[date] = None
 
 
-@dataclass
-class PodDTO:
+@dataclass(frozen=True, slots=True)
+class PodDTO(RowDTO):
     """Pod Data Transfer Object."""
+    VALUES_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'name', 'department_id', 'department__name', 'created_at', 'updated_at'
+    )
+    
     id: int
     name: str
     department_id: int
@@ -25,9 +57,11 @@ class PodDTO:
     updated_at: Optional[date] = None
 
 
-@dataclass
-class ProductDTO:
+@dataclass(frozen=True, slots=True)
+class ProductDTO(RowDTO):
     """Product Data Transfer Object."""
+    VALUES_FIELDS: ClassVar[Tuple[str, ...]] = ('id', 'name', 'created_at', 'updated_at')
+    
     id: int
     name: str
     created_at: Optional[date] = None
@@ -46,9 +80,15 @@ class FeatureDTO:
     updated_at: Optional[date] = None
 
 
-@dataclass
-class EmployeeDTO:
+# Shared by everything handling a request once authenticated (request.user), so immutable
+@dataclass(frozen=True, slots=True)
+class EmployeeDTO(RowDTO):
     """Employee Data Transfer Object."""
+    VALUES_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'employee_code', 'name', 'email', 'department_id', 'pod_id', 'role',
+        'department__name', 'pod__name', 'created_at', 'updated_at',
+    )
+    
     id: int
     employee_code: str
     name: str
@@ -73,11 +113,19 @@ class RawFileDTO:
     file_size: int = 0
     checksum: Optional[str] = None
     parse_summary: Optional[Dict] = None
+    status: str = 'COMPLETED'
 
 
-@dataclass
-class ContributionRecordDTO:
+# Not frozen: frozen dataclasses take several times longer to build, and uploads build one per row
+@dataclass(slots=True)
+class ContributionRecordDTO(RowDTO):
     """ContributionRecord Data Transfer Object."""
+    VALUES_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'id', 'employee_id', 'department_id', 'pod_id', 'product_id', 'contribution_month', 'effort_hours',
+        'source_file_id', 'feature_id', 'description', 'employee__employee_code', 'employee__name',
+        'department__name', 'pod__name', 'product__name', 'feature__name', 'created_at', 'updated_at',
+    )
+    
     id: Optional[int] = None
     employee_id: Optional[int] = None
     department_id: Optional[int] = None
@@ -191,7 +239,7 @@ class EmployeeMetricsDTO:
     features: List[FeatureBreakdownDTO]
 
 
-@dataclass
+@dataclass(slots=True)
 class PodLeadAllocationDTO:
     """Pod Lead Allocation Data Transfer Object."""
     id: int
@@ -214,3 +262,21 @@ class PodLeadAllocationDTO:
     created_at: Optional[date] = None
     updated_at: Optional[date] = None
 
+
+
+@dataclass
+class ContributionRowBatchDTO:
+    """Validated contribution rows of one sheet, stored column by column."""
+    sheet_name: str
+    row_numbers: List[int]
+    columns: Dict[str, List[str]]
+    contribution_months: List[date]
+    effort_hours: List[Decimal]
+    
+    def __len__(self) -> int:
+        return len(self.row_numbers)
+    
+    def to_rows(self) -> List[Dict]:
+        """Convert the batch to per-row dicts of normalized strings."""
+        headers = list(self.columns)
+        return [dict(zip(headers, values)) for values in zip(*self.columns.values())]
@@ -0,0 +1,77 @@
+"""Tests for storing uploads and retrying interrupted background uploads."""
+import tempfile
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from core.models import Department, Pod, Product, Employee
+from contributions.exceptions import DuplicateUploadException
+from contributions.interactors.upload_interactor import UploadContributionFileInteractor, discard_partial_upload
+from contributions.models import RawFile, ContributionRecord
+from contributions.storages import contribution_rollup_storage, contribution_storage
+from contributions.storages.storage_dto import ContributionRecordDTO
+
+MONTH = date(2025, 10, 1)
+
+
+class DiscardPartialUploadTests(TestCase):
+
+    def setUp(self):
+        product = Product.objects.create(name='Academy')
+        department = Department.objects.create(name='Engineering')
+        pod = Pod.objects.create(name='Alpha', department=department)
+        employee = Employee.objects.create(
+            employee_code='E1', name='Employee', email='employee@example.com', department=department, pod=pod
+        )
+        self.record = ContributionRecordDTO(
+            employee_id=employee.id,
+            department_id=department.id,
+            pod_id=pod.id,
+            product_id=product.id,
+            contribution_month=MONTH,
+            effort_hours=Decimal('40.00'),
+        )
+        self.other_file = RawFile.objects.create(file_name='other.xlsx', storage_path='other.xlsx')
+        self.raw_file = RawFile.objects.create(file_name='big.xlsx', storage_path='big.xlsx', status='PROCESSING')
+        contribution_storage.bulk_create_contributions([self.record], self.other_file.id)
+        # Chunk committed by the interrupted run
+        contribution_storage.bulk_create_contributions([self.record, self.record], self.raw_file.id)
+    
+    def test_deletes_records_and_rollup_hours_of_the_interrupted_run(self):
+        deleted_count = discard_partial_upload(self.raw_file.id)
+        
+        self.assertEqual(deleted_count, 2)
+        self.assertFalse(ContributionRecord.objects.filter(source_file_id=self.raw_file.id).exists())
+        self.assertEqual(contribution_rollup_storage.find_month_mismatches(MONTH), [])
+        self.assertEqual(contribution_rollup_storage.get_total_hours_by_month(MONTH), Decimal('40.00'))
+        self.raw_file.refresh_from_db()
+        self.assertEqual(self.raw_file.status, 'QUEUED')
+    
+    def test_rerun_after_discard_does_not_double_count(self):
+        discard_partial_upload(self.raw_file.id)
+        contribution_storage.bulk_create_contributions([self.record, self.record], self.raw_file.id)
+        
+        self.assertEqual(contribution_rollup_storage.get_total_hours_by_month(MONTH), Decimal('120.00'))
+
+
+class DuplicateUploadStorageTests(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.media_root = Path(media_root.name)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+    
+    def test_rejected_duplicate_leaves_no_blob_behind(self):
+        UploadContributionFileInteractor(SimpleUploadedFile('first.xlsx', b'same content'), None).enqueue()
+        
+        # Same content under another extension would get a blob path of its own
+        with self.assertRaises(DuplicateUploadException):
+            UploadContributionFileInteractor(SimpleUploadedFile('second.csv', b'same content'), None).enqueue()
+        
+        stored = [path.name for path in (self.media_root / 'blobs').rglob('*') if path.is_file()]
+        self.assertEqual(len(stored), 1)
+        self.assertTrue(stored[0].endswith('.xlsx'))
@@ -0,0 +1,100 @@
+"""Tests for turning submitted pod lead allocations into contribution records."""
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase
+from core.models import Department, Pod, Product, Employee
+from contributions.exceptions import ValidationException
+from contributions.models import ContributionRecord, PodLeadAllocation, RawFile
+from contributions.services import allocation_processing_service
+from contributions.storages import contribution_rollup_storage, pod_lead_allocation_storage
+
+MONTH = date(2025, 10, 1)
+
+
+class AllocationProcessingTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for name in ['Academy', 'Intensive', 'NIAT']:
+            Product.objects.create(name=name)
+        department = Department.objects.create(name='Engineering')
+        cls.pods = [Pod.objects.create(name=f'Pod {index}', department=department) for index in range(2)]
+        for pod in cls.pods:
+            pod_lead = Employee.objects.create(
+                employee_code=f'LEAD{pod.id}', name=f'Lead {pod.id}', email='lead@example.com',
+                department=department, pod=pod,
+            )
+            for index in range(3):
+                employee = Employee.objects.create(
+                    employee_code=f'E{pod.id}-{index}', name=f'Employee {pod.id}-{index}', email='employee@example.com',
+                    department=department, pod=pod,
+                )
+                PodLeadAllocation.objects.create(
+                    employee=employee, pod_lead=pod_lead, contribution_month=MONTH,
+                    academy_percent=Decimal('60.00'), intensive_percent=Decimal('40.00'), status='SUBMITTED',
+                )
+    
+    def assertWrittenOnce(self, pods):
+        """Records and rollups hold every processed allocation exactly once."""
+        self.assertEqual(ContributionRecord.objects.count(), 2 * 3 * len(pods))
+        self.assertEqual(RawFile.objects.count(), len(pods))
+        self.assertEqual(contribution_rollup_storage.get_total_hours_by_month(MONTH), Decimal('160.00') * 3 * len(pods))
+        self.assertEqual(contribution_rollup_storage.find_month_mismatches(MONTH), [])
+
+
+class ProcessPodAllocationsTests(AllocationProcessingTestCase):
+
+    def test_second_run_finds_nothing_to_process(self):
+        pod = self.pods[0]
+        self.assertEqual(allocation_processing_service.process_all_pod_allocations(pod.id, MONTH)['created_records'], 6)
+        self.assertEqual(allocation_processing_service.process_all_pod_allocations(pod.id, MONTH)['processed_count'], 0)
+        self.assertWrittenOnce(self.pods[:1])
+    
+    def test_run_that_lost_the_race_rolls_back(self):
+        pod = self.pods[0]
+        # Allocations as read by a concurrent run before this one committed
+        stale = pod_lead_allocation_storage.get_submitted_allocations_by_pod(pod.id, MONTH)
+        allocation_processing_service.process_all_pod_allocations(pod.id, MONTH)
+        
+        with mock.patch.object(pod_lead_allocation_storage, 'get_submitted_allocations_by_pod', return_value=stale):
+            with self.assertRaises(ValidationException):
+                allocation_processing_service.process_all_pod_allocations(pod.id, MONTH)
+        self.assertWrittenOnce(self.pods[:1])
+
+
+class ProcessMonthAllocationsTests(AllocationProcessingTestCase):
+    """Month runs and per-pod runs claim each allocation once, however they overlap."""
+    
+    def test_month_run_twice_writes_records_once(self):
+        first = allocation_processing_service.process_month_allocations(MONTH)
+        second = allocation_processing_service.process_month_allocations(MONTH)
+        
+        self.assertEqual((first['pod_count'], first['created_records']), (2, 12))
+        self.assertEqual((second['pod_count'], second['created_records']), (0, 0))
+        self.assertWrittenOnce(self.pods)
+    
+    def test_month_run_after_pod_run_skips_the_processed_pod(self):
+        allocation_processing_service.process_all_pod_allocations(self.pods[0].id, MONTH)
+        result = allocation_processing_service.process_month_allocations(MONTH)
+        
+        self.assertEqual([pod['pod_id'] for pod in result['pods']], [self.pods[1].id])
+        self.assertWrittenOnce(self.pods)
+    
+    def test_month_run_racing_a_pod_run_fails_that_pod_only(self):
+        # The pod run commits between the month run's read of a pod and its claim
+        stale = pod_lead_allocation_storage.get_submitted_allocations_by_pod(self.pods[0].id, MONTH)
+        allocation_processing_service.process_all_pod_allocations(self.pods[0].id, MONTH)
+        read = pod_lead_allocation_storage.get_submitted_allocations_by_pod
+        
+        def read_before_pod_run(pod_id, month, lock=False):
+            return stale if pod_id == self.pods[0].id else read(pod_id, month, lock)
+        
+        with mock.patch.object(pod_lead_allocation_storage, 'get_pod_ids_with_submitted_allocations',
+                               return_value=[pod.id for pod in self.pods]), \
+                mock.patch.object(pod_lead_allocation_storage, 'get_submitted_allocations_by_pod', side_effect=read_before_pod_run), \
+                self.assertLogs(allocation_processing_service.logger, 'ERROR'):
+            result = allocation_processing_service.process_month_allocations(MONTH)
+        
+        self.assertEqual([pod['status'] for pod in result['pods']], ['FAILED', 'SUCCESS'])
+        self.assertWrittenOnce(self.pods)
@@ -0,0 +1,103 @@
+"""Tests for building the final master list from processed allocations."""
+from datetime import date
+from decimal import Decimal
+from itertools import groupby
+import pandas as pd
+from django.test import TestCase
+from core.models import Department, Pod, Employee
+from contributions.models import PodLeadAllocation
+from contributions.services import final_master_list_service
+from contributions.services.final_master_list_service import MASTER_LIST_HEADERS
+from contributions.storages import employee_storage, pod_lead_allocation_storage
+
+MONTH = date(2025, 10, 1)
+
+# (academy, intensive, niat, baseline) percentages and hours that are not exact in binary
+ALLOCATIONS = [
+    ('0.01', '33.33', '66.66', '150.75'),
+    ('33.33', '0.00', '0.00', '160.00'),
+    ('100.00', '0.00', '0.00', '0.01'),
+    ('12.34', '56.78', '30.88', '9999.99'),
+    ('0.00', '0.00', '0.00', '160.00'),
+    ('150.75', '0.01', '999.99', '33.33'),
+]
+
+
+def old_master_list_rows(month):
+    """Master list rows as built per allocation with Decimal arithmetic before build_master_list_frame."""
+    department_data = {}
+    for alloc in pod_lead_allocation_storage.get_processed_allocations_by_month(month):
+        employee = employee_storage.get_employee_by_id(alloc.employee_id)
+        dept_name = employee.department_name or 'Unknown'
+        department_data.setdefault(dept_name, [])
+        products = [
+            ('Academy', alloc.academy_percent),
+            ('Intensive', alloc.intensive_percent),
+            ('NIAT', alloc.niat_percent),
+        ]
+        for product_name, percent in products:
+            if percent > Decimal('0'):
+                hours = (percent / Decimal('100')) * alloc.baseline_hours
+                department_data[dept_name].append([
+                    alloc.employee_code,
+                    alloc.employee_name,
+                    employee.email,
+                    dept_name,
+                    employee.pod_name or '',
+                    product_name,
+                    alloc.product_description or '',
+                    month.strftime('%Y-%m'),
+                    float(hours),
+                ])
+    return [row for rows in department_data.values() for row in rows]
+
+
+class BuildMasterListFrameTests(TestCase):
+    """build_master_list_frame matches the per-allocation Decimal construction it replaced."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        pod_lead = Employee.objects.create(employee_code='LEAD', name='Lead', email='lead@example.com')
+        zeta = Department.objects.create(name='Zeta')
+        alpha = Department.objects.create(name='Alpha')
+        unknown = Department.objects.create(name='Unknown')
+        placements = [
+            (zeta, Pod.objects.create(name='Zeta Pod', department=zeta)),
+            (alpha, None),
+            (None, None),
+            (unknown, Pod.objects.create(name='Unknown Pod', department=unknown)),
+        ]
+        index = 0
+        for department, pod in placements:
+            for academy, intensive, niat, baseline in ALLOCATIONS:
+                # Employees share names across departments to exercise the ordering
+                employee = Employee.objects.create(
+                    employee_code=f'E{index}', name=f'Employee {index % 3}', email=f'e{index}@example.com',
+                    department=department, pod=pod,
+                )
+                for product in ['Academy', 'NIAT']:
+                    PodLeadAllocation.objects.create(
+                        employee=employee, pod_lead=pod_lead, contribution_month=MONTH, product=product,
+                        product_description=None if index % 2 else f'Work {index}',
+                        academy_percent=Decimal(academy), intensive_percent=Decimal(intensive),
+                        niat_percent=Decimal(niat), baseline_hours=Decimal(baseline), status='PROCESSED',
+                    )
+                index += 1
+    
+    def test_frame_matches_decimal_rows(self):
+        rows = pod_lead_allocation_storage.get_processed_allocation_rows(MONTH)
+        master = final_master_list_service.build_master_list_frame(pd.DataFrame.from_records(rows), MONTH)
+        
+        self.assertEqual(list(master.columns), MASTER_LIST_HEADERS)
+        expected = old_master_list_rows(MONTH)
+        self.assertEqual(len(expected), 4 * 2 * 11)
+        self.assertEqual(master.values.tolist(), expected)
+    
+    def test_streamed_rows_match_decimal_rows(self):
+        streamed = list(final_master_list_service.iter_master_list_rows(MONTH))
+        self.assertEqual(sorted(streamed), sorted(old_master_list_rows(MONTH)))
+        
+        # stream_master_list_xlsx writes one sheet per run of a department
+        department_index = MASTER_LIST_HEADERS.index('department')
+        runs = [dept_name for dept_name, _ in groupby(row[department_index] for row in streamed)]
+        self.assertEqual(sorted(runs), ['Alpha', 'Unknown', 'Zeta'])
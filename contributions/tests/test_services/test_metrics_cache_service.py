@@ -0,0 +1,62 @@
+"""Tests for the dashboard metrics cache invalidation."""
+from datetime import date
+from django.core.cache import caches
+from django.test import TestCase
+from core.models import Department, Pod, Employee
+from contributions.services import metrics_cache_service
+from contributions.services.metrics_cache_service import DjangoCacheBackend
+
+MONTH = date(2025, 10, 1)
+
+
+class DjangoCacheBackendTests(TestCase):
+
+    def setUp(self):
+        self.cache = caches['default']
+        self.cache.clear()
+        self.backend = DjangoCacheBackend(cache_alias='default')
+    
+    def test_clear_drops_metrics_entries_only(self):
+        self.cache.set('authz-revoked:1', 123)
+        self.backend.set('metrics:org:-:2025-10:v1', {'total_hours': 10})
+        
+        self.backend.clear()
+        
+        self.assertIsNone(self.backend.get('metrics:org:-:2025-10:v1'))
+        self.assertEqual(self.cache.get('authz-revoked:1'), 123)
+
+
+class RosterChangeInvalidationTests(TestCase):
+
+    def setUp(self):
+        department = Department.objects.create(name='Engineering')
+        self.pod = Pod.objects.create(name='Alpha', department=department)
+        self.employee = Employee.objects.create(
+            employee_code='E1', name='Before', email='employee@example.com', department=department, pod=self.pod
+        )
+        metrics_cache_service.reset()
+    
+    def _cached_pod_name(self):
+        return metrics_cache_service.get_or_compute('pod', self.pod.id, MONTH, lambda: Pod.objects.get(id=self.pod.id).name)
+    
+    def test_rename_invalidates_months_never_touched_by_data(self):
+        self.assertEqual(self._cached_pod_name(), 'Alpha')
+        self.pod.name = 'Beta'
+        self.pod.save()
+        
+        self.assertEqual(self._cached_pod_name(), 'Beta')
+    
+    def test_employee_change_invalidates_cached_dashboards(self):
+        compute_calls = []
+        
+        def compute():
+            compute_calls.append(1)
+            return len(compute_calls)
+        
+        metrics_cache_service.get_or_compute('employee', self.employee.id, MONTH, compute)
+        metrics_cache_service.get_or_compute('employee', self.employee.id, MONTH, compute)
+        self.employee.name = 'After'
+        self.employee.save()
+        metrics_cache_service.get_or_compute('employee', self.employee.id, MONTH, compute)
+        
+        self.assertEqual(len(compute_calls), 2)
@@ -0,0 +1,92 @@
+"""Query-count regression tests for the rollup-based dashboard metrics."""
+from datetime import date
+from decimal import Decimal
+from django.test import TestCase
+from core.models import Department, Pod, Product, Employee
+from contributions.models import RawFile
+from contributions.services import metrics_calculator_service
+from contributions.storages import contribution_storage
+from contributions.storages.storage_dto import ContributionRecordDTO
+
+MONTH = date(2025, 10, 1)
+
+
+class DashboardMetricsQueryCountTests(TestCase):
+    """The org, department and pod dashboards cost a fixed number of queries however large the org is."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        # Run the dimension cache's on_commit bumps, as if the fixtures had been committed
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.create_fixtures()
+    
+    @classmethod
+    def create_fixtures(cls):
+        products = [Product.objects.create(name=name) for name in ['Academy', 'Intensive', 'NIAT']]
+        source_file = RawFile.objects.create(file_name='seed.xlsx', storage_path='seed.xlsx')
+        cls.departments = []
+        cls.pods = []
+        records = []
+        for dept_index in range(3):
+            department = Department.objects.create(name=f'Dept {dept_index}')
+            cls.departments.append(department)
+            for pod_index in range(3):
+                pod = Pod.objects.create(name=f'Pod {pod_index}', department=department)
+                cls.pods.append(pod)
+                for emp_index in range(4):
+                    employee = Employee.objects.create(
+                        employee_code=f'E{dept_index}{pod_index}{emp_index}',
+                        name=f'Employee {dept_index}{pod_index}{emp_index}',
+                        email='employee@example.com',
+                        department=department,
+                        pod=pod,
+                    )
+                    for product_index, product in enumerate(products):
+                        records.append(ContributionRecordDTO(
+                            employee_id=employee.id,
+                            department_id=department.id,
+                            pod_id=pod.id,
+                            product_id=product.id,
+                            contribution_month=MONTH,
+                            effort_hours=Decimal(10 + emp_index + product_index),
+                        ))
+        contribution_storage.bulk_create_contributions(records, source_file.id)
+    
+    def setUp(self):
+        # Load the dimension tables, which are cached in the process
+        metrics_calculator_service.calculate_pod_metrics(self.pods[0].id, MONTH)
+        metrics_calculator_service.calculate_department_metrics(self.departments[0].id, MONTH)
+    
+    def test_bulk_department_metrics_is_one_query_for_any_number_of_departments(self):
+        for departments in (self.departments[:1], self.departments):
+            with self.assertNumQueries(1):
+                results = metrics_calculator_service.calculate_bulk_department_metrics(
+                    [department.id for department in departments], MONTH
+                )
+            self.assertEqual([result.department_id for result in results], [department.id for department in departments])
+        self.assertEqual([len(result.pods) for result in results], [3, 3, 3])
+        self.assertEqual(sum(product.percent for product in results[0].product_distribution), Decimal('100.00'))
+    
+    def test_pod_metrics_query_count_does_not_grow_with_pod_size(self):
+        pod = self.pods[0]
+        with self.assertNumQueries(2):
+            metrics = metrics_calculator_service.calculate_pod_metrics(pod.id, MONTH)
+        self.assertEqual(len(metrics.employees), 4)
+        
+        for emp_index in range(10):
+            Employee.objects.create(
+                employee_code=f'NEW{emp_index}',
+                name=f'New {emp_index}',
+                email='employee@example.com',
+                department=pod.department,
+                pod=pod,
+            )
+        with self.assertNumQueries(2):
+            metrics = metrics_calculator_service.calculate_pod_metrics(pod.id, MONTH)
+        self.assertEqual(len(metrics.employees), 14)
+        self.assertEqual(metrics.total_hours, Decimal(4 * 33 + 3 * 6))
+    
+    def test_org_metrics_query_count(self):
+        with self.assertNumQueries(5):
+            metrics = metrics_calculator_service.calculate_org_metrics(MONTH)
+        self.assertEqual(len(metrics.department_breakdown), 3)
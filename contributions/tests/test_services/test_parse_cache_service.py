@@ -0,0 +1,80 @@
+"""Tests for the cached parse results stored next to upload blobs."""
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+import numpy as np
+from django.test import TestCase, override_settings
+from contributions.models import RawFile
+from contributions.services import file_storage_service, parse_cache_service
+from contributions.storages.storage_dto import ContributionRowBatchDTO
+
+MONTH = date(2025, 10, 1)
+CHECKSUM = 'ab' * 32
+
+
+class ParseCacheTests(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        
+        self.batches = [
+            ContributionRowBatchDTO(
+                sheet_name='Tech',
+                row_numbers=[2, 3, 5],
+                columns={'email': ['a@example.com', 'b@example.com', 'a@example.com'], 'product': ['Academy'] * 3},
+                contribution_months=[MONTH] * 3,
+                effort_hours=[Decimal('10.50'), Decimal('4'), Decimal('10.50')],
+            ),
+            ContributionRowBatchDTO(
+                sheet_name='Finance', row_numbers=[], columns={'email': []}, contribution_months=[], effort_hours=[],
+            ),
+        ]
+        self.errors = [{'sheet': 'Tech', 'row': 4, 'error': 'Invalid email'}]
+    
+    def test_results_round_trip_through_memory_mapped_columns(self):
+        cache_path = parse_cache_service.get_cache_path(CHECKSUM)
+        parse_cache_service.save_parse_result(cache_path, self.batches, self.errors)
+        
+        with mock.patch.object(parse_cache_service.np, 'load', wraps=np.load) as load:
+            batches, errors = parse_cache_service.load_parse_result(cache_path)
+        
+        self.assertEqual((batches, errors), (self.batches, self.errors))
+        self.assertTrue(load.call_args_list)
+        for call in load.call_args_list:
+            self.assertEqual(call.kwargs['mmap_mode'], 'r')
+    
+    def test_unreadable_entry_is_parsed_again_and_replaced(self):
+        cache_path = parse_cache_service.get_cache_path(CHECKSUM)
+        cache_path.mkdir(parents=True)
+        (cache_path / parse_cache_service.CACHE_META_FILE).write_text('not json')
+        
+        with mock.patch.object(
+            parse_cache_service.file_parser_service, 'parse_contribution_batches', return_value=(self.batches, self.errors)
+        ) as parse:
+            self.assertEqual(parse_cache_service.parse_contribution_batches('upload.xlsx', CHECKSUM), (self.batches, self.errors))
+            self.assertEqual(parse_cache_service.parse_contribution_batches('upload.xlsx', CHECKSUM), (self.batches, self.errors))
+        
+        self.assertEqual(parse.call_count, 1)
+    
+    def test_gc_deletes_cache_entries_of_unreferenced_blobs(self):
+        kept_checksum = 'cd' * 32
+        RawFile.objects.create(
+            file_name='kept.xlsx', storage_path=f"{file_storage_service.BLOB_DIR}/cd/{kept_checksum}.xlsx",
+            checksum=kept_checksum,
+        )
+        kept_path = parse_cache_service.get_cache_path(kept_checksum)
+        orphan_path = parse_cache_service.get_cache_path(CHECKSUM)
+        parse_cache_service.save_parse_result(kept_path, self.batches, self.errors)
+        parse_cache_service.save_parse_result(orphan_path, self.batches, self.errors)
+        
+        result = file_storage_service.collect_unreferenced_blobs(min_age_seconds=0)
+        
+        self.assertEqual((result['referenced'], result['deleted']), (1, 1))
+        self.assertGreater(result['bytes_freed'], 0)
+        self.assertTrue(kept_path.exists())
+        self.assertFalse(orphan_path.exists())
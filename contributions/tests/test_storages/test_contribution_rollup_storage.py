@@ -0,0 +1,60 @@
+"""Tests keeping the monthly rollups in step with contribution record deletes."""
+from datetime import date
+from decimal import Decimal
+from django.test import TestCase
+from core.models import Department, Pod, Product, Employee
+from contributions.models import RawFile
+from contributions.storages import contribution_rollup_storage, contribution_storage
+from contributions.storages.storage_dto import ContributionRecordDTO
+
+MONTH = date(2025, 10, 1)
+
+
+class RollupCascadeDeleteTests(TestCase):
+    """Deletes cascading to contribution records leave the rollups matching the raw records."""
+    
+    def setUp(self):
+        product = Product.objects.create(name='Academy')
+        department = Department.objects.create(name='Engineering')
+        pod = Pod.objects.create(name='Alpha', department=department)
+        self.employees = [
+            Employee.objects.create(
+                employee_code=f'E{index}', name=f'Employee {index}', email='employee@example.com',
+                department=department, pod=pod,
+            )
+            for index in range(2)
+        ]
+        self.source_files = [RawFile.objects.create(file_name=f'{index}.xlsx', storage_path=f'{index}.xlsx') for index in range(2)]
+        for source_file in self.source_files:
+            contribution_storage.bulk_create_contributions(
+                [
+                    ContributionRecordDTO(
+                        employee_id=employee.id,
+                        department_id=department.id,
+                        pod_id=pod.id,
+                        product_id=product.id,
+                        contribution_month=MONTH,
+                        effort_hours=Decimal('12.50'),
+                    )
+                    for employee in self.employees
+                ],
+                source_file.id
+            )
+    
+    def test_raw_file_delete_subtracts_its_records(self):
+        self.source_files[0].delete()
+        
+        self.assertEqual(contribution_rollup_storage.find_month_mismatches(MONTH), [])
+        self.assertEqual(contribution_rollup_storage.get_total_hours_by_month(MONTH), Decimal('25.00'))
+    
+    def test_raw_file_queryset_delete_subtracts_its_records(self):
+        RawFile.objects.all().delete()
+        
+        self.assertEqual(contribution_rollup_storage.find_month_mismatches(MONTH), [])
+        self.assertEqual(contribution_rollup_storage.get_total_hours_by_month(MONTH), Decimal('0'))
+    
+    def test_employee_delete_removes_its_rollups(self):
+        self.employees[0].delete()
+        
+        self.assertEqual(contribution_rollup_storage.find_month_mismatches(MONTH), [])
+        self.assertEqual(contribution_rollup_storage.get_total_hours_by_month(MONTH), Decimal('25.00'))
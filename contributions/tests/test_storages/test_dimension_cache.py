@@ -0,0 +1,109 @@
+"""Tests for the process-local cache of products, departments and pods."""
+from datetime import date
+from decimal import Decimal
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+from core.models import Department, Employee, Pod, Product
+from contributions.exceptions import EntityNotFoundException
+from contributions.models import RawFile
+from contributions.storages import contribution_storage, dimension_cache, product_storage
+from contributions.storages.storage_dto import ContributionRecordDTO
+
+MONTH = date(2025, 10, 1)
+
+
+class Rollback(Exception):
+    pass
+
+
+class DimensionCacheRollbackTests(TestCase):
+    """Rows written by a rolled back savepoint are not served from the cache."""
+    
+    def test_savepoint_rollback_discards_uncommitted_rows(self):
+        product_storage.bulk_get_or_create_product_ids(['Kept'])
+        try:
+            with transaction.atomic():
+                product_storage.bulk_get_or_create_product_ids(['Ghost'])
+                self.assertIsNotNone(dimension_cache.products.get_by_key('Ghost'))
+                raise Rollback
+        except Rollback:
+            pass
+        
+        with self.assertRaises(EntityNotFoundException):
+            product_storage.get_product_by_name('Ghost')
+        self.assertEqual([product.name for product in product_storage.list_products()], ['Kept'])
+
+
+class DimensionCacheTransactionRollbackTests(TransactionTestCase):
+
+    def setUp(self):
+        # Tables flushed after earlier tests send no signals
+        dimension_cache.invalidate()
+    
+    def test_transaction_rollback_discards_uncommitted_rows(self):
+        try:
+            with transaction.atomic():
+                product_storage.bulk_get_or_create_product_ids(['Ghost'])
+                raise Rollback
+        except Rollback:
+            pass
+        
+        self.assertEqual(product_storage.list_products(), [])
+        
+        with transaction.atomic():
+            product_storage.bulk_get_or_create_product_ids(['Kept'])
+        self.assertEqual([product.name for product in product_storage.list_products()], ['Kept'])
+
+
+class DimensionCacheStaleTablesTests(TransactionTestCase):
+    """Rows written by another process (no version bump seen here) are still found."""
+    
+    def setUp(self):
+        dimension_cache.invalidate()
+        Product.objects.create(name='Academy')
+        self.assertEqual(len(product_storage.list_products()), 1)
+        # Like a write from a process whose version bump does not reach this one
+        Product.objects.bulk_create([Product(name='Intensive')])
+    
+    def test_lookup_miss_reloads_from_database(self):
+        intensive = product_storage.get_product_by_name('Intensive')
+        self.assertEqual(product_storage.get_product_by_id(intensive.id).name, 'Intensive')
+        self.assertEqual(product_storage.get_product_ids_by_names(['Academy', 'Intensive'])['Intensive'], intensive.id)
+        
+        with self.assertRaises(EntityNotFoundException):
+            product_storage.get_product_by_name('NIAT')
+    
+    def test_unknown_lookups_reload_the_table_once(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(dimension_cache.products.get_by_id(0))
+        with self.assertNumQueries(0):
+            self.assertIsNone(dimension_cache.products.get_by_id(0))
+            self.assertEqual(dimension_cache.products.get_by_key('Intensive').name, 'Intensive')
+        with self.assertNumQueries(0):
+            with self.assertRaises(EntityNotFoundException):
+                product_storage.get_product_by_id(0)
+    
+    def test_contribution_rows_resolve_new_dimension_names(self):
+        department = Department.objects.create(name='Engineering')
+        pod = Pod.objects.create(name='Platform', department=department)
+        employee = Employee.objects.create(
+            employee_code='E1', name='Employee', email='e1@example.com', department=department, pod=pod
+        )
+        source_file = RawFile.objects.create(file_name='seed.xlsx', storage_path='seed.xlsx')
+        contribution_storage.bulk_create_contributions([ContributionRecordDTO(
+            employee_id=employee.id,
+            department_id=department.id,
+            pod_id=pod.id,
+            product_id=Product.objects.get(name='Intensive').id,
+            contribution_month=MONTH,
+            effort_hours=Decimal('10'),
+        )], source_file.id)
+        
+        rows = list(contribution_storage.iter_contribution_rows(month=MONTH))
+        self.assertEqual([(row.department_name, row.pod_name, row.product_name) for row in rows], [('Engineering', 'Platform', 'Intensive')])
+    
+    def test_tables_expire_after_timeout(self):
+        with self.settings(DIMENSION_CACHE_TIMEOUT=3600):
+            self.assertEqual(len(product_storage.list_products()), 1)
+        with self.settings(DIMENSION_CACHE_TIMEOUT=0):
+            self.assertEqual(len(product_storage.list_products()), 2)
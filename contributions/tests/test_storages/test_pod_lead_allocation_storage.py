@@ -0,0 +1,72 @@
+"""Query-count tests for the processed allocation rows behind the master list."""
+import tempfile
+from datetime import date
+from decimal import Decimal
+import pandas as pd
+from django.test import TestCase, override_settings
+from core.models import Department, Pod, Employee
+from contributions.models import PodLeadAllocation
+from contributions.services import final_master_list_service
+from contributions.storages import pod_lead_allocation_storage
+
+MONTH = date(2025, 10, 1)
+
+
+class ProcessedAllocationRowsTests(TestCase):
+    """Processed allocations are read with their employee, department and pod in a single query."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.pod_lead = Employee.objects.create(employee_code='LEAD', name='Lead', email='lead@example.com')
+        for dept_index in range(2):
+            department = Department.objects.create(name=f'Dept {dept_index}')
+            pod = Pod.objects.create(name=f'Pod {dept_index}', department=department)
+            for emp_index in range(3):
+                cls._create_allocation(f'E{dept_index}{emp_index}', department, pod)
+    
+    @classmethod
+    def _create_allocation(cls, code, department=None, pod=None, status='PROCESSED'):
+        employee = Employee.objects.create(
+            employee_code=code, name=f'Employee {code}', email=f'{code}@example.com',
+            department=department, pod=pod,
+        )
+        return PodLeadAllocation.objects.create(
+            employee=employee, pod_lead=cls.pod_lead, contribution_month=MONTH,
+            product='Academy', academy_percent=Decimal('100.00'), status=status,
+        )
+    
+    def test_rows_are_one_query_for_any_number_of_allocations(self):
+        with self.assertNumQueries(1):
+            rows = pod_lead_allocation_storage.get_processed_allocation_rows(MONTH)
+        self.assertEqual(len(rows), 6)
+        
+        for emp_index in range(10):
+            self._create_allocation(f'NEW{emp_index}')
+        self._create_allocation('PENDING', status='PENDING')
+        with self.assertNumQueries(1):
+            rows = pod_lead_allocation_storage.get_processed_allocation_rows(MONTH)
+        self.assertEqual(len(rows), 16)
+        new_rows = [row for row in rows if row['employee_code'].startswith('NEW')]
+        self.assertEqual({(row['department_name'], row['pod_name']) for row in new_rows}, {(None, None)})
+    
+    def test_master_list_queries_do_not_grow_with_allocations(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        
+        with override_settings(MEDIA_ROOT=media_root.name):
+            with self.assertNumQueries(1):
+                final_master_list_service.generate_final_master_list(MONTH)
+            
+            for emp_index in range(10):
+                self._create_allocation(f'NEW{emp_index}')
+            with self.assertNumQueries(1):
+                path = final_master_list_service.generate_final_master_list(MONTH)
+            
+            self.assertEqual(len(pd.read_excel(path, sheet_name='Master')), 16)
+    
+    def test_streamed_rows_are_one_query(self):
+        with self.assertNumQueries(1):
+            rows = list(pod_lead_allocation_storage.iter_processed_allocation_rows(MONTH, chunk_size=2))
+        self.assertEqual([row['department_name'] for row in rows], ['Dept 0'] * 3 + ['Dept 1'] * 3)
+        self.assertEqual(rows[0]['pod_name'], 'Pod 0')
+        self.assertEqual(rows[0]['email'], 'E00@example.com')
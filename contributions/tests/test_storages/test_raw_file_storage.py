@@ -0,0 +1,43 @@
+"""Tests for the one-live-file-per-checksum rule of raw files."""
+from django.test import TestCase
+from contributions.exceptions import DuplicateUploadException
+from contributions.models import RawFile
+from contributions.storages import raw_file_storage
+
+CHECKSUM = 'a' * 64
+
+
+class RawFileChecksumTests(TestCase):
+    
+    def test_duplicate_live_checksum_is_rejected_by_the_database(self):
+        raw_file_storage.create_raw_file('first.xlsx', 'blobs/a.xlsx', checksum=CHECKSUM)
+        
+        with self.assertRaises(DuplicateUploadException):
+            # Skips the lookup, like a concurrent upload that passed it
+            raw_file_storage.create_raw_file('second.xlsx', 'blobs/a.xlsx', checksum=CHECKSUM, check_duplicate=False)
+    
+    def test_failed_file_frees_its_checksum(self):
+        first = raw_file_storage.create_raw_file('first.xlsx', 'blobs/a.xlsx', checksum=CHECKSUM, status='QUEUED')
+        raw_file_storage.update_raw_file_status(first.id, 'FAILED', {'failure_reason': 'boom'})
+        
+        self.assertIsNone(raw_file_storage.get_raw_file_by_checksum(CHECKSUM))
+        retry = raw_file_storage.create_raw_file('retry.xlsx', 'blobs/a.xlsx', checksum=CHECKSUM)
+        self.assertEqual(raw_file_storage.get_raw_file_by_checksum(CHECKSUM).id, retry.id)
+    
+    def test_save_keeps_active_checksum_in_step_with_status(self):
+        raw_file = RawFile.objects.create(file_name='a.xlsx', storage_path='blobs/a.xlsx', checksum=CHECKSUM)
+        self.assertEqual(raw_file.active_checksum, CHECKSUM)
+        
+        raw_file.status = 'FAILED'
+        raw_file.save(update_fields=['status'])
+        raw_file.refresh_from_db()
+        self.assertIsNone(raw_file.active_checksum)
+        
+        RawFile.objects.create(file_name='b.xlsx', storage_path='blobs/a.xlsx', checksum=CHECKSUM)
+    
+    def test_reprocessed_failed_file_takes_its_checksum_back(self):
+        raw_file = raw_file_storage.create_raw_file('first.xlsx', 'blobs/a.xlsx', checksum=CHECKSUM, status='QUEUED')
+        raw_file_storage.update_raw_file_status(raw_file.id, 'FAILED')
+        raw_file_storage.update_raw_file_status(raw_file.id, 'PROCESSING')
+        
+        self.assertEqual(raw_file_storage.get_raw_file_by_checksum(CHECKSUM).id, raw_file.id)
@@ -4,7 +4,7 @@ from contributions.views import (
     upload_views, dashboard_views, entity_views, raw_file_views, auth_views, user_views,
     employee_master_views, feature_upload_views, pod_lead_allocation_views,
     allocation_processing_views, sheet_distribution_views, automation_views,
-    final_master_list_views
+    final_master_list_views, contribution_views
 )
 
 app_name = 'contributions'
@@ -20,6 +20,7 @@ urlpatterns = [
     # Upload endpoints
     path('uploads/csv/', upload_views.UploadContributionFileView.as_view(), name='upload_csv'),
     path('uploads/<int:raw_file_id>/', raw_file_views.GetRawFileView.as_view(), name='get_raw_file'),
+    path('uploads/<int:raw_file_id>/status/', raw_file_views.GetUploadStatusView.as_view(), name='upload_status'),
     path('uploads/<int:raw_file_id>/download/', raw_file_views.DownloadRawFileView.as_view(), name='download_raw_file'),
     path('uploads/<int:raw_file_id>/errors/', raw_file_views.DownloadErrorsCSVView.as_view(), name='download_errors_csv'),
     
@@ -29,6 +30,9 @@ urlpatterns = [
     path('pods/<int:pod_id>/contributions/', dashboard_views.PodContributionsView.as_view(), name='pod_contributions'),
     path('employees/<int:employee_id>/contributions/', dashboard_views.EmployeeContributionsView.as_view(), name='employee_contributions'),
     
+    # Contribution listing
+    path('contributions/', contribution_views.ListContributionsView.as_view(), name='list_contributions'),
+    
     # Entity endpoints
     path('products/', entity_views.ProductListView.as_view(), name='list_products'),
     path('features/', entity_views.FeatureListView.as_view(), name='list_features'),
@@ -37,6 +41,8 @@ urlpatterns = [
     path('admin/employees/import/', employee_master_views.ImportEmployeeMasterView.as_view(), name='import_employee_master'),
     path('admin/features/upload/', feature_upload_views.UploadFeatureCSVView.as_view(), name='upload_feature_csv'),
     path('admin/sheets/generate-all/', sheet_distribution_views.GenerateAllPodSheetsView.as_view(), name='generate_all_sheets'),
+    path('admin/metrics-cache/stats/', dashboard_views.MetricsCacheStatsView.as_view(), name='metrics_cache_stats'),
+    path('admin/allocations/process/', allocation_processing_views.ProcessMonthAllocationsView.as_view(), name='process_month_allocations'),
     path('admin/allocations/<int:pod_id>/process/', allocation_processing_views.ProcessPodAllocationsView.as_view(), name='process_allocations'),
     
     # Pod Lead allocation endpoints
@@ -50,6 +56,7 @@ urlpatterns = [
     
     # Final master list endpoints
     path('admin/final-master-list/generate/', final_master_list_views.GenerateFinalMasterListView.as_view(), name='generate_final_master_list'),
+    path('admin/final-master-list/download/', final_master_list_views.DownloadFinalMasterListView.as_view(), name='download_final_master_list'),
     path('admin/final-master-list/', final_master_list_views.GetFinalMasterListView.as_view(), name='get_final_master_list'),
 ]
 
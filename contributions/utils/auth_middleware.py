@@ -6,8 +6,29 @@ from contributions.storages import employee_storage
 from contributions.exceptions import EntityNotFoundException
 
 
-def get_employee_from_request(request):
-    """Extract employee from request JWT token."""
+def get_employee_from_request(request, with_profile: bool = False):
+    """
+    Get the authenticated employee of a request.
+    
+    Returns the employee EmployeeJWTAuthentication attached to request.user
+    (the token is decoded and the employee loaded once per request); the
+    token is only decoded here for requests that were not authenticated
+    that way.
+    
+    With stateless authorization that employee only carries the token
+    claims; with_profile loads the full employee (name, email, department
+    and pod names) for views that return it.
+    """
+    from contributions.utils.custom_auth import EmployeeUser
+    user = getattr(request, 'user', None)
+    if isinstance(user, EmployeeUser):
+        if with_profile and user.from_claims:
+            try:
+                return employee_storage.get_employee_by_id(user.id)
+            except EntityNotFoundException as e:
+                raise AuthenticationFailed(f"Authentication failed: {str(e)}")
+        return user.employee
+    
     try:
         # Use our custom authentication
         from contributions.utils.custom_auth import EmployeeJWTAuthentication
@@ -2,10 +2,35 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import UntypedToken
+from contributions.services import jwt_service
+from contributions.services import token_revocation_service
 from contributions.storages import employee_storage
+from contributions.storages.storage_dto import EmployeeDTO
 from contributions.exceptions import EntityNotFoundException
 
 
+class EmployeeUser:
+    """
+    Authenticated identity set as request.user for the rest of the request.
+    
+    Holds the employee loaded while authenticating, so views, interactors
+    and permission checks reuse it instead of loading it again. With
+    stateless authorization the employee is built from the token claims
+    instead (from_claims), carrying only its ID, code, role, department
+    and pod.
+    """
+    
+    is_authenticated = True
+    is_active = True
+    is_anonymous = False
+    
+    def __init__(self, employee: EmployeeDTO, from_claims: bool = False):
+        self.employee = employee
+        self.from_claims = from_claims
+        self.id = employee.id
+        self.pk = employee.id
+
+
 class EmployeeJWTAuthentication(JWTAuthentication):
     """Custom JWT authentication that uses employee_id instead of user."""
     
@@ -16,19 +41,18 @@ class EmployeeJWTAuthentication(JWTAuthentication):
             if not employee_id:
                 raise InvalidToken('Token missing employee_id')
             
-            employee = employee_storage.get_employee_by_id(employee_id)
-            
-            # Create a simple user-like object for compatibility
-            class EmployeeUser:
-                def __init__(self, employee):
-                    self.employee = employee
-                    self.id = employee.id
-                    self.is_authenticated = True
-                    self.is_active = True
+            if token_revocation_service.is_stateless_authz_enabled():
+                employee = jwt_service.get_employee_from_claims(validated_token)
+                if employee is not None:
+                    if token_revocation_service.is_token_revoked(employee.id, validated_token['iat']):
+                        raise InvalidToken('Token has been revoked')
+                    return EmployeeUser(employee, from_claims=True)
             
+            employee = employee_storage.get_employee_by_id(employee_id)
             return EmployeeUser(employee)
         except EntityNotFoundException:
             raise InvalidToken('Employee not found')
+        except InvalidToken:
+            raise
         except Exception as e:
             raise InvalidToken(f'Invalid token: {str(e)}')
-
@@ -1,8 +1,10 @@
 """Views for processing Pod Lead allocations."""
 from rest_framework.views import APIView
 from rest_framework.request import Request
-from contributions.interactors.allocation_processing_interactor import ProcessPodAllocationsInteractor
-from contributions.presenters.allocation_presenter import present_processing_result
+from contributions.interactors.allocation_processing_interactor import (
+    ProcessPodAllocationsInteractor, ProcessMonthAllocationsInteractor
+)
+from contributions.presenters.allocation_presenter import present_processing_result, present_month_processing_result
 from contributions.presenters.error_presenter import present_error
 from contributions.common.response import success_response
 from contributions.utils.auth_middleware import get_employee_from_request
@@ -59,3 +61,54 @@ class ProcessPodAllocationsView(APIView):
         except Exception as e:
             return present_error(DomainException(f"Failed to process allocations: {str(e)}"))
 
+
+
+class ProcessMonthAllocationsView(APIView):
+    """View for processing the allocations of every pod for a month."""
+    
+    def post(self, request: Request):
+        """Process all SUBMITTED allocations of a month, pod by pod."""
+        try:
+            # Get employee from token
+            employee = get_employee_from_request(request)
+            
+            # Check admin/CEO permission
+            if not (employee.role == 'ADMIN' or employee.role == 'CEO'):
+                raise PermissionDeniedException("Only ADMIN or CEO can process allocations")
+            
+            # Get month parameter
+            month = request.query_params.get('month')
+            if not month:
+                return success_response(
+                    data={'error': 'month parameter is required'},
+                    message='Missing required parameter',
+                    status_code=400
+                )
+            
+            # Get output format (default: records)
+            output_format = request.query_params.get('output', 'records')
+            if output_format not in ['records', 'csv']:
+                return success_response(
+                    data={'error': "output parameter must be 'records' or 'csv'"},
+                    message='Invalid parameter',
+                    status_code=400
+                )
+            
+            # Execute interactor
+            interactor = ProcessMonthAllocationsInteractor(month=month, output_format=output_format)
+            result = interactor.execute()
+            
+            # Present result
+            response_data = present_month_processing_result(result)
+            if response_data['failed_count']:
+                message = f"Processed {response_data['succeeded_count']} of {response_data['pod_count']} pods"
+            else:
+                message = 'Allocations processed successfully'
+            return success_response(data=response_data, message=message)
+        
+        except PermissionDeniedException as e:
+            return present_error(e)
+        except DomainException as e:
+            return present_error(e)
+        except Exception as e:
+            return present_error(DomainException(f"Failed to process allocations: {str(e)}"))
@@ -23,7 +23,7 @@ class UploadInitialXLSXView(APIView):
             employee = get_employee_from_request(request)
             
             # Check automation permission
-            check_automation_permission(employee.id)
+            check_automation_permission(employee)
             
             # Get file and month
             file_obj = request.FILES.get('file')
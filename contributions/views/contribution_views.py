@@ -0,0 +1,60 @@
+"""Contribution listing views."""
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from contributions.interactors.contribution_listing_interactor import ListContributionsInteractor
+from contributions.presenters.contribution_presenter import present_contribution_page, render_contributions_ndjson
+from contributions.presenters.error_presenter import present_error
+from contributions.common.response import success_response
+from contributions.utils.auth_middleware import get_employee_from_request
+from contributions.exceptions import DomainException
+
+
+class ListContributionsView(APIView):
+    """List contribution records with keyset (cursor) pagination."""
+    
+    def get(self, request: Request):
+        """
+        List contribution records ordered by month and ID.
+        
+        Filters: month (YYYY-MM), department_id, pod_id, product_id and
+        employee_id. Returns a page of `limit` records with the cursor of
+        the next page; with output=ndjson all records after the cursor are
+        streamed instead, one JSON object per line.
+        """
+        try:
+            employee = get_employee_from_request(request)
+            params = request.query_params
+            
+            output_format = params.get('output', 'json')
+            if output_format not in ['json', 'ndjson']:
+                return success_response(
+                    data={'error': "output parameter must be 'json' or 'ndjson'"},
+                    message='Invalid parameter',
+                    status_code=400
+                )
+            
+            interactor = ListContributionsInteractor(
+                employee,
+                month=params.get('month'),
+                department_id=params.get('department_id'),
+                pod_id=params.get('pod_id'),
+                product_id=params.get('product_id'),
+                employee_id=params.get('employee_id'),
+                cursor=params.get('cursor'),
+                limit=params.get('limit'),
+            )
+            
+            if output_format == 'ndjson':
+                # Records are read and encoded while the response is being sent
+                return StreamingHttpResponse(
+                    render_contributions_ndjson(interactor.stream()),
+                    content_type='application/x-ndjson'
+                )
+            
+            return success_response(data=present_contribution_page(interactor.execute()))
+        
+        except DomainException as e:
+            return present_error(e)
+        except Exception as e:
+            return present_error(DomainException(f"Failed to list contributions: {str(e)}"))
@@ -12,7 +12,8 @@ from contributions.presenters.metrics_presenter import (
 from contributions.presenters.error_presenter import present_error
 from contributions.common.response import success_response
 from contributions.utils.auth_middleware import get_employee_from_request
-from contributions.exceptions import DomainException
+from contributions.services import metrics_cache_service
+from contributions.exceptions import DomainException, PermissionDeniedException
 
 
 class OrgDashboardView(APIView):
@@ -31,7 +32,7 @@ class OrgDashboardView(APIView):
                     status_code=400
                 )
             
-            interactor = GetOrgMetricsInteractor(month, employee.id)
+            interactor = GetOrgMetricsInteractor(month, employee)
             metrics = interactor.execute()
             
             response_data = present_org_metrics(metrics)
@@ -59,7 +60,7 @@ class DepartmentDashboardView(APIView):
                     status_code=400
                 )
             
-            interactor = GetDepartmentMetricsInteractor(dept_id, month, employee.id)
+            interactor = GetDepartmentMetricsInteractor(dept_id, month, employee)
             metrics = interactor.execute()
             
             response_data = present_department_metrics(metrics)
@@ -87,7 +88,7 @@ class PodContributionsView(APIView):
                     status_code=400
                 )
             
-            interactor = GetPodMetricsInteractor(pod_id, month, employee.id)
+            interactor = GetPodMetricsInteractor(pod_id, month, employee)
             metrics = interactor.execute()
             
             response_data = present_pod_metrics(metrics)
@@ -115,7 +116,7 @@ class EmployeeContributionsView(APIView):
                     status_code=400
                 )
             
-            interactor = GetEmployeeMetricsInteractor(employee_id, month, employee.id)
+            interactor = GetEmployeeMetricsInteractor(employee_id, month, employee)
             metrics = interactor.execute()
             
             response_data = present_employee_metrics(metrics)
@@ -126,3 +127,21 @@ class EmployeeContributionsView(APIView):
         except Exception as e:
             return present_error(DomainException(f"Failed to get employee metrics: {str(e)}"))
 
+
+class MetricsCacheStatsView(APIView):
+    """Dashboard metrics cache statistics view."""
+    
+    def get(self, request: Request):
+        """Get hit/miss counters of the dashboard metrics cache."""
+        try:
+            employee = get_employee_from_request(request)
+            
+            if not (employee.role == 'ADMIN' or employee.role == 'CEO'):
+                raise PermissionDeniedException("Only ADMIN or CEO can view cache statistics")
+            
+            return success_response(data=metrics_cache_service.get_stats())
+        
+        except DomainException as e:
+            return present_error(e)
+        except Exception as e:
+            return present_error(DomainException(f"Failed to get cache statistics: {str(e)}"))
@@ -4,9 +4,12 @@ from rest_framework.request import Request
 from datetime import datetime, date
 from pathlib import Path
 from django.conf import settings
+from django.http import StreamingHttpResponse
 from contributions.utils.auth_middleware import get_employee_from_request
 from contributions.services.permission_service import check_admin_permission, check_ceo_permission
-from contributions.services.final_master_list_service import generate_final_master_list
+from contributions.services.final_master_list_service import (
+    generate_final_master_list, stream_master_list_xlsx, stream_master_list_csv
+)
 from contributions.storages import pod_lead_allocation_storage
 from contributions.common.response import success_response
 from contributions.exceptions import ValidationException, DomainException
@@ -23,10 +26,10 @@ class GenerateFinalMasterListView(APIView):
             
             # Check admin or CEO permission
             try:
-                check_admin_permission(employee.id)
+                check_admin_permission(employee)
             except:
                 try:
-                    check_ceo_permission(employee.id)
+                    check_ceo_permission(employee)
                 except:
                     return success_response(
                         data={'error': 'Admin or CEO access required'},
@@ -120,10 +123,10 @@ class GetFinalMasterListView(APIView):
             
             # Check admin or CEO permission
             try:
-                check_admin_permission(employee.id)
+                check_admin_permission(employee)
             except:
                 try:
-                    check_ceo_permission(employee.id)
+                    check_ceo_permission(employee)
                 except:
                     return success_response(
                         data={'error': 'Admin or CEO access required'},
@@ -174,3 +177,102 @@ class GetFinalMasterListView(APIView):
                 status_code=500
             )
 
+
+
+class DownloadFinalMasterListView(APIView):
+    """View streaming the final master list without storing it."""
+    
+    CONTENT_TYPES = {
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'csv': 'text/csv',
+    }
+    
+    def get(self, request: Request):
+        """Stream the final master list as XLSX (default) or CSV, built from the database as it downloads."""
+        try:
+            # Get employee from token
+            employee = get_employee_from_request(request)
+            
+            # Check admin or CEO permission
+            try:
+                check_admin_permission(employee)
+            except:
+                try:
+                    check_ceo_permission(employee)
+                except:
+                    return success_response(
+                        data={'error': 'Admin or CEO access required'},
+                        message='Permission denied',
+                        status_code=403
+                    )
+            
+            # Get month parameter
+            month = request.query_params.get('month')
+            if not month:
+                return success_response(
+                    data={'error': 'Month parameter is required'},
+                    message='Month is required (format: YYYY-MM)',
+                    status_code=400
+                )
+            
+            # Validate month format
+            try:
+                month_date = datetime.strptime(month, '%Y-%m').date()
+                month_date = date(month_date.year, month_date.month, 1)
+            except ValueError:
+                return success_response(
+                    data={'error': f'Invalid month format: {month}. Expected YYYY-MM'},
+                    message='Invalid month format',
+                    status_code=400
+                )
+            
+            # Get output format (default: xlsx)
+            output_format = request.query_params.get('output', 'xlsx')
+            if output_format not in self.CONTENT_TYPES:
+                return success_response(
+                    data={'error': "output parameter must be 'xlsx' or 'csv'"},
+                    message='Invalid parameter',
+                    status_code=400
+                )
+            
+            # Check if all Pod Leads have submitted
+            pending_count = pod_lead_allocation_storage.count_allocations_by_status(month_date, 'PENDING')
+            if pending_count > 0:
+                return success_response(
+                    data={
+                        'error': f'There are {pending_count} pending allocations. All Pod Leads must submit before generating final master list.',
+                        'pending_count': pending_count
+                    },
+                    message='Pending allocations exist',
+                    status_code=400
+                )
+            
+            if not pod_lead_allocation_storage.count_allocations_by_status(month_date, 'PROCESSED'):
+                return success_response(
+                    data={'error': f'No processed allocations found for month {month}'},
+                    message='File not found',
+                    status_code=404
+                )
+            
+            # Rows are read and encoded while the response is being sent
+            if output_format == 'xlsx':
+                content = stream_master_list_xlsx(month_date)
+            else:
+                content = stream_master_list_csv(month_date)
+            
+            response = StreamingHttpResponse(content, content_type=self.CONTENT_TYPES[output_format])
+            response['Content-Disposition'] = f'attachment; filename="final_master_list_{month}.{output_format}"'
+            return response
+        
+        except DomainException as e:
+            return success_response(
+                data={'error': str(e)},
+                message='Domain error',
+                status_code=400
+            )
+        except Exception as e:
+            return success_response(
+                data={'error': str(e)},
+                message='Unexpected error occurred',
+                status_code=500
+            )
@@ -219,7 +219,8 @@ class SubmitPodAllocationView(APIView):
                 pod_id=pod_id,
                 month=month,
                 allocations=allocations,
-                pod_lead_id=employee.id
+                pod_lead_id=employee.id,
+                pod_lead=employee
             )
             result = interactor.execute()
             
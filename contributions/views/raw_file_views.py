@@ -4,6 +4,7 @@ from rest_framework.request import Request
 from django.http import FileResponse, HttpResponse
 from contributions.interactors.entity_interactors import GetRawFileInteractor
 from contributions.presenters.entity_presenter import present_raw_file
+from contributions.presenters.upload_presenter import present_upload_status
 from contributions.presenters.error_presenter import present_error
 from contributions.services.file_parser_service import generate_errors_csv
 from contributions.services.file_storage_service import get_file_path_by_id
@@ -33,6 +34,26 @@ class GetRawFileView(APIView):
             return present_error(DomainException(f"Failed to get raw file: {str(e)}"))
 
 
+class GetUploadStatusView(APIView):
+    """Upload processing status view."""
+    
+    def get(self, request: Request, raw_file_id: int):
+        """Get processing status and progress of an upload."""
+        try:
+            get_employee_from_request(request)  # Just check auth
+            
+            interactor = GetRawFileInteractor(raw_file_id)
+            raw_file = interactor.execute()
+            
+            response_data = present_upload_status(raw_file)
+            return success_response(data=response_data)
+        
+        except DomainException as e:
+            return present_error(e)
+        except Exception as e:
+            return present_error(DomainException(f"Failed to get upload status: {str(e)}"))
+
+
 class DownloadRawFileView(APIView):
     """Download raw file view."""
     
@@ -1,8 +1,9 @@
 """Upload views."""
 from rest_framework.views import APIView
 from rest_framework.request import Request
+from rest_framework import status
 from contributions.interactors.upload_interactor import UploadContributionFileInteractor
-from contributions.presenters.upload_presenter import present_upload_result, present_upload_error
+from contributions.presenters.upload_presenter import present_upload_job, present_upload_error
 from contributions.presenters.error_presenter import present_error
 from contributions.common.response import success_response
 from contributions.utils.auth_middleware import get_employee_from_request
@@ -28,13 +29,17 @@ class UploadContributionFileView(APIView):
             
             file = request.FILES['file']
             
-            # Execute upload interactor
+            # Store the file and queue it for background processing
             interactor = UploadContributionFileInteractor(file, employee.id)
-            result = interactor.execute()
+            result = interactor.enqueue()
             
-            # Present result
-            response_data = present_upload_result(result)
-            return success_response(data=response_data, message='File uploaded successfully')
+            # Present job
+            response_data = present_upload_job(result)
+            return success_response(
+                data=response_data,
+                message='File accepted for processing',
+                status_code=status.HTTP_202_ACCEPTED
+            )
         
         except DomainException as e:
             return present_error(e)
@@ -13,7 +13,7 @@ class CurrentUserView(APIView):
     def get(self, request: Request):
         """Get current user information."""
         try:
-            employee = get_employee_from_request(request)
+            employee = get_employee_from_request(request, with_profile=True)
             
             # Return user profile
             return success_response(data={
@@ -0,0 +1,94 @@
+"""Shared setup for the benchmark scripts: Django settings, a throwaway database and measurements."""
+import atexit
+import gc
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def setup_django() -> None:
+    """Configure Django for the benchmarks; generated files go to a temporary MEDIA_ROOT."""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Org_contributions_backend.settings')
+    import django
+    django.setup()
+    from django.conf import settings
+    settings.MEDIA_ROOT = tempfile.mkdtemp(prefix='benchmark-media-')
+
+
+def create_test_database() -> None:
+    """Run against a fresh test database (like manage.py test), destroyed on exit."""
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    atexit.register(connection.creation.destroy_test_db, old_name, verbosity=0)
+
+
+def best_of(fn: Callable[[], Any], repeat: int = 3) -> Tuple[float, Any]:
+    """Best wall-clock time of repeat calls, in seconds, and the result of the last call."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def traced_peak(fn: Callable[[], Any]) -> Tuple[int, Any]:
+    """Peak bytes allocated by Python (tracemalloc) during one call, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def run_isolated(fn: Callable, *args) -> Tuple[float, float, Any]:
+    """
+    Call fn(*args) in a fresh process.
+    
+    Peak RSS never goes down within a process, so each measurement gets
+    its own. fn must be a module-level function of the calling script.
+    
+    Returns:
+        (seconds, peak RSS growth in MiB, result)
+    """
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(_measure, (fn, args))
+
+
+def _measure(fn: Callable, args: tuple) -> Tuple[float, float, Any]:
+    gc.collect()
+    rss_before = peak_rss()
+    start = time.perf_counter()
+    result = fn(*args)
+    seconds = time.perf_counter() - start
+    return seconds, (peak_rss() - rss_before) / 2 ** 20, result
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def mib(size: float) -> str:
+    return f'{size / 2 ** 20:.1f} MiB'
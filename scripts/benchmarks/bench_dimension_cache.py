@@ -0,0 +1,102 @@
+"""
+Queries of an org-wide allocation processing run with and without the dimension cache.
+
+Seeds --departments x --pods x --employees employees with SUBMITTED
+allocations in a throwaway test database and counts the queries of
+process_month_allocations (records output, one pod at a time). Without
+the cache every product, department and pod lookup reads its table, as
+the storages did before dimension_cache; with it the tables are read once
+(the run starts with a cold cache). Each run is rolled back afterwards.
+
+    python scripts/benchmarks/bench_dimension_cache.py [--departments 5] [--pods 4] [--employees 10]
+"""
+import argparse
+from datetime import date
+from decimal import Decimal
+
+import _bootstrap
+
+_bootstrap.setup_django()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from core.models import Department, Employee, Pod, Product  # noqa: E402
+from contributions.models import ContributionRecord, PodLeadAllocation  # noqa: E402
+from contributions.services import allocation_processing_service  # noqa: E402
+from contributions.storages import dimension_cache  # noqa: E402
+
+MONTH = date(2025, 10, 1)
+DIMENSION_TABLES = ('"products"', '"departments"', '"pods"')
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(department_count: int, pod_count: int, employee_count: int) -> None:
+    for name in ['Academy', 'Intensive', 'NIAT']:
+        Product.objects.create(name=name)
+    for dept_index in range(department_count):
+        department = Department.objects.create(name=f'Department {dept_index}')
+        for pod_index in range(pod_count):
+            pod = Pod.objects.create(name=f'Pod {dept_index}-{pod_index}', department=department)
+            pod_lead = Employee.objects.create(
+                employee_code=f'L{dept_index}-{pod_index}', name=f'Lead {dept_index}-{pod_index}',
+                email='lead@example.com', department=department, pod=pod,
+            )
+            employees = Employee.objects.bulk_create([
+                Employee(
+                    employee_code=f'E{dept_index}-{pod_index}-{index}', name=f'Employee {dept_index}-{pod_index}-{index}',
+                    email='employee@example.com', department=department, pod=pod,
+                )
+                for index in range(employee_count)
+            ])
+            PodLeadAllocation.objects.bulk_create([
+                PodLeadAllocation(
+                    employee=employee, pod_lead=pod_lead, contribution_month=MONTH,
+                    academy_percent=Decimal('50.00'), intensive_percent=Decimal('30.00'),
+                    niat_percent=Decimal('20.00'), status='SUBMITTED',
+                )
+                for employee in employees
+            ])
+
+
+def count_queries(timeout: int):
+    """(all queries, dimension table queries, records created) of one rolled back month run."""
+    dimension_cache.invalidate()
+    with override_settings(DIMENSION_CACHE_TIMEOUT=timeout), CaptureQueriesContext(connection) as queries:
+        try:
+            with transaction.atomic():
+                result = allocation_processing_service.process_month_allocations(MONTH, workers=1)
+                created = ContributionRecord.objects.count()
+                raise Rollback
+        except Rollback:
+            pass
+    dimension_queries = [
+        query for query in queries.captured_queries
+        if any(f'FROM {table}' in query['sql'] for table in DIMENSION_TABLES)
+    ]
+    return len(queries), len(dimension_queries), created, result['failed_count']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--departments', type=int, default=5)
+    parser.add_argument('--pods', type=int, default=4)
+    parser.add_argument('--employees', type=int, default=10)
+    args = parser.parse_args()
+    
+    _bootstrap.create_test_database()
+    seed(args.departments, args.pods, args.employees)
+    print(f'{args.departments * args.pods} pods, {args.departments * args.pods * args.employees} allocations')
+    
+    # A negative timeout reloads the tables on every lookup
+    for label, timeout in [('without dimension cache', -1), ('with dimension cache', 3600)]:
+        total, dimension, created, failed = count_queries(timeout)
+        print(f'{label:24} {total:5} queries  ({dimension} on products/departments/pods, '
+              f'{created} records, {failed} failed pods)')
+
+
+if __name__ == '__main__':
+    main()
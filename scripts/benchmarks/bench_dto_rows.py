@@ -0,0 +1,118 @@
+"""
+Storage reads: model instances + select_related vs values_list + RowDTO.from_values.
+
+Seeds --rows contribution records in a throwaway test database and reads
+them through get_contributions_by_month and through the previous ORM path
+(records with their employee, department, pod, product and feature copied
+into ContributionRecordDTO). Reports the best time and the tracemalloc
+peak of each, and checks that both give the same DTOs.
+
+    python scripts/benchmarks/bench_dto_rows.py [--rows 100000]
+"""
+import argparse
+import random
+from datetime import date
+from decimal import Decimal
+
+import _bootstrap
+
+_bootstrap.setup_django()
+
+from core.models import Department, Employee, Feature, Pod, Product  # noqa: E402
+from contributions.models import ContributionRecord, RawFile  # noqa: E402
+from contributions.storages import contribution_storage  # noqa: E402
+from contributions.storages.storage_dto import ContributionRecordDTO  # noqa: E402
+
+MONTH = date(2025, 10, 1)
+
+
+def seed(row_count: int, seed_: int = 1) -> None:
+    rnd = random.Random(seed_)
+    products = [Product.objects.create(name=name) for name in ['Academy', 'Intensive', 'NIAT']]
+    features = [None] + [Feature.objects.create(product=product, name=f'{product.name} feature') for product in products]
+    source_file = RawFile.objects.create(file_name='benchmark.xlsx', storage_path='benchmark.xlsx')
+    employees = []
+    for dept_index in range(10):
+        department = Department.objects.create(name=f'Department {dept_index}')
+        for pod_index in range(5):
+            pod = Pod.objects.create(name=f'Pod {dept_index}-{pod_index}', department=department)
+            employees.extend(
+                Employee(
+                    employee_code=f'E{dept_index}{pod_index}{index:02d}', name=f'Employee {dept_index}{pod_index}{index:02d}',
+                    email='employee@example.com', department=department, pod=pod,
+                )
+                for index in range(20)
+            )
+    employees = Employee.objects.bulk_create(employees)
+    
+    records = []
+    for _ in range(row_count):
+        employee = rnd.choice(employees)
+        feature = rnd.choice(features)
+        records.append(ContributionRecord(
+            employee=employee, department_id=employee.department_id, pod_id=employee.pod_id,
+            product=feature.product if feature else rnd.choice(products), feature=feature,
+            contribution_month=MONTH, effort_hours=Decimal(rnd.randint(1, 16000)) / 100,
+            description=rnd.choice(['', 'Curriculum work']), source_file=source_file,
+        ))
+    ContributionRecord.objects.bulk_create(records, batch_size=5000)
+
+
+def get_contributions_by_month_orm(month: date) -> list:
+    """get_contributions_by_month before DTOs were built from values_list rows."""
+    contributions = ContributionRecord.objects.filter(
+        contribution_month=month
+    ).select_related(
+        'employee', 'department', 'pod', 'product', 'feature'
+    ).order_by('employee', 'product')
+    
+    return [
+        ContributionRecordDTO(
+            id=contrib.id,
+            employee_id=contrib.employee_id,
+            department_id=contrib.department_id,
+            pod_id=contrib.pod_id,
+            product_id=contrib.product_id,
+            feature_id=contrib.feature_id,
+            contribution_month=contrib.contribution_month,
+            effort_hours=contrib.effort_hours,
+            description=contrib.description,
+            source_file_id=contrib.source_file_id,
+            employee_code=contrib.employee.employee_code,
+            employee_name=contrib.employee.name,
+            department_name=contrib.department.name,
+            pod_name=contrib.pod.name,
+            product_name=contrib.product.name,
+            feature_name=contrib.feature.name if contrib.feature else None,
+            created_at=contrib.created_at,
+            updated_at=contrib.updated_at,
+        )
+        for contrib in contributions
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+    
+    _bootstrap.create_test_database()
+    seed(args.rows)
+    print(f'{args.rows} contribution records')
+    
+    results = []
+    for label, read in [
+        ('model instances + select_related', lambda: get_contributions_by_month_orm(MONTH)),
+        ('values_list + from_values', lambda: contribution_storage.get_contributions_by_month(MONTH)),
+    ]:
+        seconds, _ = _bootstrap.best_of(read)
+        peak, rows = _bootstrap.traced_peak(read)
+        print(f'{label:34} {seconds:6.2f} s  tracemalloc peak {_bootstrap.mib(peak)}')
+        results.append(sorted(rows, key=lambda row: row.id))
+        rows = None
+    
+    print('identical DTOs:', results[0] == results[1])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Dashboard percentages: per-item Decimal rounding vs calculate_percentages_batch.
+
+Splits random groups of hours into percentages both ways and checks that
+every batch group sums to exactly 100.00.
+
+    python scripts/benchmarks/bench_percentages.py [--groups 10000] [--max-items 20]
+"""
+import argparse
+import random
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List
+
+import _bootstrap
+
+_bootstrap.setup_django()
+
+from contributions.services import metrics_calculator_service  # noqa: E402
+
+CENTS = Decimal('0.01')
+
+
+def calculate_percentages_per_item(items: List[Dict], total_hours: Decimal) -> List[Dict]:
+    """calculate_percentages before the batch engine: half-up per item, error pushed onto the last one."""
+    if total_hours == 0:
+        return [{**item, 'percent': Decimal('0.00')} for item in items]
+    
+    result = []
+    for item in items:
+        hours = item.get('hours', Decimal('0'))
+        if hours == 0:
+            percent = Decimal('0.00')
+        else:
+            percent = (hours / total_hours) * Decimal('100')
+            percent = percent.quantize(CENTS, rounding=ROUND_HALF_UP)
+        result.append({**item, 'percent': percent})
+    
+    total_percent = sum(item['percent'] for item in result)
+    if total_percent != Decimal('100.00'):
+        diff = Decimal('100.00') - total_percent
+        if result:
+            result[-1]['percent'] += diff
+            result[-1]['percent'] = result[-1]['percent'].quantize(CENTS, rounding=ROUND_HALF_UP)
+    return result
+
+
+def make_groups(group_count: int, max_items: int, seed: int) -> List[List[Dict]]:
+    rnd = random.Random(seed)
+    return [
+        [{'id': index, 'hours': Decimal(rnd.randint(0, 20000)) / 100} for index in range(rnd.randint(1, max_items))]
+        for _ in range(group_count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--groups', type=int, default=10000)
+    parser.add_argument('--max-items', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    groups = make_groups(args.groups, args.max_items, args.seed)
+    totals = [sum((item['hours'] for item in items), Decimal('0')) for items in groups]
+    item_count = sum(map(len, groups))
+    print(f'{len(groups)} groups, {item_count} items')
+    
+    per_item_seconds, per_item = _bootstrap.best_of(
+        lambda: [calculate_percentages_per_item(items, total) for items, total in zip(groups, totals)]
+    )
+    # The batch sets 'percent' in place, so every run gets its own copy
+    copies = iter([[[dict(item) for item in items] for items in groups] for _ in range(3)])
+    batch_seconds, batch = _bootstrap.best_of(
+        lambda: metrics_calculator_service.calculate_percentages_batch(next(copies), totals)
+    )
+    print(f'per-item Decimal            {per_item_seconds:8.3f} s')
+    print(f'calculate_percentages_batch {batch_seconds:8.3f} s')
+    
+    not_full = sum(
+        1 for items, total in zip(batch, totals)
+        if total and sum(item['percent'] for item in items) != Decimal('100.00')
+    )
+    changed = sum(
+        1 for old_items, new_items in zip(per_item, batch)
+        for old, new in zip(old_items, new_items) if old['percent'] != new['percent']
+    )
+    largest_change = max(
+        (abs(old['percent'] - new['percent']) for old_items, new_items in zip(per_item, batch)
+         for old, new in zip(old_items, new_items)),
+        default=Decimal('0'),
+    )
+    print(f'groups not summing to 100.00: {not_full}')
+    print(f'items whose percent changed:  {changed} (largest change {largest_change})')
+
+
+if __name__ == '__main__':
+    main()
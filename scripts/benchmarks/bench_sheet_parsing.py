@@ -0,0 +1,73 @@
+"""
+Upload parsing: serial vs parallel sheet parsing (sheet_reader_service.map_sheets).
+
+Builds a workbook from the bundled normalized 2025-10 sample with every department
+sheet repeated --copies times and a few invalid rows, then parses it with
+parse_contribution_batches serially and with --workers processes. Both
+runs must give the same batches and errors.
+
+    python scripts/benchmarks/bench_sheet_parsing.py [--copies 100] [--workers 4]
+"""
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+import _bootstrap
+
+_bootstrap.setup_django()
+
+from django.test import override_settings  # noqa: E402
+from contributions.services import file_parser_service  # noqa: E402
+
+SAMPLE_WORKBOOK = _bootstrap.REPO_ROOT / 'updatedorganization_contributions_2025-10_all_sheets_normalized.xlsx'
+
+
+def build_workbook(path: Path, copies: int) -> int:
+    """Write the scaled sample workbook; returns its number of data rows."""
+    sheets = pd.read_excel(SAMPLE_WORKBOOK, sheet_name=None, dtype=str)
+    row_count = 0
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for sheet_name, frame in sheets.items():
+            if sheet_name.lower() == 'master':
+                continue
+            scaled = pd.concat([frame] * copies, ignore_index=True)
+            # Invalid rows make sure errors are merged in the same order too
+            scaled.loc[len(scaled) // 2, 'effort_hours'] = 'not a number'
+            scaled.loc[len(scaled) - 1, 'email'] = 'not an email'
+            scaled.to_excel(writer, sheet_name=sheet_name, index=False)
+            row_count += len(scaled)
+    return row_count
+
+
+def parse(path: Path, workers: int):
+    with override_settings(SHEET_PARSE_WORKERS=workers, SHEET_PARSE_PARALLEL_MIN_BYTES=0):
+        return file_parser_service.parse_contribution_batches(str(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--copies', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=max(2, min(os.cpu_count() or 1, 4)))
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'scaled.xlsx'
+        row_count = build_workbook(path, args.copies)
+        print(f'{row_count} rows, {path.stat().st_size / 2 ** 20:.1f} MiB, {os.cpu_count()} CPUs')
+        
+        serial_seconds, serial = _bootstrap.best_of(lambda: parse(path, 1))
+        parallel_seconds, parallel = _bootstrap.best_of(lambda: parse(path, args.workers))
+    
+    batches, errors = serial
+    print(f'serial      {serial_seconds:7.2f} s  ({sum(map(len, batches))} valid rows, {len(errors)} errors)')
+    print(f'{args.workers} workers   {parallel_seconds:7.2f} s')
+    if (os.cpu_count() or 1) < args.workers:
+        print('fewer CPUs than workers: the parallel run only measures the process pool overhead')
+    print('identical results:', serial == parallel)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Upload parsing memory: whole-file parse_contribution_batches vs streamed iter_contribution_chunks.
+
+Generates a workbook of --rows contribution rows over a few department
+sheets and parses it both ways, each in a fresh process so their peak RSS
+can be compared. Both must find the same valid rows, errors and hours.
+
+    python scripts/benchmarks/bench_streaming_upload.py [--rows 200000] [--chunk-rows 5000]
+"""
+import argparse
+import random
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+
+from openpyxl import Workbook
+
+import _bootstrap
+
+_bootstrap.setup_django()
+
+from contributions.services import file_parser_service  # noqa: E402
+
+HEADERS = file_parser_service.REQUIRED_COLUMNS + file_parser_service.OPTIONAL_COLUMNS
+DEPARTMENTS = ['Tech', 'Finance', 'Sales', 'Marketing']
+
+
+def build_workbook(path: Path, row_count: int, seed: int = 1) -> None:
+    rnd = random.Random(seed)
+    workbook = Workbook(write_only=True)
+    for sheet_index, department in enumerate(DEPARTMENTS):
+        sheet = workbook.create_sheet(department)
+        sheet.append(HEADERS)
+        sheet_rows = row_count // len(DEPARTMENTS) + (sheet_index < row_count % len(DEPARTMENTS))
+        for index in range(sheet_rows):
+            code = f'{department[:2].upper()}{index % 5000:05d}'
+            hours = rnd.randint(1, 16000) / 100
+            sheet.append([
+                code, f'Employee {code}', f'{code.lower()}@example.com', department, f'Pod {index % 7}',
+                rnd.choice(['Academy', 'Intensive', 'NIAT']), '2025-10',
+                # A few invalid hours so both paths report errors
+                'n/a' if index % 10007 == 0 else hours,
+                f'Feature {index % 13}', 'Work', 'Lead', 'sheet',
+            ])
+    workbook.save(path)
+
+
+def parse_whole(path: str):
+    batches, errors = file_parser_service.parse_contribution_batches(path)
+    return _summary(batches, errors)
+
+
+def parse_streamed(path: str, chunk_rows: int):
+    totals = (0, 0, Decimal('0'))
+    for batch, errors in file_parser_service.iter_contribution_chunks(path, chunk_rows):
+        summary = _summary([batch] if batch is not None else [], errors)
+        totals = tuple(total + value for total, value in zip(totals, summary))
+    return totals
+
+
+def _summary(batches, errors):
+    return (
+        sum(map(len, batches)),
+        len(errors),
+        sum((hours for batch in batches for hours in batch.effort_hours), Decimal('0')),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--chunk-rows', type=int, default=file_parser_service.DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'upload.xlsx'
+        build_workbook(path, args.rows)
+        print(f'{args.rows} rows, {path.stat().st_size / 2 ** 20:.1f} MiB')
+        
+        results = {}
+        for label, fn, fn_args in [
+            ('whole file', parse_whole, (str(path),)),
+            (f'streamed ({args.chunk_rows} rows per chunk)', parse_streamed, (str(path), args.chunk_rows)),
+        ]:
+            seconds, rss_growth, results[label] = _bootstrap.run_isolated(fn, *fn_args)
+            print(f'{label:34} {seconds:7.1f} s  peak RSS +{rss_growth:7.1f} MiB  '
+                  f'(valid rows, errors, hours) = {results[label]}')
+    
+    print('identical results:', len(set(results.values())) == 1)
+
+
+if __name__ == '__main__':
+    main()
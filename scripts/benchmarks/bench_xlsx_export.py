@@ -0,0 +1,127 @@
+"""
+Master list export: DataFrame.to_excel vs xlsx_export_service.
+
+Writes a generated master list (a Master sheet plus one sheet per
+department) with the previous pandas/openpyxl code and with every
+available xlsx_export_service writer, each in a fresh process so their
+peak RSS can be compared. The files are read back and compared.
+
+    python scripts/benchmarks/bench_xlsx_export.py [--rows 200000] [--departments 12]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+import _bootstrap
+
+_bootstrap.setup_django()
+
+from django.test import override_settings  # noqa: E402
+from contributions.services import xlsx_export_service  # noqa: E402
+from contributions.services.final_master_list_service import MASTER_LIST_HEADERS, _department_sheet_name  # noqa: E402
+
+MONTH = date(2025, 10, 1)
+
+
+def make_rows(row_count: int, department_count: int, seed: int = 1) -> list:
+    """Master list rows grouped by department, like build_master_list_frame gives them."""
+    rnd = random.Random(seed)
+    rows = []
+    for index in range(row_count):
+        department = f'Department {index * department_count // row_count}'
+        code = f'E{index // 3:06d}'
+        rows.append([
+            code, f'Employee {code}', f'{code.lower()}@example.com', department, f'Pod {index % 9}',
+            ['Academy', 'Intensive', 'NIAT'][index % 3], rnd.choice(['', 'Curriculum work']),
+            MONTH.strftime('%Y-%m'), rnd.randint(1, 16000) / 100,
+        ])
+    return rows
+
+
+def department_groups(rows: list) -> dict:
+    groups = {}
+    for row in rows:
+        groups.setdefault(row[3], []).append(row)
+    return groups
+
+
+def write_with_pandas(path: str, row_count: int, department_count: int):
+    """The master list writer before xlsx_export_service."""
+    rows = make_rows(row_count, department_count)
+    
+    def write():
+        with pd.ExcelWriter(path, engine='openpyxl') as writer:
+            pd.DataFrame(rows, columns=MASTER_LIST_HEADERS).to_excel(writer, sheet_name='Master', index=False)
+            for dept_name, dept_rows in department_groups(rows).items():
+                pd.DataFrame(dept_rows, columns=MASTER_LIST_HEADERS).to_excel(
+                    writer, sheet_name=_department_sheet_name(dept_name), index=False
+                )
+    
+    return _measure_write(write)
+
+
+def write_with_exporter(path: str, row_count: int, department_count: int, backend: str):
+    rows = make_rows(row_count, department_count)
+    
+    def sheets():
+        yield 'Master', MASTER_LIST_HEADERS, rows
+        for dept_name, dept_rows in department_groups(rows).items():
+            yield _department_sheet_name(dept_name), MASTER_LIST_HEADERS, dept_rows
+    
+    def write():
+        if backend == 'stream_xlsx':
+            with open(path, 'wb') as output:
+                for chunk in xlsx_export_service.stream_xlsx(sheets()):
+                    output.write(chunk)
+        else:
+            with override_settings(XLSX_EXPORT_BACKEND=backend):
+                xlsx_export_service.write_xlsx(Path(path), sheets())
+    
+    return _measure_write(write)
+
+
+def _measure_write(write):
+    """Seconds and peak RSS growth of write(), not counting the row data built before it."""
+    rss_before = _bootstrap.peak_rss()
+    start = time.perf_counter()
+    write()
+    return time.perf_counter() - start, (_bootstrap.peak_rss() - rss_before) / 2 ** 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--departments', type=int, default=12)
+    args = parser.parse_args()
+    
+    writers = [('DataFrame.to_excel', write_with_pandas, ())]
+    writers.append(('write_xlsx (openpyxl)', write_with_exporter, ('openpyxl',)))
+    if xlsx_export_service.xlsxwriter is not None:
+        writers.append(('write_xlsx (xlsxwriter)', write_with_exporter, ('xlsxwriter',)))
+    writers.append(('stream_xlsx', write_with_exporter, ('stream_xlsx',)))
+    
+    print(f'{args.rows} rows, {args.departments} department sheets')
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index, (label, fn, extra) in enumerate(writers):
+            path = str(Path(directory) / f'{index}.xlsx')
+            _, _, (seconds, rss_growth) = _bootstrap.run_isolated(fn, path, args.rows, args.departments, *extra)
+            print(f'{label:24} {seconds:7.1f} s  peak RSS +{rss_growth:7.1f} MiB')
+            paths.append(path)
+        
+        reference = pd.read_excel(paths[0], sheet_name=None)
+        for (label, _, _), path in zip(writers[1:], paths[1:]):
+            workbook = pd.read_excel(path, sheet_name=None)
+            same = list(workbook) == list(reference) and all(
+                workbook[name].equals(reference[name]) for name in reference
+            )
+            print(f'{label} matches DataFrame.to_excel: {same}')
+
+
+if __name__ == '__main__':
+    main()
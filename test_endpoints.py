@@ -47,7 +47,7 @@ def test_endpoint(method, url, headers=None, data=None, files=None, description=
         if description:
             print(f"   {description}")
         
-        if response.status_code in [200, 201]:
+        if response.status_code in [200, 201, 202]:
             print_success(f"Status: {response.status_code}")
             try:
                 result = response.json()
@@ -161,7 +161,19 @@ def main():
     
     if response and response.get("success"):
         raw_file_id = response["data"]["raw_file_id"]
-        summary = response["data"]["summary"]
+        
+        # Processing runs in the background - poll the job status
+        import time
+        status = None
+        for _ in range(120):
+            status = requests.get(f"{BASE_URL}/uploads/{raw_file_id}/status/", headers=headers).json()["data"]
+            if status["status"] in ("COMPLETED", "FAILED"):
+                break
+            time.sleep(1)
+        if status["status"] != "COMPLETED":
+            print_error(f"File processing did not complete: {status['status']} {status.get('failure_reason') or ''}")
+            return
+        summary = status["summary"]
         print_success(f"File uploaded successfully!")
         print(f"   Raw File ID: {raw_file_id}")
         print(f"   Total Rows: {summary.get('total_rows', 0)}")